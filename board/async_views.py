@@ -0,0 +1,515 @@
+import io
+from dataclasses import asdict
+
+from asgiref.sync import sync_to_async
+from dacite import from_dict
+from dacite.exceptions import MissingValueError
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions, status
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from to_do_list_api.routers import aread_from_replica, replica_reads
+
+from .bulk import JSONBodyReader, TaskBulkInserter, is_bulk_data
+from .cache import (
+    aget_board_version,
+    aget_or_build_board,
+    ainvalidate_board,
+    board_etag,
+)
+from .conditional import not_modified_response, set_board_validators
+from .exceptions import (
+    BaseException,
+    MissingValueException,
+    StatusDoesNotExistException,
+    TaskDoesNotExistException,
+    InvalidCursorException,
+    InvalidLimitException,
+    InvalidFieldsException,
+    InvalidStreamException,
+    StreamNotAcceptableException,
+    InvalidBodyException,
+    InvalidCommitModeException,
+    TitleTooLongException,
+    BatchValidationException,
+)
+from .messages import (
+    TaskInsertDataMessage,
+    TASK_INSERT_RETURN,
+    BULK_TASK_INSERT_RETURN,
+    TaskFilterParamsDataMessage,
+    TaskPaginationParamsDataMessage,
+    TaskFieldsParamsDataMessage,
+    TaskStatusUpdateItemDataMessage,
+    TASK_UPDATE_RETURN,
+    BULK_TASK_UPDATE_RETURN,
+    TASK_CANCEL_RETURN,
+    BULK_TASK_CANCEL_RETURN,
+    build_report_message,
+    build_insert_report_message,
+    TaskBulkInsertParamsDataMessage,
+)
+from .models import Task, TaskStatus
+from .pagination import KEYSET_ORDERING, apaginate_keyset, apaginate_offset
+from .search import BOARD_SEARCH_PAGE_SIZE, search_tasks
+from .serializers import serialize_task_rows, task_row_columns
+from .shards import task_database
+from .streaming import (
+    astream_board_response,
+    is_stream_acceptable,
+    is_stream_requested,
+)
+from .validators import validate_status_updates, validate_task_ids
+from .views import cleanup_user_task_filter, task_row_keyset
+
+
+async def abuild_task_board(user, task_id: str, fields: tuple = None) -> list:
+    rows = [
+        row async for row in
+        user.tasks.filter(id=task_id).values_list(*task_row_columns(fields))
+    ]
+    if not rows:
+        raise Task.DoesNotExist
+    return serialize_task_rows(rows, fields, native=True)
+
+
+async def abuild_user_board(
+    user,
+    filters: dict,
+    pagination: TaskPaginationParamsDataMessage,
+    query: str = None,
+    fields: tuple = None,
+):
+    columns = task_row_columns(fields)
+    user_tasks = user.tasks.filter(**filters).values_list(*columns)
+
+    if query:
+        page, next_cursor = await apaginate_offset(
+            search_tasks(user_tasks, query),
+            pagination.limit or BOARD_SEARCH_PAGE_SIZE,
+            pagination.cursor,
+        )
+        return {
+            "results": serialize_task_rows(page, fields, native=True),
+            "nextCursor": next_cursor,
+        }
+
+    if pagination.is_paginated:
+        page, next_cursor = await apaginate_keyset(
+            user_tasks, pagination.limit, pagination.cursor,
+            task_row_keyset(columns),
+        )
+        return {
+            "results": serialize_task_rows(page, fields, native=True),
+            "nextCursor": next_cursor,
+        }
+
+    user_tasks = user_tasks.order_by(*KEYSET_ORDERING)
+    return serialize_task_rows(
+        [row async for row in user_tasks], fields, native=True
+    )
+
+
+class AsyncBoardManager(View):
+    """ Async implementation of BoardManager for the ASGI run mode, with the \
+    same request and response contract. Authentication goes through the \
+    REST framework authentication classes and the ORM through its async API \
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def authenticate(self, request):
+        for authentication_class in (
+            api_settings.DEFAULT_AUTHENTICATION_CLASSES
+        ):
+            authenticator = authentication_class()
+            credentials = await sync_to_async(authenticator.authenticate)(
+                request
+            )
+            if credentials is not None:
+                return credentials
+        return None
+
+    def get_renderers(self) -> list:
+        # The browsable API needs the REST framework view, the async view
+        # only negotiates the data renderers
+        return [
+            renderer() for renderer in api_settings.DEFAULT_RENDERER_CLASSES
+            if renderer.media_type != 'text/html'
+        ]
+
+    def get_parsers(self) -> list:
+        return [parser() for parser in api_settings.DEFAULT_PARSER_CLASSES]
+
+    def negotiate(self, request) -> None:
+        """ Selects the renderer of the Accept header as the sync views do, \
+        falling back to the first one to answer 406 when none matches \
+        """
+
+        renderers = self.get_renderers()
+        negotiator = api_settings.DEFAULT_CONTENT_NEGOTIATION_CLASS()
+        try:
+            self.renderer, self.accepted_media_type = (
+                negotiator.select_renderer(Request(request), renderers)
+            )
+        except exceptions.NotAcceptable:
+            self.renderer = renderers[0]
+            self.accepted_media_type = renderers[0].media_type
+            raise
+
+    def render_response(self, data, status: int) -> HttpResponse:
+        return HttpResponse(
+            self.renderer.render(data, self.accepted_media_type),
+            status=status,
+            content_type=self.accepted_media_type,
+        )
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            self.negotiate(request)
+        except exceptions.NotAcceptable as e:
+            return self.render_response(
+                {"detail": str(e.detail)},
+                status=status.HTTP_406_NOT_ACCEPTABLE,
+            )
+
+        response = await self.authenticated_dispatch(request, *args, **kwargs)
+        patch_vary_headers(response, ('Accept',))
+        return response
+
+    async def authenticated_dispatch(self, request, *args, **kwargs):
+        try:
+            credentials = await self.authenticate(request)
+        except exceptions.AuthenticationFailed as e:
+            return self.unauthorized(str(e.detail))
+
+        if credentials is None:
+            return self.unauthorized(
+                str(exceptions.NotAuthenticated.default_detail)
+            )
+
+        request.user, request.auth = credentials
+        # Resolves the task database of the user in a thread, the handlers
+        # then find it in the local shard cache from the event loop
+        await sync_to_async(task_database)(request.user.id)
+        return await super().dispatch(request, *args, **kwargs)
+
+    def unauthorized(self, detail: str) -> HttpResponse:
+        response = self.render_response(
+            {"detail": detail}, status=status.HTTP_401_UNAUTHORIZED
+        )
+        authentication_class = api_settings.DEFAULT_AUTHENTICATION_CLASSES[0]
+        response['WWW-Authenticate'] = (
+            authentication_class().authenticate_header(self.request)
+        )
+        return response
+
+    def request_data(self, request, stream: bool = False):
+        if not int(request.META.get('CONTENT_LENGTH') or 0):
+            return {}
+        negotiator = api_settings.DEFAULT_CONTENT_NEGOTIATION_CLASS()
+        parser = negotiator.select_parser(request, self.get_parsers())
+        if parser is None:
+            raise exceptions.UnsupportedMediaType(request.content_type)
+        # When streamed, JSON bodies are read from the request file instead
+        # of request.body, so bulk arrays are parsed item by item
+        if stream and parser.media_type == 'application/json':
+            return JSONBodyReader(request).read()
+        return parser.parse(
+            io.BytesIO(request.body),
+            request.content_type,
+            {'request': request, 'encoding': request.encoding},
+        )
+
+    async def post(self, request, **kwargs):
+        try:
+            try:
+                request_data = self.request_data(request, stream=True)
+                if isinstance(request_data, dict):
+                    new_task = from_dict(TaskInsertDataMessage, request_data)
+                    await request.user.tasks.acreate(**new_task.to_dict())
+                    await ainvalidate_board(request.user.id)
+
+                    return self.render_response(
+                        TASK_INSERT_RETURN,
+                        status=status.HTTP_200_OK
+                    )
+
+                elif is_bulk_data(request_data):
+                    params = from_dict(
+                        TaskBulkInsertParamsDataMessage, request.GET
+                    )
+                    inserter = TaskBulkInserter(
+                        request.user, commit=params.commit
+                    )
+                    # Django does not support transactions in async code
+                    # yet, so the pipeline runs in a thread
+                    try:
+                        await sync_to_async(inserter.run)(request_data)
+                    finally:
+                        if inserter.inserted:
+                            await ainvalidate_board(request.user.id)
+
+                    if inserter.atomic:
+                        return self.render_response(
+                            BULK_TASK_INSERT_RETURN,
+                            status=status.HTTP_200_OK
+                        )
+                    return self.render_response(
+                        build_insert_report_message(
+                            BULK_TASK_INSERT_RETURN, inserter
+                        ),
+                        status=status.HTTP_200_OK
+                    )
+
+            except MissingValueError as e:
+                message = MissingValueException(str(e)).message
+                return self.render_response(
+                    message, status=status.HTTP_400_BAD_REQUEST
+                )
+            except (
+                StatusDoesNotExistException,
+                TitleTooLongException,
+                BatchValidationException,
+                InvalidBodyException,
+                InvalidCommitModeException,
+            ) as e:
+                return self.render_response(
+                    e.message, status=status.HTTP_400_BAD_REQUEST
+                )
+
+        except Exception as e:
+            return self.render_response(
+                BaseException(str(e)).message,
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @replica_reads
+    async def get(self, request, **kwargs):
+        try:
+            task_id = kwargs.get('task_id')
+            version = await aget_board_version(request.user.id)
+            await aread_from_replica(request.user.id)
+            if task_id:
+                try:
+                    data = request.GET
+                    fields = from_dict(
+                        TaskFieldsParamsDataMessage, data
+                    ).fields
+                    board_params = {'task_id': task_id, 'fields': fields}
+                    etag = board_etag(
+                        request.user.id,
+                        board_params,
+                        version,
+                        self.accepted_media_type,
+                    )
+                    not_modified = not_modified_response(request, etag)
+                    if not_modified:
+                        return not_modified
+
+                    board = await aget_or_build_board(
+                        request.user.id,
+                        board_params,
+                        lambda: abuild_task_board(
+                            request.user, task_id, fields
+                        ),
+                        version,
+                    )
+                except Task.DoesNotExist as e:
+                    message = TaskDoesNotExistException(task_id).message
+                    return self.render_response(
+                        message, status=status.HTTP_400_BAD_REQUEST
+                    )
+                except InvalidFieldsException as e:
+                    return self.render_response(
+                        e.message, status=status.HTTP_400_BAD_REQUEST
+                    )
+            else:
+                try:
+                    data = request.GET
+                    params = from_dict(TaskFilterParamsDataMessage, data)
+                    pagination = from_dict(
+                        TaskPaginationParamsDataMessage, data
+                    )
+                    filters = cleanup_user_task_filter(asdict(params))
+                    fields = from_dict(
+                        TaskFieldsParamsDataMessage, data
+                    ).fields
+                    query = data.get('q')
+                    stream = is_stream_requested(data) and not query
+                    if stream and pagination.is_paginated:
+                        raise InvalidStreamException()
+                    media_type = self.accepted_media_type
+                    if stream and not is_stream_acceptable(media_type):
+                        message = StreamNotAcceptableException(
+                            media_type
+                        ).message
+                        return self.render_response(
+                            message, status=status.HTTP_406_NOT_ACCEPTABLE
+                        )
+                    board_params = {
+                        **filters,
+                        **asdict(pagination),
+                        'q': query,
+                        'stream': stream,
+                        'fields': fields,
+                    }
+                    etag = board_etag(
+                        request.user.id,
+                        board_params,
+                        version,
+                        self.accepted_media_type,
+                    )
+                    not_modified = not_modified_response(request, etag)
+                    if not_modified:
+                        return not_modified
+
+                    if stream:
+                        return set_board_validators(
+                            astream_board_response(
+                                request.user.tasks.filter(**filters)
+                                .values_list(*task_row_columns(fields))
+                                .order_by(*KEYSET_ORDERING),
+                                fields,
+                            ),
+                            etag,
+                        )
+
+                    board = await aget_or_build_board(
+                        request.user.id,
+                        board_params,
+                        lambda: abuild_user_board(
+                            request.user, filters, pagination, query, fields
+                        ),
+                        version,
+                    )
+                except (
+                    StatusDoesNotExistException,
+                    InvalidCursorException,
+                    InvalidLimitException,
+                    InvalidFieldsException,
+                    InvalidStreamException,
+                ) as e:
+                    return self.render_response(
+                        e.message, status=status.HTTP_400_BAD_REQUEST
+                    )
+
+            return set_board_validators(
+                self.render_response(board, status=status.HTTP_200_OK), etag
+            )
+
+        except Exception as e:
+            return self.render_response(
+                BaseException(str(e)).message,
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def put(self, request, **kwargs):
+        try:
+            try:
+                request_data = self.request_data(request)
+                if isinstance(request_data, dict):
+                    task_id = kwargs.get('task_id')
+                    update_task = from_dict(
+                        TaskStatusUpdateItemDataMessage,
+                        {**request_data, 'task': task_id},
+                    )
+                    report = await request.user.tasks.abulk_update_status(
+                        [(update_task.task, update_task.status)]
+                    )
+                    if report.not_found:
+                        message = TaskDoesNotExistException(task_id).message
+                        return self.render_response(
+                            message, status=status.HTTP_400_BAD_REQUEST
+                        )
+                    await ainvalidate_board(request.user.id)
+
+                    return self.render_response(
+                        TASK_UPDATE_RETURN,
+                        status=status.HTTP_200_OK
+                    )
+
+                elif isinstance(request_data, list):
+                    update_tasks, errors = validate_status_updates(
+                        request_data
+                    )
+                    if errors:
+                        raise BatchValidationException(errors)
+
+                    report = await request.user.tasks.abulk_update_status(
+                        update_tasks
+                    )
+                    await ainvalidate_board(request.user.id)
+
+                    return self.render_response(
+                        build_report_message(BULK_TASK_UPDATE_RETURN, report),
+                        status=status.HTTP_200_OK
+                    )
+
+            except MissingValueError as e:
+                message = MissingValueException(str(e)).message
+                return self.render_response(
+                    message, status=status.HTTP_400_BAD_REQUEST
+                )
+            except (
+                StatusDoesNotExistException, BatchValidationException
+            ) as e:
+                return self.render_response(
+                    e.message, status=status.HTTP_400_BAD_REQUEST
+                )
+
+        except Exception as e:
+            return self.render_response(
+                BaseException(str(e)).message,
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def delete(self, request, **kwargs):
+        try:
+            request_data = self.request_data(request)
+            if isinstance(request_data, dict):
+                task_id = kwargs.get('task_id')
+                report = await request.user.tasks.abulk_update_status(
+                    [(task_id, TaskStatus.CANCELED)]
+                )
+                if report.not_found:
+                    message = TaskDoesNotExistException(task_id).message
+                    return self.render_response(
+                        message, status=status.HTTP_400_BAD_REQUEST
+                    )
+                await ainvalidate_board(request.user.id)
+
+                return self.render_response(
+                    TASK_CANCEL_RETURN,
+                    status=status.HTTP_200_OK
+                )
+
+            elif isinstance(request_data, list):
+                task_ids, errors = validate_task_ids(request_data)
+                if errors:
+                    return self.render_response(
+                        BatchValidationException(errors).message,
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+
+                report = await request.user.tasks.abulk_update_status(
+                    (task_id, TaskStatus.CANCELED) for task_id in task_ids
+                )
+                await ainvalidate_board(request.user.id)
+
+                return self.render_response(
+                    build_report_message(BULK_TASK_CANCEL_RETURN, report),
+                    status=status.HTTP_200_OK
+                )
+
+        except Exception as e:
+            return self.render_response(
+                BaseException(str(e)).message,
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
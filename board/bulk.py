@@ -0,0 +1,302 @@
+import codecs
+import json
+from contextlib import nullcontext
+from dataclasses import dataclass
+from itertools import islice
+from typing import IO, Any, Iterable, Iterator, List, Optional, Tuple
+
+from dataclasses_json import dataclass_json, LetterCase
+from django.conf import settings
+from django.db import transaction
+from rest_framework.request import Request
+
+from .exceptions import BatchValidationException, InvalidBodyException
+from .models import Task
+from .shards import task_database
+from .validators import (
+    BATCH_CREATE,
+    TaskItemErrorMessage,
+    validate_inserts,
+)
+
+BOARD_BULK_CHUNK_SIZE = getattr(settings, 'BOARD_BULK_CHUNK_SIZE', 1000)
+BOARD_BULK_READ_SIZE = getattr(settings, 'BOARD_BULK_READ_SIZE', 64 * 1024)
+BOARD_BULK_MAX_ERRORS = getattr(settings, 'BOARD_BULK_MAX_ERRORS', 1000)
+BOARD_BATCH_MAX_OPERATIONS = getattr(
+    settings, 'BOARD_BATCH_MAX_OPERATIONS', 1000
+)
+
+BATCH_CREATED = 'created'
+BATCH_UPDATED = 'updated'
+BATCH_UNCHANGED = 'unchanged'
+BATCH_NOT_FOUND = 'notFound'
+BATCH_STATUS_RESULTS = {
+    'updated': BATCH_UPDATED,
+    'unchanged': BATCH_UNCHANGED,
+    'not_found': BATCH_NOT_FOUND,
+}
+
+# all: the whole request is one transaction, with a savepoint per chunk
+# chunk: every chunk is committed on its own, invalid items are skipped
+BULK_COMMIT_ALL = 'all'
+BULK_COMMIT_CHUNK = 'chunk'
+BULK_COMMIT_MODES = (BULK_COMMIT_ALL, BULK_COMMIT_CHUNK)
+
+JSON_WHITESPACE = ' \t\n\r'
+# Longest token a block may cut and still fail to decode before the end of
+# the buffer: a \uXXXX escape or the false literal
+JSON_TRUNCATED_TAIL = len('\\uXXXX')
+
+
+class JSONBodyReader:
+    """ Reads a JSON body from a binary stream one block at a time. A top \
+    level array is yielded item by item, so only the current block and item \
+    are held in memory \
+    """
+
+    def __init__(self, stream: IO[bytes], read_size: int = BOARD_BULK_READ_SIZE):
+        self.stream = stream
+        self.read_size = read_size
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.json_decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        self.eof = False
+
+    def fill(self) -> None:
+        block = self.stream.read(self.read_size)
+        self.eof = not block
+        try:
+            text = self.decoder.decode(block, final=self.eof)
+        except UnicodeDecodeError as e:
+            raise InvalidBodyException(f'JSON parse error - {e}')
+        self.buffer = self.buffer[self.position:] + text
+        self.position = 0
+
+    def peek(self) -> str:
+        """ Skips the whitespace and returns the next character, or an \
+        empty string at the end of the body \
+        """
+
+        while True:
+            while (self.position < len(self.buffer)
+                   and self.buffer[self.position] in JSON_WHITESPACE):
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if self.eof:
+                return ''
+            self.fill()
+
+    def read_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.json_decoder.raw_decode(
+                    self.buffer, self.position
+                )
+                # A number may continue in the next block
+                if end < len(self.buffer) or self.eof:
+                    self.position = end
+                    return value
+            except json.JSONDecodeError as e:
+                if self.eof or not self.is_truncated(e):
+                    raise InvalidBodyException(f'JSON parse error - {e.msg}')
+            self.fill()
+
+    def is_truncated(self, error: json.JSONDecodeError) -> bool:
+        # Only a value cut at the end of the buffer may decode once the next
+        # block is read, any other error is raised without reading further
+        return (error.msg.startswith('Unterminated string')
+                or error.pos >= len(self.buffer) - JSON_TRUNCATED_TAIL)
+
+    def read_end(self) -> None:
+        if self.peek():
+            raise InvalidBodyException('JSON parse error - Extra data')
+
+    def iter_array(self) -> Iterator[Any]:
+        self.position += 1
+        if self.peek() == ']':
+            self.position += 1
+            self.read_end()
+            return
+        while True:
+            yield self.read_value()
+            separator = self.peek()
+            self.position += 1
+            if separator == ']':
+                break
+            if separator != ',':
+                raise InvalidBodyException(
+                    "JSON parse error - Expecting ',' delimiter"
+                )
+        self.read_end()
+
+    def read(self):
+        """ Returns an iterator over the items of a top level array, or \
+        the parsed value of any other body \
+        """
+
+        if self.peek() == '[':
+            return self.iter_array()
+        value = self.read_value()
+        self.read_end()
+        return value
+
+
+def read_request_data(request):
+    """ Returns the data of the request, streaming the JSON bodies not \
+    parsed by the REST framework yet through JSONBodyReader \
+    """
+
+    if (not isinstance(request, Request)
+            or request.content_type.split(';')[0].strip() != 'application/json'):
+        return request.data
+    stream = request.stream
+    if stream is None:
+        return request.data
+    return JSONBodyReader(stream).read()
+
+
+def is_bulk_data(data) -> bool:
+    return isinstance(data, (list, Iterator))
+
+
+class TaskBulkInserter:
+    """ Validates and inserts the task items of a bulk request in chunks. \
+    With the all commit mode nothing is inserted if any item is invalid, \
+    with the chunk mode the valid items of every chunk are committed and \
+    the invalid ones reported \
+    """
+
+    def __init__(
+        self,
+        user,
+        chunk_size: int = BOARD_BULK_CHUNK_SIZE,
+        commit: str = BULK_COMMIT_ALL,
+    ):
+        self.user = user
+        self.database = task_database(user.id)
+        self.chunk_size = chunk_size
+        self.atomic = commit == BULK_COMMIT_ALL
+        self.inserted = 0
+        self.failed = 0
+        self.errors: List[TaskItemErrorMessage] = []
+
+    def run(self, items: Iterable[Any]) -> None:
+        atomic = (transaction.atomic(using=self.database) if self.atomic
+                  else nullcontext())
+        with atomic:
+            self.insert_chunks(iter(items))
+            if self.atomic and self.failed:
+                raise BatchValidationException(self.errors, self.failed)
+
+    def next_chunk(
+        self, items: Iterator[Any]
+    ) -> Tuple[list, Optional[InvalidBodyException]]:
+        chunk = []
+        try:
+            for item in islice(items, self.chunk_size):
+                chunk.append(item)
+        except InvalidBodyException as e:
+            return chunk, e
+        return chunk, None
+
+    def insert_chunks(self, items: Iterator[Any]) -> None:
+        start = 0
+        while True:
+            chunk, body_error = self.next_chunk(items)
+            tasks, errors = validate_inserts(chunk, start)
+            self.add_errors(errors)
+            # Once an item failed in the all mode nothing will be committed,
+            # the remaining chunks are only validated to report their errors
+            if tasks and not (self.atomic and self.failed):
+                with transaction.atomic(using=self.database):
+                    Task.objects.using(self.database).bulk_create(
+                        [Task(user=self.user, **task) for task in tasks],
+                        batch_size=self.chunk_size,
+                    )
+                self.inserted += len(tasks)
+            start += len(chunk)
+
+            if body_error is not None:
+                if self.atomic:
+                    raise body_error
+                self.add_errors([TaskItemErrorMessage(
+                    index=start,
+                    type=body_error.name,
+                    description=body_error.message['description'],
+                )])
+                break
+            if len(chunk) < self.chunk_size:
+                break
+
+    def add_errors(self, errors: List[TaskItemErrorMessage]) -> None:
+        self.failed += len(errors)
+        self.errors.extend(errors[:BOARD_BULK_MAX_ERRORS - len(self.errors)])
+
+
+@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass
+class TaskBatchResultMessage:
+    index: int
+    op: str
+    task: str
+    result: str
+
+
+class TaskBatchRunner:
+    """ Runs the operations of a batch in a single transaction of the user \
+    task database with set based statements: one bulk insert for every \
+    creation and one bulk_update_status for every update and cancelation. \
+    The creations come first, since the other operations can not refer to \
+    tasks created in the same batch. When a batch changes a task more than \
+    once the last operation is stored, and each operation is reported over \
+    the status left by the previous ones \
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self.database = task_database(user.id)
+        self.changed = False
+
+    def run(self, operations: List[tuple]) -> List[TaskBatchResultMessage]:
+        creations = [
+            (index, values) for index, (operation, values)
+            in enumerate(operations) if operation == BATCH_CREATE
+        ]
+        changes = [
+            (index, operation, values) for index, (operation, values)
+            in enumerate(operations) if operation != BATCH_CREATE
+        ]
+
+        with transaction.atomic(using=self.database):
+            tasks = Task.objects.using(self.database).bulk_create(
+                [Task(user=self.user, **values) for _, values in creations]
+            )
+            report = self.user.tasks.bulk_update_status(
+                values for _, _, values in changes
+            )
+
+        self.changed = bool(tasks or report.updated)
+        return sorted(
+            [
+                TaskBatchResultMessage(
+                    index=index,
+                    op=BATCH_CREATE,
+                    task=str(task.id),
+                    result=BATCH_CREATED,
+                )
+                for (index, _), task in zip(creations, tasks)
+            ] + [
+                TaskBatchResultMessage(
+                    index=index,
+                    op=operation,
+                    task=task_id,
+                    result=BATCH_STATUS_RESULTS[result],
+                )
+                for (index, operation, (task_id, _)), result
+                in zip(changes, report.results)
+            ],
+            key=lambda result: result.index,
+        )
@@ -0,0 +1,371 @@
+import asyncio
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.utils.http import quote_etag
+
+from to_do_list_api.lru import LRUCache
+from to_do_list_api.routers import apin_to_primary, pin_to_primary
+
+CACHE_TTL = getattr(settings, 'CACHE_TTL', DEFAULT_TIMEOUT)
+BOARD_CACHE_LOCAL_TTL = getattr(settings, 'BOARD_CACHE_LOCAL_TTL', 60)
+BOARD_CACHE_LOCAL_SIZE = getattr(settings, 'BOARD_CACHE_LOCAL_SIZE', 1000)
+# Larger boards, like the unpaginated board of a busy user, are only kept in
+# the shared cache
+BOARD_CACHE_LOCAL_MAX_TASKS = getattr(
+    settings, 'BOARD_CACHE_LOCAL_MAX_TASKS', 1000
+)
+BOARD_VERSION_LOCAL_TTL = getattr(settings, 'BOARD_VERSION_LOCAL_TTL', 0)
+# A board stays in the shared cache BOARD_CACHE_STALE_TTL seconds after it
+# expires, served while one request rebuilds it
+BOARD_CACHE_STALE_TTL = getattr(settings, 'BOARD_CACHE_STALE_TTL', 30)
+BOARD_CACHE_EARLY_REFRESH_BETA = getattr(
+    settings, 'BOARD_CACHE_EARLY_REFRESH_BETA', 1.0
+)
+BOARD_CACHE_LOCK_TIMEOUT = getattr(settings, 'BOARD_CACHE_LOCK_TIMEOUT', 10)
+BOARD_CACHE_LOCK_WAIT = getattr(settings, 'BOARD_CACHE_LOCK_WAIT', 2)
+BOARD_CACHE_LOCK_POLL = getattr(settings, 'BOARD_CACHE_LOCK_POLL', 0.05)
+BOARD_CACHE_STATS_FLUSH = getattr(settings, 'BOARD_CACHE_STATS_FLUSH', 100)
+
+BOARD_CACHE_HIT = 'hit'
+BOARD_CACHE_MISS = 'miss'
+BOARD_CACHE_STALE = 'stale'
+BOARD_CACHE_WAIT = 'wait'
+BOARD_CACHE_EVENTS = (
+    BOARD_CACHE_HIT, BOARD_CACHE_MISS, BOARD_CACHE_STALE, BOARD_CACHE_WAIT
+)
+
+# Boards of this worker, read before the shared cache. The board keys carry
+# the board version, so a write anywhere makes the local boards unreachable
+# too and they only hold memory until evicted or expired. Only the boards of
+# at most BOARD_CACHE_LOCAL_MAX_TASKS tasks are kept, which caps the memory
+# per worker
+local_board_cache = LRUCache(BOARD_CACHE_LOCAL_SIZE, BOARD_CACHE_LOCAL_TTL)
+# Skips even the version GET on hot boards, disabled by default since a
+# write in another process is only seen once the local version expires
+local_version_cache = LRUCache(
+    BOARD_CACHE_LOCAL_SIZE, BOARD_VERSION_LOCAL_TTL
+)
+
+
+class BoardCacheEntry(NamedTuple):
+    board: Any
+    # Logical expiration, the entry outlives it by BOARD_CACHE_STALE_TTL
+    expires_at: float
+    # Seconds spent building the board, scales the early refresh
+    build_time: float
+
+
+class BoardCacheStats:
+    """ Counts the board cache outcomes per process and adds them to the \
+    shared counters every BOARD_CACHE_STATS_FLUSH events, so counting \
+    does not cost a round trip per read \
+    """
+
+    def __init__(self, flush_every: int = BOARD_CACHE_STATS_FLUSH) -> None:
+        self.flush_every = flush_every
+        self._pending = Counter()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(event: str) -> str:
+        return f'board:cache:stats:{event}'
+
+    def count(self, event: str) -> None:
+        with self._lock:
+            self._pending[event] += 1
+            should_flush = sum(self._pending.values()) >= self.flush_every
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+        for event, count in pending.items():
+            key = self.key(event)
+            try:
+                cache.incr(key, count)
+            except ValueError:
+                if not cache.add(key, count, timeout=None):
+                    cache.incr(key, count)
+
+    def snapshot(self) -> Dict[str, int]:
+        self.flush()
+        counters = cache.get_many([self.key(e) for e in BOARD_CACHE_EVENTS])
+        return {
+            event: counters.get(self.key(event), 0)
+            for event in BOARD_CACHE_EVENTS
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._pending.clear()
+        cache.delete_many([self.key(e) for e in BOARD_CACHE_EVENTS])
+
+
+board_cache_stats = BoardCacheStats()
+
+
+def board_cache_report() -> Dict[str, Any]:
+    counters = board_cache_stats.snapshot()
+    reads = sum(counters.values())
+    return {
+        **counters,
+        'hitRatio': round(counters[BOARD_CACHE_HIT] / reads, 4)
+        if reads else None,
+    }
+
+
+def board_version_key(user_id: int) -> str:
+    return f'board:{user_id}:version'
+
+
+def initial_board_version() -> int:
+    # Starts from the clock instead of 1, so a version evicted from the
+    # cache is never reissued and an old ETag can not match a newer board
+    return time.time_ns() // 1000
+
+
+def get_board_version(user_id: int) -> int:
+    key = board_version_key(user_id)
+    version = BOARD_VERSION_LOCAL_TTL and local_version_cache.get(key)
+    if version:
+        return version
+
+    version = cache.get(key)
+    if version is None:
+        initial_version = initial_board_version()
+        cache.add(key, initial_version, timeout=None)
+        version = cache.get(key, initial_version)
+    if BOARD_VERSION_LOCAL_TTL:
+        local_version_cache.set(key, version)
+    return version
+
+
+def invalidate_board(user_id: int) -> None:
+    """ Bumps the board version of the user, so every board cached before \
+    the write is no longer reachable and expires by its own TTL. The user \
+    is pinned to the primary first, so the new version is never built from \
+    a replica that has not replicated the write yet \
+    """
+
+    pin_to_primary(user_id)
+    key = board_version_key(user_id)
+    local_version_cache.delete(key)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, initial_board_version(), timeout=None)
+
+
+def board_cache_key(user_id: int, params: dict, version: int = None) -> str:
+    normalized = json.dumps(
+        {param: params[param] for param in params if params[param]},
+        sort_keys=True,
+        default=str,
+    )
+    params_hash = hashlib.md5(normalized.encode()).hexdigest()
+    if version is None:
+        version = get_board_version(user_id)
+    return f'board:{user_id}:{version}:{params_hash}'
+
+
+def board_etag(
+    user_id: int, params: dict, version: int, media_type: str = None
+) -> str:
+    """ Strong ETag of the board, it changes whenever a write bumps the \
+    board version, so it is computed without reading the tasks. The \
+    negotiated media type is part of it, since each one is another body \
+    """
+
+    key = f'{board_cache_key(user_id, params, version)}:{media_type}'
+    return quote_etag(hashlib.md5(key.encode()).hexdigest())
+
+
+def board_lock_key(key: str) -> str:
+    return f'{key}:lock'
+
+
+def board_cache_ttl() -> Optional[float]:
+    if CACHE_TTL is DEFAULT_TIMEOUT:
+        return cache.default_timeout
+    return CACHE_TTL
+
+
+def build_cache_entry(board: Any, build_time: float) -> BoardCacheEntry:
+    ttl = board_cache_ttl()
+    expires_at = math.inf if ttl is None else time.time() + ttl
+    return BoardCacheEntry(board, expires_at, build_time)
+
+
+def shared_entry_timeout() -> Optional[float]:
+    ttl = board_cache_ttl()
+    return None if ttl is None else ttl + BOARD_CACHE_STALE_TTL
+
+
+def should_refresh(entry: BoardCacheEntry) -> bool:
+    """ Tells whether this read rebuilds the cached board: always once it \
+    expired, and before that with a probability growing as the expiration \
+    gets closer, earlier for boards slower to build (XFetch) \
+    """
+
+    gap = entry.build_time * BOARD_CACHE_EARLY_REFRESH_BETA * -math.log(
+        1.0 - random.random()
+    )
+    return time.time() + gap >= entry.expires_at
+
+
+def board_size(board: Any) -> int:
+    if isinstance(board, dict):
+        return len(board.get('results', ()))
+    return len(board)
+
+
+def keep_board_locally(key: str, board: Any) -> None:
+    if board_size(board) <= BOARD_CACHE_LOCAL_MAX_TASKS:
+        local_board_cache.set(key, board)
+
+
+def get_or_build_board(
+    user_id: int,
+    params: dict,
+    build: Callable[[], Any],
+    version: int = None,
+) -> Any:
+    """ Reads the board from the local tier, then the shared cache. Only the \
+    request holding the rebuild lock builds a missing, expired or early \
+    refreshed board, the others serve the stale board while there is one \
+    or wait for the rebuilt one \
+    """
+
+    key = board_cache_key(user_id, params, version)
+    board = local_board_cache.get(key)
+    if board is not None:
+        board_cache_stats.count(BOARD_CACHE_HIT)
+        return board
+
+    entry = cache.get(key)
+    if entry is not None and not should_refresh(entry):
+        board_cache_stats.count(BOARD_CACHE_HIT)
+    elif cache.add(board_lock_key(key), True, BOARD_CACHE_LOCK_TIMEOUT):
+        board_cache_stats.count(BOARD_CACHE_MISS)
+        try:
+            entry = rebuild_board(key, build)
+        finally:
+            cache.delete(board_lock_key(key))
+    elif entry is not None:
+        board_cache_stats.count(BOARD_CACHE_STALE)
+    else:
+        board_cache_stats.count(BOARD_CACHE_WAIT)
+        entry = wait_for_board(key) or rebuild_board(key, build)
+
+    keep_board_locally(key, entry.board)
+    return entry.board
+
+
+def rebuild_board(key: str, build: Callable[[], Any]) -> BoardCacheEntry:
+    started_at = time.perf_counter()
+    board = build()
+    entry = build_cache_entry(board, time.perf_counter() - started_at)
+    cache.set(key, entry, shared_entry_timeout())
+    return entry
+
+
+def wait_for_board(key: str) -> Optional[BoardCacheEntry]:
+    # Gives up after BOARD_CACHE_LOCK_WAIT, then the waiter builds the board
+    # itself instead of failing the request
+    deadline = time.monotonic() + BOARD_CACHE_LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(BOARD_CACHE_LOCK_POLL)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry
+    return None
+
+
+async def aget_board_version(user_id: int) -> int:
+    key = board_version_key(user_id)
+    version = BOARD_VERSION_LOCAL_TTL and local_version_cache.get(key)
+    if version:
+        return version
+
+    version = await cache.aget(key)
+    if version is None:
+        initial_version = initial_board_version()
+        await cache.aadd(key, initial_version, timeout=None)
+        version = await cache.aget(key, initial_version)
+    if BOARD_VERSION_LOCAL_TTL:
+        local_version_cache.set(key, version)
+    return version
+
+
+async def ainvalidate_board(user_id: int) -> None:
+    await apin_to_primary(user_id)
+    key = board_version_key(user_id)
+    local_version_cache.delete(key)
+    try:
+        await cache.aincr(key)
+    except ValueError:
+        await cache.aadd(key, initial_board_version(), timeout=None)
+
+
+async def aget_or_build_board(
+    user_id: int,
+    params: dict,
+    build: Callable[[], Awaitable[Any]],
+    version: int = None,
+) -> Any:
+    if version is None:
+        version = await aget_board_version(user_id)
+    key = board_cache_key(user_id, params, version)
+    board = local_board_cache.get(key)
+    if board is not None:
+        board_cache_stats.count(BOARD_CACHE_HIT)
+        return board
+
+    entry = await cache.aget(key)
+    if entry is not None and not should_refresh(entry):
+        board_cache_stats.count(BOARD_CACHE_HIT)
+    elif await cache.aadd(board_lock_key(key), True, BOARD_CACHE_LOCK_TIMEOUT):
+        board_cache_stats.count(BOARD_CACHE_MISS)
+        try:
+            entry = await arebuild_board(key, build)
+        finally:
+            await cache.adelete(board_lock_key(key))
+    elif entry is not None:
+        board_cache_stats.count(BOARD_CACHE_STALE)
+    else:
+        board_cache_stats.count(BOARD_CACHE_WAIT)
+        entry = await await_for_board(key) or await arebuild_board(key, build)
+
+    keep_board_locally(key, entry.board)
+    return entry.board
+
+
+async def arebuild_board(
+    key: str, build: Callable[[], Awaitable[Any]]
+) -> BoardCacheEntry:
+    started_at = time.perf_counter()
+    board = await build()
+    entry = build_cache_entry(board, time.perf_counter() - started_at)
+    await cache.aset(key, entry, shared_entry_timeout())
+    return entry
+
+
+async def await_for_board(key: str) -> Optional[BoardCacheEntry]:
+    deadline = time.monotonic() + BOARD_CACHE_LOCK_WAIT
+    while time.monotonic() < deadline:
+        await asyncio.sleep(BOARD_CACHE_LOCK_POLL)
+        entry = await cache.aget(key)
+        if entry is not None:
+            return entry
+    return None
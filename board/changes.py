@@ -0,0 +1,61 @@
+import binascii
+from typing import Optional, Tuple
+from uuid import UUID
+
+from django.db.models import Q, QuerySet
+
+from .exceptions import InvalidChangeTokenException
+from .pagination import BOARD_MAX_PAGE_SIZE, decode_token, encode_token
+from .serializers import TASK_ROW_COLUMNS, serialize_task_rows
+
+CHANGE_ROW_COLUMNS = TASK_ROW_COLUMNS + ('change_seq',)
+CHANGE_ORDERING = ('change_seq', 'id')
+
+
+def encode_change_token(change_seq: int, task_id: Optional[UUID]) -> str:
+    return encode_token([change_seq, task_id and str(task_id)])
+
+
+def decode_change_token(token: str) -> Tuple[int, Optional[UUID]]:
+    try:
+        change_seq, task_id = decode_token(token)
+        return int(change_seq), task_id and UUID(task_id)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise InvalidChangeTokenException(token) from e
+
+
+def changes_queryset(tasks: QuerySet, since: str = None) -> QuerySet:
+    tasks = tasks.values_list(*CHANGE_ROW_COLUMNS).order_by(*CHANGE_ORDERING)
+    if not since:
+        return tasks
+
+    change_seq, task_id = decode_change_token(since)
+    after = Q(change_seq__gt=change_seq)
+    if task_id is not None:
+        after |= Q(change_seq=change_seq, id__gt=task_id)
+    return tasks.filter(after)
+
+
+def list_task_changes(
+    tasks: QuerySet, since: str = None, limit: int = BOARD_MAX_PAGE_SIZE
+) -> dict:
+    """ Returns the tasks created or modified after the ``since`` token, in \
+    every status, so canceled tasks reach the client as tombstones. Without \
+    a token every task is returned, and the next token resumes right after \
+    the last change of the page \
+    """
+
+    rows = list(changes_queryset(tasks, since)[:limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    if rows:
+        next_token = encode_change_token(rows[-1][-1], rows[-1][0])
+    else:
+        next_token = since or encode_change_token(0, None)
+
+    return {
+        "changes": serialize_task_rows([row[:-1] for row in rows]),
+        "nextToken": next_token,
+        "hasMore": has_more,
+    }
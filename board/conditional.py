@@ -0,0 +1,25 @@
+from typing import Optional
+
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+# Boards are private to the user and must be revalidated on every poll,
+# which is cheap since the ETag only depends on the board version
+BOARD_CACHE_CONTROL = {'private': True, 'no_cache': True}
+
+
+def not_modified_response(request, etag: str) -> Optional[HttpResponse]:
+    """ Returns the 304 response when the If-None-Match header of the \
+    request matches the ETag of the board, otherwise None \
+    """
+
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        set_board_validators(response, etag)
+    return response
+
+
+def set_board_validators(response: HttpResponse, etag: str) -> HttpResponse:
+    response.headers['ETag'] = etag
+    patch_cache_control(response, **BOARD_CACHE_CONTROL)
+    return response
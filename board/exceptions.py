@@ -35,3 +35,138 @@ class TaskDoesNotExistException(BaseException):
         super().__init__(
             message=message, level=logging.WARNING, exc_info=False
         )
+
+
+class InvalidCursorException(BaseException):
+    name: str = "InvalidCursorError"
+    logger: logging.Logger = logg
+
+    def __init__(self, cursor: str) -> None:
+        message = f"The cursor '{cursor}' is invalid"
+        super().__init__(
+            message=message, level=logging.WARNING, exc_info=False
+        )
+
+
+class InvalidChangeTokenException(BaseException):
+    name: str = "InvalidChangeTokenError"
+    logger: logging.Logger = logg
+
+    def __init__(self, token: str) -> None:
+        message = f"The change token '{token}' is invalid"
+        super().__init__(
+            message=message, level=logging.WARNING, exc_info=False
+        )
+
+
+class InvalidLimitException(BaseException):
+    name: str = "InvalidLimitError"
+    logger: logging.Logger = logg
+
+    def __init__(self, limit: str, max_limit: int) -> None:
+        message = (f"The limit '{limit}' is invalid, use an integer between "
+                   f"1 and {max_limit}")
+        super().__init__(
+            message=message, level=logging.WARNING, exc_info=False
+        )
+
+
+class InvalidStreamException(BaseException):
+    name: str = "InvalidStreamError"
+    logger: logging.Logger = logg
+
+    def __init__(self) -> None:
+        message = ("The stream mode returns the whole board, it does not "
+                   "accept the limit and cursor parameters")
+        super().__init__(
+            message=message, level=logging.WARNING, exc_info=False
+        )
+
+
+class StreamNotAcceptableException(BaseException):
+    name: str = "StreamNotAcceptableError"
+    logger: logging.Logger = logg
+
+    def __init__(self, media_type: str) -> None:
+        message = (f"The stream mode is only available in JSON, not in "
+                   f"'{media_type}'")
+        super().__init__(
+            message=message, level=logging.WARNING, exc_info=False
+        )
+
+
+class InvalidFieldsException(BaseException):
+    name: str = "InvalidFieldsError"
+    logger: logging.Logger = logg
+
+    def __init__(self, fields: list, valid_fields: tuple) -> None:
+        message = (f"The fields {', '.join(map(repr, fields))} are invalid, "
+                   f"use a comma separated list of {', '.join(valid_fields)}")
+        super().__init__(
+            message=message, level=logging.WARNING, exc_info=False
+        )
+
+
+class InvalidBodyException(BaseException):
+    name: str = "InvalidBodyError"
+    logger: logging.Logger = logg
+
+    def __init__(self, message: str) -> None:
+        super().__init__(
+            message=message, level=logging.WARNING, exc_info=False
+        )
+
+
+class InvalidCommitModeException(BaseException):
+    name: str = "InvalidCommitModeError"
+    logger: logging.Logger = logg
+
+    def __init__(self, commit: str, commit_modes: tuple) -> None:
+        message = (f"The commit mode '{commit}' is invalid, use one of "
+                   f"{', '.join(commit_modes)}")
+        super().__init__(
+            message=message, level=logging.WARNING, exc_info=False
+        )
+
+
+class BatchTooLargeException(BaseException):
+    name: str = "BatchTooLargeError"
+    logger: logging.Logger = logg
+
+    def __init__(self, max_operations: int) -> None:
+        message = (f"The batch must have between 1 and {max_operations} "
+                   f"operations")
+        super().__init__(
+            message=message, level=logging.WARNING, exc_info=False
+        )
+
+
+class TitleTooLongException(BaseException):
+    name: str = "TitleTooLongError"
+    logger: logging.Logger = logg
+
+    def __init__(self, max_length: int) -> None:
+        message = f"The title must have at most {max_length} characters"
+        super().__init__(
+            message=message, level=logging.WARNING, exc_info=False
+        )
+
+
+class BatchValidationException(BaseException):
+    name: str = "BatchValidationError"
+    logger: logging.Logger = logg
+
+    def __init__(self, errors: list, count: int = None) -> None:
+        # The errors may be capped, count is then the number of invalid items
+        self.errors = errors
+        count = len(errors) if count is None else count
+        message = f"{count} item(s) of the request are invalid"
+        super().__init__(
+            message=message, level=logging.WARNING, exc_info=False
+        )
+
+    def build_message(self, message) -> dict:
+        return {
+            **super().build_message(message),
+            "errors": [error.to_dict() for error in self.errors],
+        }
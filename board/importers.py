@@ -0,0 +1,118 @@
+import gzip
+import io
+import json
+import uuid
+from itertools import islice
+from typing import IO, Iterable, Iterator, List, Optional
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+from .messages import TaskImportLineErrorMessage
+from .models import Task, reserve_change_seq
+from .shards import task_database
+from .validators import InvalidTaskItem, clean_insert
+
+BOARD_IMPORT_CHUNK_SIZE = getattr(settings, 'BOARD_IMPORT_CHUNK_SIZE', 5000)
+BOARD_IMPORT_MAX_ERRORS = getattr(settings, 'BOARD_IMPORT_MAX_ERRORS', 1000)
+
+COPY_COLUMNS = (
+    'id', 'title', 'description', 'status', 'user_id', 'created_at',
+    'change_seq',
+)
+
+
+def open_import_stream(stream: IO[bytes], content_encoding: str) -> IO[bytes]:
+    if content_encoding and content_encoding.lower() == 'gzip':
+        return gzip.GzipFile(fileobj=stream, mode='rb')
+    return stream
+
+
+def copy_escape(value) -> str:
+    if value is None:
+        return '\\N'
+    return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+class TaskImporter:
+    """ Loads NDJSON task lines into the board of a user. Lines are parsed \
+    and validated one at a time, invalid lines are reported and skipped, \
+    and the valid ones are written in chunks, each in its own transaction, \
+    through COPY on PostgreSQL or bulk_create elsewhere \
+    """
+
+    def __init__(self, user, chunk_size: int = BOARD_IMPORT_CHUNK_SIZE):
+        self.user = user
+        self.database = task_database(user.id)
+        self.chunk_size = chunk_size
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[TaskImportLineErrorMessage] = []
+
+    def run(self, lines: Iterable[bytes]) -> None:
+        tasks = self.validate_lines(lines)
+        while True:
+            chunk = list(islice(tasks, self.chunk_size))
+            if not chunk:
+                break
+            with transaction.atomic(using=self.database):
+                self.load(chunk)
+            self.imported += len(chunk)
+
+    def validate_lines(
+        self, lines: Iterable[bytes]
+    ) -> Iterator[dict]:
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            task = self.validate_line(line_number, line)
+            if task is not None:
+                yield task
+
+    def validate_line(
+        self, line_number: int, line: bytes
+    ) -> Optional[dict]:
+        try:
+            return clean_insert(json.loads(line))
+        except InvalidTaskItem as e:
+            self.add_error(line_number, e.type, e.description)
+        except ValueError as e:
+            self.add_error(line_number, "InvalidLineError", str(e))
+        return None
+
+    def add_error(self, line_number: int, type: str, description: str):
+        self.failed += 1
+        if len(self.errors) < BOARD_IMPORT_MAX_ERRORS:
+            self.errors.append(TaskImportLineErrorMessage(
+                line=line_number, type=type, description=description
+            ))
+
+    def load(self, tasks: List[dict]) -> None:
+        if connections[self.database].vendor == 'postgresql':
+            self.copy(tasks)
+        else:
+            Task.objects.using(self.database).bulk_create(
+                [Task(user=self.user, **task) for task in tasks],
+                batch_size=self.chunk_size,
+            )
+
+    def copy(self, tasks: List[dict]) -> None:
+        created_at = timezone.now()
+        change_seq = reserve_change_seq(self.user.id, self.database)
+        buffer = io.StringIO()
+        for task in tasks:
+            row = (uuid.uuid4(), task['title'], task['description'],
+                   int(task['status']), self.user.id, created_at.isoformat(),
+                   change_seq)
+            buffer.write('\t'.join(copy_escape(value) for value in row))
+            buffer.write('\n')
+        buffer.seek(0)
+
+        with connections[self.database].cursor() as cursor:
+            cursor.copy_expert(
+                f'COPY {Task._meta.db_table} ({", ".join(COPY_COLUMNS)}) '
+                f'FROM STDIN',
+                buffer,
+            )
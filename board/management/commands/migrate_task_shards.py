@@ -0,0 +1,18 @@
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+from board.shards import task_shards
+
+
+class Command(BaseCommand):
+    help = 'Applies the migrations to every task database'
+
+    def handle(self, *args, **options):
+        for database in task_shards():
+            self.stdout.write(f'Migrating {database}')
+            call_command(
+                'migrate',
+                database=database,
+                interactive=False,
+                verbosity=options['verbosity'],
+            )
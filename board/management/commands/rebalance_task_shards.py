@@ -0,0 +1,74 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from board.models import UserShard
+from board.shards import (
+    TASK_SHARD_CACHE_LOCAL_TTL,
+    assign_task_database,
+    copy_user_tasks,
+    finish_user_move,
+    hash_shard,
+    task_shards,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Moves users to the task database given by the hash of their id '
+        'over the current shards, or to --to'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--users', nargs='+', type=int,
+            help='Only rebalances these user ids',
+        )
+        parser.add_argument(
+            '--to', dest='target',
+            help='Moves the users to this task database instead',
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Only lists the moves',
+        )
+
+    def handle(self, *args, **options):
+        shards = task_shards()
+        if not shards:
+            raise CommandError('The tasks are not sharded, set TASK_SHARDS')
+        target = options['target']
+        if target and target not in shards:
+            raise CommandError(f"'{target}' is not one of {', '.join(shards)}")
+
+        assignments = UserShard.objects.using(DEFAULT_DB_ALIAS).order_by('user_id')
+        if options['users']:
+            assignments = assignments.filter(user_id__in=options['users'])
+
+        moves = []
+        for user_id, source in assignments.values_list('user_id', 'database'):
+            destination = target or hash_shard(user_id, shards)
+            if destination != source:
+                moves.append((user_id, source, destination))
+                self.stdout.write(f'User {user_id}: {source} -> {destination}')
+
+        if options['dry_run'] or not moves:
+            self.stdout.write(f'{len(moves)} user(s) to move')
+            return
+
+        # Copies while the users are still served by the source, switches
+        # them, waits for the local shard caches of the other processes to
+        # expire, then copies the writes made on the source meanwhile,
+        # without overwriting the ones already made on the destination
+        copied = {
+            user_id: copy_user_tasks(user_id, source, destination)
+            for user_id, source, destination in moves
+        }
+        for user_id, source, destination in moves:
+            assign_task_database(user_id, destination)
+        time.sleep(TASK_SHARD_CACHE_LOCAL_TTL)
+        for user_id, source, destination in moves:
+            finish_user_move(user_id, source, destination, copied[user_id])
+
+        self.stdout.write(self.style.SUCCESS(f'{len(moves)} user(s) moved'))
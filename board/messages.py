@@ -1,13 +1,22 @@
 from uuid import UUID
-from typing import Optional, Union
+from typing import List, Mapping, Optional, Union
 
 from dataclasses import dataclass
 from dataclasses_json import dataclass_json, LetterCase
 from django.contrib.auth.models import User
 
-from to_do_list_api.messages import ReturnBaseMessage
-from .models import TaskStatus, Task
-from .exceptions import StatusDoesNotExistException
+from to_do_list_api.messages import ReturnBaseMessage, build_constant_message
+from .models import TaskStatus, Task, TaskStatusUpdateReport
+from .exceptions import (
+    StatusDoesNotExistException,
+    InvalidLimitException,
+    InvalidFieldsException,
+    InvalidCommitModeException,
+    TitleTooLongException,
+)
+from .pagination import BOARD_MAX_PAGE_SIZE
+from .bulk import BULK_COMMIT_ALL, BULK_COMMIT_MODES, TaskBatchResultMessage
+from .serializers import TASK_FIELDS
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
 @dataclass
@@ -17,7 +26,7 @@ class TaskInsertDataMessage:
     status: Optional[str] = TaskStatus.PENDING
     
     def __init__(self, **kwargs):
-        status = kwargs.get("status")
+        status = kwargs.get("status") or TaskStatus.PENDING
         if isinstance(status, TaskStatus):
             self.status = status
         else:
@@ -29,6 +38,10 @@ class TaskInsertDataMessage:
         self.title = kwargs.get('title')
         self.description = kwargs.get('description')
 
+        title_max_length = Task._meta.get_field('title').max_length
+        if len(self.title) > title_max_length:
+            raise TitleTooLongException(title_max_length)
+
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
 @dataclass
@@ -77,23 +90,80 @@ class TaskCancelDataReturnMessage(ReturnBaseMessage):
 @dataclass_json(letter_case=LetterCase.CAMEL)
 @dataclass
 class BulkTaskCancelDataReturnMessage(ReturnBaseMessage):
-    def __init__(self):
+    not_found: List[str]
+    unchanged: List[str]
+
+    def __init__(self, report: Optional[TaskStatusUpdateReport] = None):
         super().__init__(
             type="BulkTaskCancel",
             message="The tasks was canceled successfully",
             description="Multiple tasks cancelation in user board",
         )
+        report = report or TaskStatusUpdateReport()
+        self.not_found = report.not_found
+        self.unchanged = report.unchanged
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
 @dataclass
 class BulkTaskUpdateDataReturnMessage(ReturnBaseMessage):
-    def __init__(self):
+    not_found: List[str]
+    unchanged: List[str]
+
+    def __init__(self, report: Optional[TaskStatusUpdateReport] = None):
         super().__init__(
             type="BulkTaskUpdate",
             message="The tasks was updated successfully",
             description="Multiple tasks update in user board",
         )
+        report = report or TaskStatusUpdateReport()
+        self.not_found = report.not_found
+        self.unchanged = report.unchanged
+
+
+@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass
+class TaskImportLineErrorMessage:
+    line: int
+    type: str
+    description: str
+
+
+@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass
+class TaskImportDataReturnMessage(ReturnBaseMessage):
+    imported: int
+    failed: int
+    errors: List[TaskImportLineErrorMessage]
+
+    def __init__(
+        self,
+        imported: int,
+        failed: int,
+        errors: List[TaskImportLineErrorMessage],
+    ):
+        super().__init__(
+            type="TaskImport",
+            message="The tasks was imported in your board",
+            description="Import of tasks in user board from NDJSON lines",
+        )
+        self.imported = imported
+        self.failed = failed
+        self.errors = errors
+
+
+@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass
+class TaskBatchDataReturnMessage(ReturnBaseMessage):
+    results: List[TaskBatchResultMessage]
+
+    def __init__(self, results: List[TaskBatchResultMessage]):
+        super().__init__(
+            type="TaskBatch",
+            message="The operations was applied in your board successfully",
+            description="Batch of operations in user board",
+        )
+        self.results = results
 
 
 @dataclass
@@ -120,6 +190,67 @@ class TaskFilterParamsDataMessage:
         self.description__icontains = kwargs.get('description__icontains')
 
 
+@dataclass
+class TaskPaginationParamsDataMessage:
+    limit: Optional[Union[int, str]]
+    cursor: Optional[str]
+
+    def __init__(self, **kwargs):
+        limit = kwargs.get("limit")
+        cursor = kwargs.get("cursor")
+
+        if cursor and not limit:
+            limit = BOARD_MAX_PAGE_SIZE
+
+        if limit is not None:
+            try:
+                self.limit = int(limit)
+            except (TypeError, ValueError):
+                raise InvalidLimitException(limit, BOARD_MAX_PAGE_SIZE)
+            if not 1 <= self.limit <= BOARD_MAX_PAGE_SIZE:
+                raise InvalidLimitException(limit, BOARD_MAX_PAGE_SIZE)
+        else:
+            self.limit = None
+
+        self.cursor = cursor or None
+
+    @property
+    def is_paginated(self) -> bool:
+        return self.limit is not None
+
+
+@dataclass
+class TaskBulkInsertParamsDataMessage:
+    commit: Optional[str]
+
+    def __init__(self, **kwargs):
+        self.commit = kwargs.get("commit") or BULK_COMMIT_ALL
+        if self.commit not in BULK_COMMIT_MODES:
+            raise InvalidCommitModeException(self.commit, BULK_COMMIT_MODES)
+
+
+@dataclass
+class TaskFieldsParamsDataMessage:
+    fields: Optional[Union[tuple, str]]
+
+    def __init__(self, **kwargs):
+        fields = kwargs.get("fields")
+        if not fields:
+            self.fields = None
+            return
+
+        requested = {field.strip() for field in fields.split(',')}
+        requested.discard('')
+        invalid = sorted(requested.difference(TASK_FIELDS))
+        if invalid:
+            raise InvalidFieldsException(invalid, TASK_FIELDS)
+
+        # Keeps the order of the serializer fields
+        self.fields = tuple(
+            field for field in TASK_FIELDS if field in requested
+        ) or None
+
+
 @dataclass
 class TaskUpdateParamsDataMessage:
     user: User
@@ -140,7 +271,25 @@ class TaskUpdateParamsDataMessage:
                 raise StatusDoesNotExistException(status)
             
         if task and UUID(task):   
-            self.task = Task.objects.get(id=kwargs.get("task"), user=user)
+            self.task = user.tasks.get(id=kwargs.get("task"))
+
+
+@dataclass
+class TaskStatusUpdateItemDataMessage:
+    task: str
+    status: Optional[str] = TaskStatus.CONCLUDED
+
+    def __init__(self, **kwargs):
+        status = kwargs.get("status")
+        if isinstance(status, TaskStatus):
+            self.status = status
+        else:
+            try:
+                self.status = TaskStatus.get_status_by_name(status)
+            except KeyError as status:
+                raise StatusDoesNotExistException(status)
+
+        self.task = kwargs.get("task")
 
 
 @dataclass
@@ -153,4 +302,37 @@ class TaskCancelParamsDataMessage:
         user = kwargs.get("user")
         
         if task and UUID(task):   
-            self.task = Task.objects.get(id=kwargs.get("task"), user=user)
+            self.task = user.tasks.get(id=kwargs.get("task"))
+
+
+TASK_INSERT_RETURN = build_constant_message(TaskInsertDataReturnMessage())
+BULK_TASK_INSERT_RETURN = build_constant_message(
+    BulkTaskInsertDataReturnMessage()
+)
+TASK_UPDATE_RETURN = build_constant_message(TaskUpdateDataReturnMessage())
+BULK_TASK_UPDATE_RETURN = build_constant_message(
+    BulkTaskUpdateDataReturnMessage()
+)
+TASK_CANCEL_RETURN = build_constant_message(TaskCancelDataReturnMessage())
+BULK_TASK_CANCEL_RETURN = build_constant_message(
+    BulkTaskCancelDataReturnMessage()
+)
+
+
+def build_insert_report_message(base_message: Mapping, inserter) -> dict:
+    return {
+        **base_message,
+        "inserted": inserter.inserted,
+        "failed": inserter.failed,
+        "errors": [error.to_dict() for error in inserter.errors],
+    }
+
+
+def build_report_message(
+    base_message: Mapping, report: TaskStatusUpdateReport
+) -> dict:
+    return {
+        **base_message,
+        "notFound": report.not_found,
+        "unchanged": report.unchanged,
+    }
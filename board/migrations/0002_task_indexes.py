@@ -0,0 +1,43 @@
+# Generated by Django 4.2.8 on 2026-10-18 18:00
+
+from django.db import migrations, models
+
+# The expressions match the SQL generated by the __icontains lookups on
+# PostgreSQL, UPPER("board_task"."title"::text) LIKE UPPER(%s)
+TRIGRAM_INDEXES = {
+    'board_task_title_trgm_idx': 'title',
+    'board_task_description_trgm_idx': 'description',
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON board_task '
+            f'USING gin ((UPPER({column}::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'status', 'created_at'], name='board_task_user_status_idx'),
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
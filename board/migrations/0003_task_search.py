@@ -0,0 +1,60 @@
+from django.db import migrations
+
+from board.search import (
+    SEARCH_CONFIG,
+    create_sqlite_fts_triggers,
+    drop_sqlite_fts_triggers,
+)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        # Generated column, kept in sync by the database on every insert
+        # and update, including COPY and bulk inserts
+        schema_editor.execute(
+            "ALTER TABLE board_task ADD COLUMN search_vector tsvector "
+            "GENERATED ALWAYS AS ("
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', "
+            "coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', "
+            "coalesce(description, '')), 'B')"
+            ") STORED"
+        )
+        schema_editor.execute(
+            'CREATE INDEX board_task_search_vector_idx ON board_task '
+            'USING gin (search_vector)'
+        )
+    elif vendor == 'sqlite':
+        # FTS5 shadow table kept in sync by triggers
+        schema_editor.execute(
+            'CREATE VIRTUAL TABLE board_task_fts USING fts5('
+            'task_id UNINDEXED, title, description)'
+        )
+        schema_editor.execute(
+            'INSERT INTO board_task_fts (task_id, title, description) '
+            'SELECT id, title, description FROM board_task'
+        )
+        create_sqlite_fts_triggers(schema_editor)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(
+            'ALTER TABLE board_task DROP COLUMN IF EXISTS search_vector'
+        )
+    elif vendor == 'sqlite':
+        drop_sqlite_fts_triggers(schema_editor)
+        schema_editor.execute('DROP TABLE IF EXISTS board_task_fts')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0002_task_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.8 on 2026-10-18 18:05
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+from board.search import create_sqlite_fts_triggers
+
+
+def recreate_search_triggers(apps, schema_editor):
+    # Adding the column rebuilds board_task on SQLite, dropping its triggers
+    if schema_editor.connection.vendor == 'sqlite':
+        create_sqlite_fts_triggers(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('board', '0003_task_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskChangeSequence',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='task_change_sequence', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='change_seq',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'change_seq', 'id'], name='board_task_user_change_idx'),
+        ),
+        migrations.RunPython(
+            recreate_search_triggers, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,120 @@
+import re
+
+from django.db import migrations
+
+TABLE = 'board_task'
+# One partition per TaskStatus value, a new status needs a new partition
+STATUS_PARTITIONS = {
+    'board_task_pending': 1,
+    'board_task_concluded': 2,
+    'board_task_canceled': 3,
+}
+INDEX_DEF_REGEX = re.compile(r'^CREATE INDEX (\S+) ON (?:ONLY )?\S+ (USING .+)$')
+
+
+def table_definition(schema_editor):
+    """ Reads the columns, the non unique indexes and the foreign keys of \
+    the tasks table, to rebuild them on the new table \
+    """
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT column_name FROM information_schema.columns '
+            'WHERE table_schema = current_schema() AND table_name = %s '
+            "AND is_generated = 'NEVER' ORDER BY ordinal_position",
+            [TABLE],
+        )
+        columns = [column for column, in cursor.fetchall()]
+        cursor.execute(
+            'SELECT indexdef FROM pg_indexes '
+            'WHERE schemaname = current_schema() AND tablename = %s',
+            [TABLE],
+        )
+        indexes = [
+            INDEX_DEF_REGEX.match(indexdef).groups()
+            for indexdef, in cursor.fetchall()
+            if not indexdef.startswith('CREATE UNIQUE INDEX')
+        ]
+        cursor.execute(
+            'SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint '
+            "WHERE conrelid = %s::regclass AND contype = 'f'",
+            [TABLE],
+        )
+        foreign_keys = cursor.fetchall()
+    return columns, indexes, foreign_keys
+
+
+def rebuild_table(schema_editor, partitioned: bool):
+    """ Copies the tasks into a new table, partitioned by status or not, \
+    and builds its keys and indexes with the same names after the copy \
+    """
+
+    columns, indexes, foreign_keys = table_definition(schema_editor)
+    old_table = f'{TABLE}_old'
+    column_list = ', '.join(columns)
+
+    schema_editor.execute(f'ALTER TABLE {TABLE} RENAME TO {old_table}')
+    schema_editor.execute(
+        f'CREATE TABLE {TABLE} (LIKE {old_table} INCLUDING DEFAULTS '
+        'INCLUDING CONSTRAINTS INCLUDING GENERATED)'
+        + (' PARTITION BY LIST (status)' if partitioned else '')
+    )
+    if partitioned:
+        for partition, status in STATUS_PARTITIONS.items():
+            schema_editor.execute(
+                f'CREATE TABLE {partition} PARTITION OF {TABLE} '
+                f'FOR VALUES IN ({status})'
+            )
+    schema_editor.execute(
+        f'INSERT INTO {TABLE} ({column_list}) '
+        f'SELECT {column_list} FROM {old_table}'
+    )
+    schema_editor.execute(f'DROP TABLE {old_table}')
+
+    # The primary key of a partitioned table must hold the partition key
+    primary_key = 'id, status' if partitioned else 'id'
+    schema_editor.execute(
+        f'ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey '
+        f'PRIMARY KEY ({primary_key})'
+    )
+    for name, definition in foreign_keys:
+        schema_editor.execute(
+            f'ALTER TABLE {TABLE} ADD CONSTRAINT {name} {definition}'
+        )
+    for name, using in indexes:
+        if not partitioned:
+            schema_editor.execute(f'CREATE INDEX {name} ON {TABLE} {using}')
+            continue
+        # The partition indexes are named after the table index, as
+        # board_task_pending_user_status_idx, instead of generated names
+        schema_editor.execute(f'CREATE INDEX {name} ON ONLY {TABLE} {using}')
+        suffix = name[len(TABLE):] if name.startswith(TABLE) else f'_{name}'
+        for partition in STATUS_PARTITIONS:
+            schema_editor.execute(
+                f'CREATE INDEX {partition}{suffix} ON {partition} {using}'
+            )
+            schema_editor.execute(
+                f'ALTER INDEX {name} ATTACH PARTITION {partition}{suffix}'
+            )
+    schema_editor.execute(f'ANALYZE {TABLE}')
+
+
+def partition_by_status(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        rebuild_table(schema_editor, partitioned=True)
+
+
+def unpartition(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        rebuild_table(schema_editor, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0004_task_change_seq'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_by_status, unpartition),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 4.2.8 on 2026-10-18 18:19
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+from board.search import create_sqlite_fts_triggers
+
+
+def is_task_shard(schema_editor) -> bool:
+    return schema_editor.connection.alias in getattr(settings, 'TASK_SHARDS', [])
+
+
+class AlterFieldOnTaskShards(migrations.AlterField):
+    """ Drops the foreign key constraint only in the task databases, where \
+    the users are not stored. The default database keeps it \
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if is_task_shard(schema_editor):
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if is_task_shard(schema_editor):
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+def recreate_search_triggers(apps, schema_editor):
+    # Altering the foreign key rebuilds board_task on SQLite, dropping its
+    # triggers
+    if schema_editor.connection.vendor == 'sqlite' and is_task_shard(schema_editor):
+        create_sqlite_fts_triggers(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('board', '0005_task_status_partitions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserShard',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='task_shard', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('database', models.CharField(max_length=64)),
+            ],
+        ),
+        AlterFieldOnTaskShards(
+            model_name='task',
+            name='user',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='tasks', to=settings.AUTH_USER_MODEL),
+        ),
+        AlterFieldOnTaskShards(
+            model_name='taskchangesequence',
+            name='user',
+            field=models.OneToOneField(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='task_change_sequence', serialize=False, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(
+            recreate_search_triggers, migrations.RunPython.noop
+        ),
+    ]
@@ -1,10 +1,16 @@
 import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Iterable, List, Tuple
 
-from django.db import models
+from asgiref.sync import sync_to_async
+from django.db import models, router, transaction
 from django.utils import timezone
 from django.contrib.auth.models import User
 
 
+# On PostgreSQL board_task is list partitioned by status, a new status needs
+# its own partition (see the 0005_task_status_partitions migration)
 class TaskStatus(models.IntegerChoices):
     PENDING = 1, "The task is pending"
     CONCLUDED = 2, "The task has been completed"
@@ -15,6 +21,143 @@ class TaskStatus(models.IntegerChoices):
         return cls._member_map_[label.upper()]
 
 
+@dataclass
+class TaskStatusUpdateReport:
+    updated: List[str] = field(default_factory=list)
+    not_found: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    # Outcome of each pair in order ('updated', 'unchanged' or 'not_found'),
+    # applied over the status left by the previous pairs of the same task
+    results: List[str] = field(default_factory=list)
+
+
+class TaskChangeSequenceManager(models.Manager):
+    def reserve(self, user_id: int) -> int:
+        """ Returns the next change sequence value of the user board. The \
+        sequence row stays locked until the transaction ends, so the changes \
+        of a user are committed in sequence order and a client syncing from \
+        a value never misses a change committed later with a lower one \
+        """
+
+        sequences = self.filter(user_id=user_id)
+        if not sequences.update(value=models.F('value') + 1):
+            self.get_or_create(user_id=user_id)
+            sequences.update(value=models.F('value') + 1)
+        return sequences.values_list('value', flat=True).get()
+
+
+class TaskChangeSequence(models.Model):
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="task_change_sequence",
+        db_constraint=False,
+    )
+    value = models.BigIntegerField(default=0)
+
+    objects = TaskChangeSequenceManager()
+
+
+def reserve_change_seq(user_id: int, using: str) -> int:
+    return TaskChangeSequence.objects.db_manager(using).reserve(user_id)
+
+
+class TaskQuerySet(models.QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        """ Stamps the tasks with one change sequence value per user, \
+        reserved in the same transaction of the insert \
+        """
+
+        objs = list(objs)
+        with transaction.atomic(using=self.db, savepoint=False):
+            change_seqs = {}
+            for task in objs:
+                if task.user_id not in change_seqs:
+                    change_seqs[task.user_id] = reserve_change_seq(
+                        task.user_id, self.db
+                    )
+                task.change_seq = change_seqs[task.user_id]
+            return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update_status(
+        self, updates: Iterable[Tuple[str, TaskStatus]]
+    ) -> TaskStatusUpdateReport:
+        """ Applies the (task id, status) pairs with one query to fetch the \
+        current status of the tasks and one UPDATE per target status, only \
+        touching status, updated_at and change_seq. The last pair wins when \
+        a task id is repeated \
+        """
+
+        report = TaskStatusUpdateReport()
+        pairs = []
+        requested = {}
+        for task_id, status in updates:
+            try:
+                task_id = uuid.UUID(str(task_id))
+                requested[task_id] = status
+            except ValueError:
+                task_id = str(task_id)
+                report.not_found.append(task_id)
+            pairs.append((task_id, status))
+
+        current = {
+            task_id: (status, user_id)
+            for task_id, status, user_id in self.filter(
+                id__in=requested
+            ).values_list('id', 'status', 'user_id')
+        }
+
+        ids_by_target = defaultdict(list)
+        for task_id, status in requested.items():
+            if task_id not in current:
+                report.not_found.append(str(task_id))
+            elif current[task_id][0] == status:
+                report.unchanged.append(str(task_id))
+            else:
+                ids_by_target[current[task_id][1], status].append(task_id)
+                report.updated.append(str(task_id))
+
+        statuses = {task_id: status for task_id, (status, _) in current.items()}
+        for task_id, status in pairs:
+            if task_id not in statuses:
+                report.results.append('not_found')
+            elif statuses[task_id] == status:
+                report.results.append('unchanged')
+            else:
+                statuses[task_id] = status
+                report.results.append('updated')
+
+        updated_at = timezone.now()
+        with transaction.atomic(using=self.db, savepoint=False):
+            change_seqs = {}
+            for (user_id, status), task_ids in ids_by_target.items():
+                if user_id not in change_seqs:
+                    change_seqs[user_id] = reserve_change_seq(
+                        user_id, self.db
+                    )
+                self.filter(id__in=task_ids).exclude(status=status).update(
+                    status=status,
+                    updated_at=updated_at,
+                    change_seq=change_seqs[user_id],
+                )
+
+        return report
+
+    async def abulk_update_status(
+        self, updates: Iterable[Tuple[str, TaskStatus]]
+    ) -> TaskStatusUpdateReport:
+        # Django does not support transactions in async code yet, so the
+        # statements run in a thread inside a single transaction
+        updates = list(updates)
+
+        def atomic_bulk_update_status():
+            with transaction.atomic(using=self.db):
+                return self.bulk_update_status(updates)
+
+        return await sync_to_async(atomic_bulk_update_status)()
+
+
 class Task(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=50)
@@ -22,26 +165,70 @@ class Task(models.Model):
     status = models.SmallIntegerField(
         choices=TaskStatus.choices, default=TaskStatus.PENDING
     )
+    # Without a database constraint in the task databases, since the tasks
+    # may be sharded away from the users (see board/shards.py and the
+    # 0006_task_shards migration, the default database keeps it)
     user = models.ForeignKey(
-        User, on_delete=models.CASCADE, related_name="tasks"
+        User, on_delete=models.CASCADE, related_name="tasks",
+        db_constraint=False,
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(null=True)
+    # Value of the user change sequence at the last write of the task
+    change_seq = models.BigIntegerField(default=0)
+
+    objects = TaskQuerySet.as_manager()
 
     @property
     def task_status(self) -> TaskStatus:
         return TaskStatus(self.status)
 
+    def save(self, *args, **kwargs):
+        using = kwargs.get('using') or router.db_for_write(
+            Task, instance=self
+        )
+        with transaction.atomic(using=using, savepoint=False):
+            self.change_seq = reserve_change_seq(self.user_id, using)
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'change_seq'}
+            super().save(*args, **kwargs)
+
     def update_status(self, status: TaskStatus):
         if self.status != status:
             self.status = status
             self.updated_at = timezone.now()
-            self.save()
+            self.save(update_fields=['status', 'updated_at'])
 
     class Meta:
+        indexes = [
+            # Board listings: every query is scoped by user, filters status
+            # (PENDING by default) and walks the board by creation
+            models.Index(
+                fields=['user', 'status', 'created_at'],
+                name='board_task_user_status_idx',
+            ),
+            # Delta sync: the changes of a user walked by sequence
+            models.Index(
+                fields=['user', 'change_seq', 'id'],
+                name='board_task_user_change_idx',
+            ),
+        ]
         constraints = [
             models.CheckConstraint(
                 name="%(app_label)s_%(class)s_status_valid",
                 check=models.Q(status__in=TaskStatus.values),
             )
         ]
+
+
+class UserShard(models.Model):
+    """ Task database of the user, kept in the default database """
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="task_shard",
+    )
+    database = models.CharField(max_length=64)
@@ -0,0 +1,135 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable
+from uuid import UUID
+
+from django.conf import settings
+from django.db.models import Q, QuerySet
+
+from .exceptions import InvalidCursorException
+
+BOARD_MAX_PAGE_SIZE = getattr(settings, 'BOARD_MAX_PAGE_SIZE', 1000)
+
+# Stable key used to walk a board: created_at alone is not unique (bulk
+# inserts may share it), so the task id breaks the ties.
+KEYSET_ORDERING = ('created_at', 'id')
+
+
+def encode_token(value) -> str:
+    raw = json.dumps(value)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_token(cursor: str):
+    padding = '=' * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(cursor + padding))
+
+
+def encode_cursor(created_at: datetime, task_id: UUID) -> str:
+    return encode_token([created_at.isoformat(), str(task_id)])
+
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        created_at, task_id = decode_token(cursor)
+        return datetime.fromisoformat(created_at), UUID(task_id)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise InvalidCursorException(cursor) from e
+
+
+def encode_offset_cursor(offset: int) -> str:
+    return encode_token({'offset': offset})
+
+
+def decode_offset_cursor(cursor: str) -> int:
+    """ Cursors of rankings, whose order has no stable key to seek from """
+
+    try:
+        offset = decode_token(cursor)['offset']
+        if not isinstance(offset, int) or offset < 0:
+            raise ValueError(offset)
+        return offset
+    except (binascii.Error, KeyError, TypeError, ValueError) as e:
+        raise InvalidCursorException(cursor) from e
+
+
+def task_keyset(task) -> tuple:
+    return task.created_at, task.id
+
+
+def keyset_page_queryset(
+    queryset: QuerySet, limit: int, cursor: str = None
+) -> QuerySet:
+    queryset = queryset.order_by(*KEYSET_ORDERING)
+    if cursor:
+        created_at, task_id = decode_cursor(cursor)
+        queryset = queryset.filter(
+            Q(created_at__gt=created_at)
+            | Q(created_at=created_at, id__gt=task_id)
+        )
+    # One extra row tells whether there is a next page
+    return queryset[:limit + 1]
+
+
+def build_keyset_page(
+    rows: list, limit: int, keyset: Callable[[Any], tuple] = task_keyset
+):
+    if len(rows) <= limit:
+        return rows, None
+
+    page = rows[:limit]
+    return page, encode_cursor(*keyset(page[-1]))
+
+
+def paginate_keyset(
+    queryset: QuerySet,
+    limit: int,
+    cursor: str = None,
+    keyset: Callable[[Any], tuple] = task_keyset,
+):
+    """ Returns a page of ``limit`` tasks placed after ``cursor`` in the \
+    (created_at, id) order and the cursor of the next page, if any. The \
+    ``keyset`` callable extracts that pair from the rows of the queryset \
+    """
+
+    rows = list(keyset_page_queryset(queryset, limit, cursor))
+    return build_keyset_page(rows, limit, keyset)
+
+
+async def apaginate_keyset(
+    queryset: QuerySet,
+    limit: int,
+    cursor: str = None,
+    keyset: Callable[[Any], tuple] = task_keyset,
+):
+    rows = [row async for row in keyset_page_queryset(queryset, limit, cursor)]
+    return build_keyset_page(rows, limit, keyset)
+
+
+def offset_page_queryset(queryset: QuerySet, limit: int, cursor: str = None):
+    offset = decode_offset_cursor(cursor) if cursor else 0
+    return offset, queryset[offset:offset + limit + 1]
+
+
+def build_offset_page(rows: list, limit: int, offset: int):
+    if len(rows) <= limit:
+        return rows, None
+    return rows[:limit], encode_offset_cursor(offset + limit)
+
+
+def paginate_offset(queryset: QuerySet, limit: int, cursor: str = None):
+    """ Returns a page of ``limit`` rows placed after ``cursor`` and the \
+    cursor of the next page, if any. Used when the ordering has no unique \
+    keyset, as for the search rank \
+    """
+
+    offset, page_queryset = offset_page_queryset(queryset, limit, cursor)
+    return build_offset_page(list(page_queryset), limit, offset)
+
+
+async def apaginate_offset(queryset: QuerySet, limit: int, cursor: str = None):
+    offset, page_queryset = offset_page_queryset(queryset, limit, cursor)
+    rows = [row async for row in page_queryset]
+    return build_offset_page(rows, limit, offset)
@@ -40,9 +40,75 @@ class BoardManagerGetSchema:
             type=str,
             enum=TaskStatus._member_map_
         ),
+        OpenApiParameter(
+            name='limit',
+            description='maximum number of tasks per page, when it is set \
+                the response is paginated by cursor',
+            required=False,
+            type=int
+        ),
+        OpenApiParameter(
+            name='fields',
+            description='comma separated fields of the tasks to return, \
+                among id, title, description, status, statusLabel, createdAt \
+                and updatedAt. Only their columns are read',
+            required=False,
+            type=str
+        ),
+        OpenApiParameter(
+            name='q',
+            description='full-text search on title and description, the \
+                matching tasks are ranked by relevance and paginated by \
+                cursor, with pages of 50 tasks when no limit is set',
+            required=False,
+            type=str
+        ),
+        OpenApiParameter(
+            name='stream',
+            description='when it is 1 the whole board is streamed as a JSON \
+                array in chunks, it can not be combined with limit and cursor \
+                nor requested in MessagePack',
+            required=False,
+            type=bool
+        ),
+        OpenApiParameter(
+            name='If-None-Match',
+            description='ETag of a previous response, when the board has \
+                not changed since then the response is 304 Not Modified',
+            required=False,
+            type=str,
+            location=OpenApiParameter.HEADER
+        ),
+        OpenApiParameter(
+            name='cursor',
+            description='opaque cursor returned in the nextCursor field of \
+                the previous page',
+            required=False,
+            type=str
+        ),
     ]
 
     examples = [
+        OpenApiExample(
+            name='Get a page of pending tasks of the authenticated user',
+            description='Get the first page of pending tasks when the limit \
+                parameter is specified, use nextCursor to get the next one',
+            value={
+                "results": [
+                    {
+                        "id": "0d015c25-47bd-4200-a8dc-9cb150b321ba",
+                        "title": "Organize the books",
+                        "description": None,
+                        "status": "PENDING",
+                        "statusLabel": "The task is pending",
+                        "createdAt": "2023-12-14T08:35:14.579343Z",
+                        "updatedAt": None
+                    }
+                ],
+                "nextCursor": "WyIyMDIzLTEyLTE0VDA4OjM1OjE0LjU3OTM0MyswMDow"
+                    "MCIsICIwZDAxNWMyNS00N2JkLTQyMDAtYThkYy05Y2IxNTBiMzIxYmEiXQ"
+            }
+        ),
         OpenApiExample(
             name='Get all pending tasks of the authenticated user',
             description='Get all pending tasks from authenticated user \
@@ -100,8 +166,22 @@ class BoardManagerPostSchema:
     description = 'Create task for the authenticated user. You can use it to \
         create just one task or multiple ones, it just depends on whether you \
         use dict or array in the request body. The tasks will be created as \
-        pending if the status is not specified'
-    
+        pending if the status is not specified. Arrays are read and inserted \
+        in chunks'
+
+    parameters = [
+        OpenApiParameter(
+            name='commit',
+            description='commit mode of arrays: with all (default) no task \
+                is created if any item is invalid, with chunk every chunk is \
+                committed on its own and the invalid items are reported in \
+                the inserted, failed and errors fields of the response',
+            required=False,
+            type=str,
+            enum=['all', 'chunk']
+        ),
+    ]
+
     response_examples = [
         OpenApiExample(
             name='Bulk Insertion of tasks',
@@ -115,6 +195,28 @@ class BoardManagerPostSchema:
                 }
             ]
         ),
+        OpenApiExample(
+            name='Invalid items in bulk insertion of tasks',
+            description='Every invalid item of the array is reported with \
+                its index and no task is inserted',
+            value={
+                "type": "BatchValidationError",
+                "message": "An Error ocurred",
+                "description": "2 item(s) of the request are invalid",
+                "errors": [
+                    {
+                        "index": 1,
+                        "type": "StatusDoesNotExistError",
+                        "description": "The status 'done' is invalid"
+                    },
+                    {
+                        "index": 2,
+                        "type": "MissingValueError",
+                        "description": 'missing value for field "title"'
+                    }
+                ]
+            }
+        ),
         OpenApiExample(
             name='Insertion of tasks',
             description='Insertion of a tasks in user board',
@@ -183,7 +285,9 @@ class BoardManagerPutSchema:
                 {
                     "type": "BulkTaskUpdate",
                     "message": '''The tasks was updated successfully''',
-                    "description": "Multiple tasks update in user board"
+                    "description": "Multiple tasks update in user board",
+                    "notFound": ["c2370bd8-e526-4672-978c-040b762ecb8d"],
+                    "unchanged": []
                 }
             ]
         ),
@@ -273,7 +377,9 @@ class BoardManagerDeleteSchema:
                 {
                     "type": "BulkTaskCancel",
                     "message": 'The tasks was canceled successfully',
-                    "description": "Multiple tasks cancelation in user board"
+                    "description": "Multiple tasks cancelation in user board",
+                    "notFound": [],
+                    "unchanged": ["45214d30-a875-4127-beea-68f7256db287"]
                 }
             ]
         ),
@@ -283,4 +389,183 @@ class BoardManagerDeleteSchema:
         response={'a':'1'},
         description='',
         examples=response_examples,
-    )
\ No newline at end of file
+    )
+
+
+class BoardImportSchema:
+    description = 'Import tasks for the authenticated user from NDJSON, one \
+        task object per line, optionally compressed with gzip (send the \
+        Content-Encoding: gzip header). Invalid lines are skipped and \
+        reported with their line number, the valid ones are imported'
+
+    response_examples = [
+        OpenApiExample(
+            name='Import of tasks',
+            description='Import of tasks in user board from NDJSON lines',
+            value={
+                "type": "TaskImport",
+                "message": "The tasks was imported in your board",
+                "description": '''Import of tasks in user board from NDJSON '''
+                    '''lines''',
+                "imported": 2,
+                "failed": 1,
+                "errors": [
+                    {
+                        "line": 2,
+                        "type": "StatusDoesNotExistError",
+                        "description": "The status 'DONE' is invalid"
+                    }
+                ]
+            }
+        ),
+    ]
+
+    request = {
+        'application/x-ndjson': {
+            'type': 'string',
+            'example': '{"title": "Wash the car"}\n'
+                       '{"title": "Organize the books", "status": "done"}\n'
+                       '{"title": "Water the plants", "status": "concluded"}'
+        }
+    }
+
+    responses=OpenApiResponse(
+        response={''},
+        description='',
+        examples=response_examples,
+    )
+
+
+class BoardChangesSchema:
+    description = 'Get the tasks of the authenticated user created or \
+        modified after the since token, in every status, so canceled tasks \
+        are returned as tombstones. Without since every task is returned. \
+        Keep the nextToken of the response for the next sync and request \
+        again while hasMore is true'
+
+    parameters = [
+        OpenApiParameter(
+            name='since',
+            description='opaque token returned in the nextToken field of \
+                the previous sync',
+            required=False,
+            type=str
+        ),
+        OpenApiParameter(
+            name='limit',
+            description='maximum number of changes per response',
+            required=False,
+            type=int
+        ),
+    ]
+
+    examples = [
+        OpenApiExample(
+            name='Get the changes of the board',
+            description='Get the tasks changed since the last sync',
+            value={
+                "changes": [
+                    {
+                        "id": "0d015c25-47bd-4200-a8dc-9cb150b321ba",
+                        "title": "Organize the books",
+                        "description": None,
+                        "status": "CANCELED",
+                        "statusLabel": "The task was canceled",
+                        "createdAt": "2023-12-14T08:35:14.579343Z",
+                        "updatedAt": "2023-12-15T10:02:41.118027Z"
+                    },
+                ],
+                "nextToken": "WzQyLCAiMGQwMTVjMjUtNDdiZC00MjAwLWE4ZGMtOWNiMTUw"
+                    "YjMyMWJhIl0",
+                "hasMore": False
+            }
+        ),
+    ]
+
+
+class BoardCacheStatsSchema:
+    description = 'Get the board cache counters of every worker, for staff \
+        users: hit (served from the cache), miss (rebuilt by the request), \
+        stale (served expired while another request rebuilds it) and wait \
+        (waited for another request to rebuild it)'
+
+    examples = [
+        OpenApiExample(
+            name='Get the board cache counters',
+            value={
+                "hit": 9120,
+                "miss": 310,
+                "stale": 42,
+                "wait": 7,
+                "hitRatio": 0.9616
+            }
+        ),
+    ]
+
+
+class BoardBatchSchema:
+    description = 'Apply an ordered list of operations to the board of the \
+        authenticated user in a single transaction: create (a task object), \
+        update (task and status, CONCLUDED by default) and cancel (task). \
+        If any operation is invalid nothing is applied and every invalid \
+        operation is reported with its index. When a task is changed more \
+        than once the last operation wins'
+
+    request_examples = [
+        OpenApiExample(
+            name='Batch of operations',
+            value=[
+                {"op": "create", "title": "Wash the car"},
+                {
+                    "op": "update",
+                    "task": "0d015c25-47bd-4200-a8dc-9cb150b321ba",
+                    "status": "CONCLUDED"
+                },
+                {"op": "cancel", "task": "6f1e2f3b-5c1d-4a54-9d55-0fc1a9a4c1b2"},
+            ]
+        ),
+    ]
+
+    response_examples = [
+        OpenApiExample(
+            name='Results of the operations',
+            value={
+                "type": "TaskBatch",
+                "message": "The operations was applied in your board "
+                    "successfully",
+                "description": "Batch of operations in user board",
+                "results": [
+                    {
+                        "index": 0,
+                        "op": "create",
+                        "task": "9a7b4f0e-7d1c-4a52-8a7e-3c1d0b6e2f41",
+                        "result": "created"
+                    },
+                    {
+                        "index": 1,
+                        "op": "update",
+                        "task": "0d015c25-47bd-4200-a8dc-9cb150b321ba",
+                        "result": "updated"
+                    },
+                    {
+                        "index": 2,
+                        "op": "cancel",
+                        "task": "6f1e2f3b-5c1d-4a54-9d55-0fc1a9a4c1b2",
+                        "result": "notFound"
+                    },
+                ]
+            }
+        ),
+    ]
+
+    responses=OpenApiResponse(
+        response={''},
+        description='',
+        examples=response_examples,
+    )
+
+    request = OpenApiRequest(
+        request='',
+        encoding={},
+        examples=request_examples
+    )
@@ -0,0 +1,108 @@
+import re
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.db.models.expressions import RawSQL
+
+BOARD_SEARCH_PAGE_SIZE = getattr(settings, 'BOARD_SEARCH_PAGE_SIZE', 50)
+
+# Text search configuration of the search_vector column, "simple" does not
+# stem words, so it behaves the same for tasks written in any language
+SEARCH_CONFIG = 'simple'
+
+SEARCH_TERM_REGEX = re.compile(r'\w+', re.UNICODE)
+
+# Triggers keeping the SQLite FTS5 shadow table in sync with board_task.
+# SQLite drops them whenever a migration rebuilds the table, so those
+# migrations must create them again
+SQLITE_FTS_TRIGGERS = {
+    'board_task_fts_insert': (
+        'CREATE TRIGGER board_task_fts_insert AFTER INSERT ON board_task '
+        'BEGIN '
+        'INSERT INTO board_task_fts (task_id, title, description) '
+        'VALUES (new.id, new.title, new.description); '
+        'END'
+    ),
+    'board_task_fts_update': (
+        'CREATE TRIGGER board_task_fts_update '
+        'AFTER UPDATE OF title, description ON board_task '
+        'BEGIN '
+        'DELETE FROM board_task_fts WHERE task_id = old.id; '
+        'INSERT INTO board_task_fts (task_id, title, description) '
+        'VALUES (new.id, new.title, new.description); '
+        'END'
+    ),
+    'board_task_fts_delete': (
+        'CREATE TRIGGER board_task_fts_delete AFTER DELETE ON board_task '
+        'BEGIN '
+        'DELETE FROM board_task_fts WHERE task_id = old.id; '
+        'END'
+    ),
+}
+
+
+def create_sqlite_fts_triggers(schema_editor) -> None:
+    for name, sql in SQLITE_FTS_TRIGGERS.items():
+        schema_editor.execute(f'DROP TRIGGER IF EXISTS {name}')
+        schema_editor.execute(sql)
+
+
+def drop_sqlite_fts_triggers(schema_editor) -> None:
+    for name in SQLITE_FTS_TRIGGERS:
+        schema_editor.execute(f'DROP TRIGGER IF EXISTS {name}')
+
+
+def search_terms(query: str) -> list:
+    return SEARCH_TERM_REGEX.findall(query)
+
+
+def search_tasks(queryset: QuerySet, query: str) -> QuerySet:
+    """ Filters the tasks matching every term of the query, ranked from the \
+    most relevant, through the full-text index of the database backend \
+    """
+
+    terms = search_terms(query)
+    vendor = connections[queryset.db].vendor
+    if not terms:
+        return queryset.none()
+    if vendor == 'postgresql':
+        return search_tasks_postgresql(queryset, ' '.join(terms))
+    if vendor == 'sqlite':
+        return search_tasks_sqlite(queryset, terms)
+    return search_tasks_fallback(queryset, terms)
+
+
+def search_tasks_postgresql(queryset: QuerySet, query: str) -> QuerySet:
+    tsquery = f"plainto_tsquery('{SEARCH_CONFIG}', %s)"
+    # Ordered by the rank expression instead of an annotation, which would
+    # add a column to the rows of the values_list querysets of the board
+    search_rank = RawSQL(
+        f'ts_rank(board_task.search_vector, {tsquery})', (query,)
+    )
+    return queryset.extra(
+        where=[f'board_task.search_vector @@ {tsquery}'], params=[query]
+    ).order_by(search_rank.desc(), 'created_at', 'id')
+
+
+def search_tasks_sqlite(queryset: QuerySet, terms: list) -> QuerySet:
+    # Every term is quoted, so the user input is never parsed as FTS5 syntax
+    match = ' '.join('"{}"'.format(term) for term in terms)
+    return queryset.extra(
+        tables=['board_task_fts'],
+        where=[
+            'board_task_fts.task_id = board_task.id',
+            'board_task_fts MATCH %s',
+        ],
+        params=[match],
+        # bm25 is lower for the most relevant rows
+        select={'search_rank': '-bm25(board_task_fts)'},
+    ).order_by('-search_rank', 'created_at', 'id')
+
+
+def search_tasks_fallback(queryset: QuerySet, terms: list) -> QuerySet:
+    for term in terms:
+        queryset = queryset.filter(
+            Q(title__icontains=term) | Q(description__icontains=term)
+        )
+    return queryset.order_by('created_at', 'id')
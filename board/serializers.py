@@ -1,3 +1,4 @@
+from django.utils import timezone
 from rest_framework import serializers
 
 from .models import Task, TaskStatus
@@ -19,3 +20,134 @@ class UserTasksSerializer(serializers.ModelSerializer):
     
     def get_statusLabel(self, instance):
         return TaskStatus(instance.status).label
+
+
+# Fast read path: the board listing is built from plain column tuples instead
+# of model instances, producing the same output as UserTasksSerializer.
+TASK_ROW_COLUMNS = (
+    'id', 'title', 'description', 'status', 'created_at', 'updated_at'
+)
+STATUS_NAMES = {task_status.value: task_status.name for task_status in TaskStatus}
+STATUS_LABELS = {
+    task_status.value: task_status.label for task_status in TaskStatus
+}
+
+TASK_FIELDS = tuple(UserTasksSerializer.Meta.fields)
+# Column read by each field of UserTasksSerializer
+TASK_FIELD_COLUMNS = {
+    'id': 'id',
+    'title': 'title',
+    'description': 'description',
+    'status': 'status',
+    'statusLabel': 'status',
+    'createdAt': 'created_at',
+    'updatedAt': 'updated_at',
+}
+# Columns read whatever the fields are, the board is ordered and paginated
+# by them
+TASK_KEY_COLUMNS = ('id', 'created_at')
+
+
+def serialize_datetime(value):
+    if value is None:
+        return None
+    value = timezone.localtime(value).isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+def task_row_columns(fields: tuple = None) -> tuple:
+    """ Returns the columns to read for the fields, in TASK_ROW_COLUMNS \
+    order, so id is always the first one \
+    """
+
+    if fields is None:
+        return TASK_ROW_COLUMNS
+    columns = {TASK_FIELD_COLUMNS[field] for field in fields}
+    columns.update(TASK_KEY_COLUMNS)
+    return tuple(column for column in TASK_ROW_COLUMNS if column in columns)
+
+
+TASK_FIELD_SERIALIZERS = {
+    'id': str,
+    'status': STATUS_NAMES.__getitem__,
+    'statusLabel': STATUS_LABELS.__getitem__,
+    'createdAt': serialize_datetime,
+    'updatedAt': serialize_datetime,
+}
+# The board renderers encode the UUIDs and datetimes natively (orjson as the
+# strings above, MessagePack datetimes as Timestamps), only the status needs
+# converting
+NATIVE_TASK_FIELD_SERIALIZERS = {
+    'status': STATUS_NAMES.__getitem__,
+    'statusLabel': STATUS_LABELS.__getitem__,
+}
+
+
+def serialize_task_field_rows(
+    rows, fields: tuple, native: bool = False
+) -> list:
+    """ Serializes rows of task_row_columns(fields) with only the fields """
+
+    columns = task_row_columns(fields)
+    serializers = (
+        NATIVE_TASK_FIELD_SERIALIZERS if native else TASK_FIELD_SERIALIZERS
+    )
+    getters = [
+        (
+            field,
+            columns.index(TASK_FIELD_COLUMNS[field]),
+            serializers.get(field),
+        )
+        for field in fields
+    ]
+    return [
+        {
+            field: serialize(row[index]) if serialize else row[index]
+            for field, index, serialize in getters
+        }
+        for row in rows
+    ]
+
+
+def serialize_task_rows(
+    rows, fields: tuple = None, native: bool = False
+) -> list:
+    """ Serializes (id, title, description, status, created_at, updated_at) \
+    tuples as UserTasksSerializer would serialize the tasks. When fields \
+    are given, the rows hold the task_row_columns of them instead. With \
+    native, the ids and datetimes are left to the renderer \
+    """
+
+    if fields is not None:
+        return serialize_task_field_rows(rows, fields, native)
+
+    if native:
+        return [
+            {
+                'id': task_id,
+                'title': title,
+                'description': description,
+                'status': STATUS_NAMES[task_status],
+                'statusLabel': STATUS_LABELS[task_status],
+                'createdAt': created_at,
+                'updatedAt': updated_at,
+            }
+            for task_id, title, description, task_status, created_at,
+            updated_at in rows
+        ]
+
+    return [
+        {
+            'id': str(task_id),
+            'title': title,
+            'description': description,
+            'status': STATUS_NAMES[task_status],
+            'statusLabel': STATUS_LABELS[task_status],
+            'createdAt': serialize_datetime(created_at),
+            'updatedAt': serialize_datetime(updated_at),
+        }
+        for task_id, title, description, task_status, created_at, updated_at
+        in rows
+    ]
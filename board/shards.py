@@ -0,0 +1,238 @@
+import hashlib
+from typing import Iterator, List, NamedTuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from to_do_list_api.lru import LRUCache
+
+from .models import Task, TaskChangeSequence, UserShard, reserve_change_seq
+
+TASK_SHARD_CACHE_LOCAL_TTL = getattr(settings, 'TASK_SHARD_CACHE_LOCAL_TTL', 10)
+TASK_SHARD_CACHE_LOCAL_SIZE = getattr(
+    settings, 'TASK_SHARD_CACHE_LOCAL_SIZE', 10000
+)
+TASK_SHARD_MOVE_CHUNK_SIZE = getattr(
+    settings, 'TASK_SHARD_MOVE_CHUNK_SIZE', 1000
+)
+
+# Models stored in the task database of their user, the others stay in the
+# default database
+SHARDED_MODELS = {'board.task', 'board.taskchangesequence'}
+
+# Task database of the recent users of this worker, so resolving it does not
+# cost a cache read per query. rebalance_task_shards waits for these entries
+# to expire before deleting the tasks left on the source database
+local_shard_cache = LRUCache(
+    TASK_SHARD_CACHE_LOCAL_SIZE, TASK_SHARD_CACHE_LOCAL_TTL
+)
+
+
+def task_shards() -> List[str]:
+    return list(getattr(settings, 'TASK_SHARDS', []))
+
+
+def is_sharded(model) -> bool:
+    return model._meta.label_lower in SHARDED_MODELS
+
+
+def hash_shard(user_id: int, shards: List[str]) -> str:
+    """ Places a user without a task database by a hash of their id, \
+    stable across processes and restarts unlike the builtin hash \
+    """
+
+    digest = hashlib.md5(str(user_id).encode()).hexdigest()
+    return shards[int(digest, 16) % len(shards)]
+
+
+def shard_cache_key(user_id: int) -> str:
+    return f'board:{user_id}:shard'
+
+
+def task_database(user_id: int) -> str:
+    """ Returns the database holding the tasks of the user, assigned by \
+    hash on the first access and kept in UserShard, so adding shards only \
+    moves the users rebalanced on purpose \
+    """
+
+    shards = task_shards()
+    if not shards:
+        return DEFAULT_DB_ALIAS
+
+    key = shard_cache_key(user_id)
+    database = local_shard_cache.get(key)
+    if database is None:
+        database = cache.get(key)
+        if database is None:
+            database = UserShard.objects.using(DEFAULT_DB_ALIAS).get_or_create(
+                user_id=user_id,
+                defaults={'database': hash_shard(user_id, shards)},
+            )[0].database
+            cache.set(key, database, None)
+        local_shard_cache.set(key, database)
+    return database
+
+
+def assign_task_database(user_id: int, database: str) -> None:
+    UserShard.objects.using(DEFAULT_DB_ALIAS).update_or_create(
+        user_id=user_id, defaults={'database': database}
+    )
+    key = shard_cache_key(user_id)
+    cache.set(key, database, None)
+    local_shard_cache.delete(key)
+
+
+def chunked(tasks: Iterator[Task], size: int) -> Iterator[List[Task]]:
+    chunk = []
+    for task in tasks:
+        chunk.append(task)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class TaskCopy(NamedTuple):
+    # Source sequence value read before copying
+    source_seq: int
+    # Target sequence value stamped on the copies, the tasks written on the
+    # target after the copy have a greater one
+    change_seq: int
+
+
+def copy_user_tasks(
+    user_id: int,
+    source: str,
+    target: str,
+    since: int = 0,
+    keep_after: int = None,
+    chunk_size: int = TASK_SHARD_MOVE_CHUNK_SIZE,
+) -> TaskCopy:
+    """ Copies the tasks of the user written on the source after the change \
+    sequence value since, replacing the copies already on the target except \
+    the ones written on the target after the change sequence value \
+    keep_after. The copies are stamped with one target sequence value \
+    above the source one, so the clients syncing from a source token \
+    receive every moved task once \
+    """
+
+    source_seq = (
+        TaskChangeSequence.objects.using(source)
+        .filter(user_id=user_id)
+        .values_list('value', flat=True)
+        .first()
+    ) or 0
+    tasks = (
+        Task.objects.using(source)
+        .filter(user_id=user_id, change_seq__gt=since)
+        .order_by('change_seq', 'id')
+        .iterator(chunk_size=chunk_size)
+    )
+    fields = Task._meta.concrete_fields
+    batch_size = connections[target].ops.bulk_batch_size(
+        fields, [None] * chunk_size
+    )
+
+    with transaction.atomic(using=target):
+        sequence, _ = TaskChangeSequence.objects.using(
+            target
+        ).get_or_create(user_id=user_id)
+        if sequence.value < source_seq:
+            TaskChangeSequence.objects.using(target).filter(
+                user_id=user_id
+            ).update(value=source_seq)
+        change_seq = reserve_change_seq(user_id, target)
+
+        for chunk in chunked(tasks, min(chunk_size, batch_size)):
+            target_tasks = Task.objects.using(target).filter(
+                id__in=[task.id for task in chunk]
+            )
+            if keep_after is not None:
+                newer = set(
+                    target_tasks.filter(
+                        change_seq__gt=keep_after
+                    ).values_list('id', flat=True)
+                )
+                chunk = [task for task in chunk if task.id not in newer]
+                target_tasks = target_tasks.exclude(id__in=newer)
+            if not chunk:
+                continue
+            for task in chunk:
+                task.change_seq = change_seq
+            target_tasks.delete()
+            # raw inserts keep created_at instead of stamping it again
+            Task._base_manager.using(target)._insert(
+                chunk, fields=fields, using=target, raw=True
+            )
+
+    return TaskCopy(source_seq, change_seq)
+
+
+def finish_user_move(
+    user_id: int, source: str, target: str, copy: TaskCopy
+) -> None:
+    """ Copies the writes made on the source since the first copy, keeping \
+    the ones already made on the target, and deletes the source tasks. The \
+    source sequence row stays locked meanwhile, so a late write on the \
+    source waits for the move instead of being lost between both steps \
+    """
+
+    with transaction.atomic(using=source):
+        TaskChangeSequence.objects.using(source).select_for_update().filter(
+            user_id=user_id
+        ).first()
+        copy_user_tasks(
+            user_id,
+            source,
+            target,
+            since=copy.source_seq,
+            keep_after=copy.change_seq,
+        )
+        delete_user_tasks(user_id, source)
+
+
+def delete_user_tasks(user_id: int, database: str) -> None:
+    with transaction.atomic(using=database):
+        Task.objects.using(database).filter(user_id=user_id).delete()
+        TaskChangeSequence.objects.using(database).filter(
+            user_id=user_id
+        ).delete()
+
+
+class TaskShardRouter:
+    """ Sends the reads and writes of the tasks to the task database of \
+    their user, resolved from the instance hint: the user of a related \
+    manager (user.tasks) or the user of a task. Without sharding, or \
+    without a hint, the decision is left to the next router \
+    """
+
+    def database_for(self, model, hints):
+        if not is_sharded(model) or not task_shards():
+            return None
+        instance = hints.get('instance')
+        if instance is None:
+            return None
+        user_id = instance.pk if not is_sharded(type(instance)) else (
+            instance.user_id
+        )
+        return task_database(user_id)
+
+    def db_for_read(self, model, **hints):
+        return self.database_for(model, hints)
+
+    def db_for_write(self, model, **hints):
+        return self.database_for(model, hints)
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Tasks reference their user across databases, the foreign keys
+        # of the sharded models have no constraint in the task databases
+        if is_sharded(type(obj1)) or is_sharded(type(obj2)):
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in task_shards() and model_name == 'usershard':
+            return False
+        return None
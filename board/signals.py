@@ -0,0 +1,12 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from .shards import delete_user_tasks, task_database, task_shards
+
+
+@receiver(pre_delete, sender=User)
+def delete_sharded_tasks(sender, instance: User, **kwargs):
+    # The deletion cascade only reaches the tasks in the default database
+    if task_shards():
+        delete_user_tasks(instance.pk, task_database(instance.pk))
@@ -0,0 +1,95 @@
+from itertools import islice
+from typing import AsyncIterator, Iterator, List
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+
+from to_do_list_api.renderers import ORJSONRenderer
+
+from .serializers import serialize_task_rows
+
+BOARD_STREAM_CHUNK_SIZE = getattr(settings, 'BOARD_STREAM_CHUNK_SIZE', 2000)
+
+STREAM_TRUE_VALUES = ('1', 'true', 'yes')
+# The stream is a JSON array written chunk by chunk, MessagePack needs the
+# length of an array before its items
+BOARD_STREAM_MEDIA_TYPE = ORJSONRenderer.media_type
+
+
+def is_stream_requested(params) -> bool:
+    return str(params.get('stream', '')).lower() in STREAM_TRUE_VALUES
+
+
+def is_stream_acceptable(media_type: str) -> bool:
+    return media_type in (None, BOARD_STREAM_MEDIA_TYPE)
+
+
+def serialize_chunk(chunk: List[tuple], fields: tuple = None) -> bytes:
+    """ Serializes the rows as the items of a JSON array, without brackets """
+
+    serialized = ORJSONRenderer().render(
+        serialize_task_rows(chunk, fields, native=True)
+    )
+    return serialized[1:-1]
+
+
+def stream_task_rows(
+    rows: QuerySet,
+    chunk_size: int = BOARD_STREAM_CHUNK_SIZE,
+    fields: tuple = None,
+) -> Iterator[bytes]:
+    """ Yields the JSON array of the task rows one chunk at a time, reading \
+    them through a server-side cursor where the database supports it \
+    """
+
+    iterator = rows.iterator(chunk_size=chunk_size)
+    separator = b''
+    yield b'['
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            break
+        yield separator + serialize_chunk(chunk, fields)
+        separator = b','
+    yield b']'
+
+
+async def astream_task_rows(
+    rows: QuerySet,
+    chunk_size: int = BOARD_STREAM_CHUNK_SIZE,
+    fields: tuple = None,
+) -> AsyncIterator[bytes]:
+    # The chunks are fetched in a thread, one hop per chunk instead of per
+    # row as QuerySet.aiterator would, which also fails for values_list
+    # querysets on Django 4.2
+    iterator = rows.iterator(chunk_size=chunk_size)
+    next_chunk = sync_to_async(lambda: list(islice(iterator, chunk_size)))
+    separator = b''
+    yield b'['
+    while True:
+        chunk = await next_chunk()
+        if not chunk:
+            break
+        yield separator + serialize_chunk(chunk, fields)
+        separator = b','
+    yield b']'
+
+
+def stream_board_response(
+    rows: QuerySet, fields: tuple = None
+) -> StreamingHttpResponse:
+    return StreamingHttpResponse(
+        stream_task_rows(rows, fields=fields),
+        content_type=BOARD_STREAM_MEDIA_TYPE,
+    )
+
+
+def astream_board_response(
+    rows: QuerySet, fields: tuple = None
+) -> StreamingHttpResponse:
+    return StreamingHttpResponse(
+        astream_task_rows(rows, fields=fields),
+        content_type=BOARD_STREAM_MEDIA_TYPE,
+    )
@@ -0,0 +1,275 @@
+import json
+
+import msgpack
+
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.urls import path, re_path
+from rest_framework.authtoken.models import Token
+
+from board.async_views import AsyncBoardManager
+from board.cache import invalidate_board
+from board.models import Task, TaskStatus
+from to_do_list_api.constants import UUID_REGEX
+
+urlpatterns = [
+    path("api/board", AsyncBoardManager.as_view()),
+    re_path(
+        rf"^api/board/(?P<task_id>{UUID_REGEX})", AsyncBoardManager.as_view()
+    ),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncBoardManagerViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='async_user')
+        cls.token = Token.objects.create(user=cls.user)
+        cls.task = Task.objects.create(
+            user=cls.user, title='Servir o quadro via ASGI'
+        )
+
+    def setUp(self):
+        invalidate_board(self.user.id)
+        self.headers = {'Authorization': f'Bearer {self.token.key}'}
+
+    async def test_get(self):
+        """ When request the pending tasks to the async view \
+        Then returns the same task representation of the sync view \
+        """
+
+        expected_status_code = 200
+        expected_task_keys = [
+            'id', 'title', 'description', 'status', 'statusLabel',
+            'createdAt', 'updatedAt'
+        ]
+
+        response = await self.async_client.get(
+            '/api/board', headers=self.headers
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        res_data = response.json()
+        self.assertEqual(1, len(res_data))
+        self.assertEqual(expected_task_keys, list(res_data[0].keys()))
+        self.assertEqual(str(self.task.id), res_data[0].get('id'))
+        self.assertEqual(TaskStatus.PENDING.name, res_data[0].get('status'))
+
+    async def test_get_unauthenticated(self):
+        """ When request the async view without credentials \
+        Then returns unauthorized \
+        """
+
+        expected_status_code = 401
+
+        response = await self.async_client.get('/api/board')
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual('Bearer', response.headers.get('WWW-Authenticate'))
+
+    async def test_post_and_put(self):
+        """ When create tasks and update one of them through the async view \
+        Then the writes are applied and the board reflects them \
+        """
+
+        expected_status_code = 200
+
+        response = await self.async_client.post(
+            '/api/board',
+            [{"title": "Tarefa assíncrona 1"}, {"title": "Tarefa assíncrona 2"}],
+            content_type='application/json',
+            headers=self.headers,
+        )
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual('BulkTaskInsert', response.json().get('type'))
+
+        response = await self.async_client.put(
+            f'/api/board/{self.task.id}',
+            {"status": "concluded"},
+            content_type='application/json',
+            headers=self.headers,
+        )
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual('TaskUpdate', response.json().get('type'))
+
+        updated_task = await Task.objects.aget(id=self.task.id)
+        self.assertEqual(TaskStatus.CONCLUDED, updated_task.status)
+
+        response = await self.async_client.get(
+            '/api/board', headers=self.headers
+        )
+        self.assertEqual(2, len(response.json()))
+
+    async def test_delete_bulk_tasks(self):
+        """ When cancel multiple tasks through the async view \
+        Then cancels the owned tasks and reports the missing ones \
+        """
+
+        expected_status_code = 200
+        missing_task_id = 'c2370bd8-e526-4672-978c-040b762ecb8d'
+
+        response = await self.async_client.delete(
+            '/api/board',
+            [str(self.task.id), missing_task_id],
+            content_type='application/json',
+            headers=self.headers,
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual('BulkTaskCancel', response.json().get('type'))
+        self.assertEqual([missing_task_id], response.json().get('notFound'))
+
+        canceled_task = await Task.objects.aget(id=self.task.id)
+        self.assertEqual(TaskStatus.CANCELED, canceled_task.status)
+
+    async def test_get_streamed(self):
+        """ When request the board in stream mode to the async view \
+        Then returns the tasks through an async streaming response \
+        """
+
+        expected_status_code = 200
+
+        response = await self.async_client.get(
+            '/api/board', {'stream': '1'}, headers=self.headers
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        content = b''.join(
+            [chunk async for chunk in response.streaming_content]
+        )
+        res_data = json.loads(content)
+        self.assertEqual(1, len(res_data))
+        self.assertEqual(str(self.task.id), res_data[0].get('id'))
+
+    async def test_get_streamed_with_pagination(self):
+        """ When request the board in stream mode with a limit to the async \
+        view \
+        Then returns InvalidStreamError \
+        """
+
+        expected_status_code = 400
+
+        response = await self.async_client.get(
+            '/api/board', {'stream': '1', 'limit': '1'}, headers=self.headers
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual('InvalidStreamError', response.json().get('type'))
+
+    async def test_get_streamed_msgpack(self):
+        """ When request the board in stream mode in MessagePack to the \
+        async view \
+        Then returns not acceptable \
+        """
+
+        expected_status_code = 406
+
+        response = await self.async_client.get(
+            '/api/board',
+            {'stream': '1'},
+            headers={**self.headers, 'Accept': 'application/msgpack'},
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(
+            'StreamNotAcceptableError',
+            msgpack.unpackb(response.content)['type'],
+        )
+
+    async def test_get_not_modified(self):
+        """ When request the async view with the previous ETag \
+        Then returns not modified \
+        """
+
+        expected_status_code = 304
+
+        response = await self.async_client.get(
+            '/api/board', headers=self.headers
+        )
+        etag = response.headers.get('ETag')
+        response = await self.async_client.get(
+            '/api/board', headers={**self.headers, 'If-None-Match': etag}
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(etag, response.headers.get('ETag'))
+
+    async def test_post_bulk_chunk_commit(self):
+        """ When post a list with an invalid item in the chunk commit mode \
+        Then the async view inserts the valid tasks and reports the invalid \
+        """
+
+        expected_status_code = 200
+
+        response = await self.async_client.post(
+            '/api/board?commit=chunk',
+            json.dumps([
+                {"title": "Inserir em blocos"},
+                {"description": "Sem título"},
+            ]),
+            content_type='application/json',
+            headers=self.headers,
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        res_data = response.json()
+        self.assertEqual(1, res_data.get('inserted'))
+        self.assertEqual(1, res_data['errors'][0]['index'])
+        self.assertEqual(2, await Task.objects.filter(user=self.user).acount())
+
+    async def test_post_put_and_get_msgpack(self):
+        """ When create and update tasks and get the board in MessagePack \
+        through the async view \
+        Then the bodies are negotiated as in the sync view \
+        """
+
+        expected_status_code = 200
+        msgpack_headers = {**self.headers, 'Accept': 'application/msgpack'}
+
+        response = await self.async_client.post(
+            '/api/board',
+            msgpack.packb([{"title": "Enviar em MessagePack"}]),
+            content_type='application/msgpack',
+            headers=msgpack_headers,
+        )
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual('application/msgpack', response['Content-Type'])
+        self.assertEqual(
+            'BulkTaskInsert', msgpack.unpackb(response.content).get('type')
+        )
+
+        response = await self.async_client.put(
+            f'/api/board/{self.task.id}',
+            msgpack.packb({"status": "concluded"}),
+            content_type='application/msgpack',
+            headers=msgpack_headers,
+        )
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(
+            'TaskUpdate', msgpack.unpackb(response.content).get('type')
+        )
+
+        response = await self.async_client.get(
+            '/api/board', headers=msgpack_headers
+        )
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual('application/msgpack', response['Content-Type'])
+        self.assertIn('Accept', response['Vary'])
+        self.assertEqual(
+            ['Enviar em MessagePack'],
+            [task['title'] for task in msgpack.unpackb(response.content)],
+        )
+
+    async def test_get_not_acceptable(self):
+        """ When request the async view in a media type it can not render \
+        Then returns not acceptable \
+        """
+
+        expected_status_code = 406
+
+        response = await self.async_client.get(
+            '/api/board', headers={**self.headers, 'Accept': 'text/csv'}
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
@@ -0,0 +1,170 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.http import HttpRequest
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from board.models import Task, TaskStatus
+from board.views import BoardBatchManager
+
+
+class BoardBatchViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.view = BoardBatchManager()
+        cls.user = User.objects.create(username='batch_user')
+        cls.another_user = User.objects.create(username='batch_another')
+        cls.task = Task.objects.create(user=cls.user, title='Regar as plantas')
+        cls.another_task = Task.objects.create(
+            user=cls.user, title='Lavar a louça'
+        )
+        cls.foreign_task = Task.objects.create(
+            user=cls.another_user, title='Outro quadro'
+        )
+
+    def setUp(self):
+        self.request = HttpRequest()
+        self.request.user = self.user
+
+    def post(self, operations):
+        self.request.data = operations
+        return self.view.post(self.request)
+
+    def test_post_batch(self):
+        """ When request a batch of creations, updates and cancelations \
+        Then applies all of them and returns the result of each operation \
+        """
+
+        response = self.post([
+            {"op": "create", "title": "Organizar os livros"},
+            {"op": "update", "task": str(self.task.id)},
+            {"op": "cancel", "task": str(self.another_task.id)},
+            {"op": "cancel", "task": str(self.foreign_task.id)},
+            {"op": "create", "title": "Pagar a conta", "status": "concluded"},
+        ])
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('TaskBatch', response.data['type'])
+        results = response.data['results']
+        self.assertEqual(
+            [
+                (0, 'create', 'created'),
+                (1, 'update', 'updated'),
+                (2, 'cancel', 'updated'),
+                (3, 'cancel', 'notFound'),
+                (4, 'create', 'created'),
+            ],
+            [(r['index'], r['op'], r['result']) for r in results],
+        )
+        self.assertEqual(
+            'Organizar os livros', Task.objects.get(id=results[0]['task']).title
+        )
+        self.assertEqual(
+            TaskStatus.CONCLUDED, Task.objects.get(id=results[4]['task']).status
+        )
+        self.task.refresh_from_db()
+        self.another_task.refresh_from_db()
+        self.foreign_task.refresh_from_db()
+        self.assertEqual(TaskStatus.CONCLUDED, self.task.status)
+        self.assertEqual(TaskStatus.CANCELED, self.another_task.status)
+        self.assertEqual(TaskStatus.PENDING, self.foreign_task.status)
+
+    def test_post_batch_last_operation_wins(self):
+        """ When a batch changes the same task more than once \
+        Then the task ends with the status of the last operation \
+        """
+
+        response = self.post([
+            {"op": "update", "task": str(self.task.id)},
+            {"op": "cancel", "task": str(self.task.id)},
+        ])
+
+        self.assertEqual(200, response.status_code)
+        self.task.refresh_from_db()
+        self.assertEqual(TaskStatus.CANCELED, self.task.status)
+
+    def test_post_batch_result_per_operation(self):
+        """ When a batch changes a task and then changes it back \
+        Then each operation is reported over the status left by the \
+        previous ones \
+        """
+
+        response = self.post([
+            {"op": "update", "task": str(self.task.id)},
+            {"op": "update", "task": str(self.task.id), "status": "pending"},
+            {"op": "update", "task": str(self.task.id), "status": "pending"},
+        ])
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            [(0, 'updated'), (1, 'updated'), (2, 'unchanged')],
+            [(r['index'], r['result']) for r in response.data['results']],
+        )
+        self.task.refresh_from_db()
+        self.assertEqual(TaskStatus.PENDING, self.task.status)
+
+    def test_post_batch_set_based(self):
+        """ When the batch grows \
+        Then the number of statements stays the same \
+        """
+
+        def count_queries(size, op):
+            with CaptureQueriesContext(connection) as queries:
+                self.post(
+                    [{"op": "create", "title": f"Tarefa {i}"}
+                     for i in range(size)]
+                    + [{"op": op, "task": str(self.task.id)}] * size
+                )
+            return len(queries)
+
+        self.assertEqual(
+            count_queries(2, 'update'), count_queries(20, 'cancel')
+        )
+
+    def test_post_batch_invalid_operations(self):
+        """ When some operations of the batch are invalid \
+        Then nothing is applied and every invalid operation is reported \
+        """
+
+        response = self.post([
+            {"op": "create", "title": "Organizar os livros"},
+            {"op": "delete", "task": str(self.task.id)},
+            {"op": "update", "task": "not-a-task"},
+            {"op": "cancel"},
+        ])
+
+        self.assertEqual(400, response.status_code)
+        self.assertEqual('BatchValidationError', response.data['type'])
+        self.assertEqual(
+            [
+                (1, 'InvalidOperationError'),
+                (2, 'TaskDoesNotExistError'),
+                (3, 'MissingValueError'),
+            ],
+            [(e['index'], e['type']) for e in response.data['errors']],
+        )
+        self.assertFalse(
+            Task.objects.filter(title='Organizar os livros').exists()
+        )
+
+    def test_post_batch_too_large(self):
+        """ When the batch is empty or too large \
+        Then returns a batch too large error \
+        """
+
+        for operations in ([], [{"op": "cancel"}] * 1001):
+            response = self.post(operations)
+
+            self.assertEqual(400, response.status_code)
+            self.assertEqual('BatchTooLargeError', response.data['type'])
+
+    def test_post_batch_not_a_list(self):
+        """ When the batch is not a list of operations \
+        Then returns an invalid body error \
+        """
+
+        for operations in ({"op": "create"}, "create"):
+            response = self.post(operations)
+
+            self.assertEqual(400, response.status_code)
+            self.assertEqual('InvalidBodyError', response.data['type'])
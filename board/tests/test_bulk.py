@@ -0,0 +1,224 @@
+import io
+import json
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+from django.contrib.auth.models import User
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from board.bulk import BULK_COMMIT_CHUNK, JSONBodyReader, TaskBulkInserter
+from board.exceptions import BatchValidationException, InvalidBodyException
+from board.models import TaskStatus
+
+bulk_items = [
+    {"title": "Separar as roupas", "description": "Ação rápida ✔"},
+    {"title": "Lavar as roupas", "status": "concluded"},
+    {"title": "Estender as roupas", "description": None},
+    {"title": "Passar as roupas", "status": "canceled"},
+    {"title": "Guardar as roupas"},
+]
+
+
+class JSONBodyReaderTest(SimpleTestCase):
+    def read(self, body: str, read_size: int = 7):
+        return JSONBodyReader(io.BytesIO(body.encode()), read_size).read()
+
+    def test_read_array_in_blocks(self):
+        """ When read an array in blocks smaller than its items \
+        Then yields the same items of json.loads one by one \
+        """
+
+        body = json.dumps(
+            [*bulk_items, 12345, -1.5e3, "a, b]", True, None, [], {}],
+            ensure_ascii=False,
+        )
+
+        items = self.read(body)
+
+        self.assertNotIsInstance(items, list)
+        self.assertEqual(json.loads(body), list(items))
+
+    def test_read_object(self):
+        """ When read a body that is not an array \
+        Then returns its parsed value \
+        """
+
+        self.assertEqual(bulk_items[0], self.read(json.dumps(bulk_items[0])))
+        self.assertEqual([], list(self.read(' [ ] ')))
+
+    def test_read_malformed(self):
+        """ When read a malformed body \
+        Then raises InvalidBodyException when reaching the error \
+        """
+
+        items = self.read('[{"title": "Válido"}, {"title": ]')
+
+        self.assertEqual({"title": "Válido"}, next(items))
+        with self.assertRaises(InvalidBodyException):
+            next(items)
+        with self.assertRaises(InvalidBodyException):
+            list(self.read('[1, 2] 3'))
+        with self.assertRaises(InvalidBodyException):
+            self.read('{"title": "Sem fim"')
+
+    def test_read_malformed_stops_at_error(self):
+        """ When a large body has a syntax error in one of its first items \
+        Then raises InvalidBodyException without reading the rest of it \
+        """
+
+        body = ('[{"title": "Válido"}, {"title" "Sem dois pontos"}, '
+                + ', '.join([json.dumps(bulk_items[0])] * 1000) + ']').encode()
+        stream = io.BytesIO(body)
+        items = JSONBodyReader(stream, read_size=64).read()
+
+        self.assertEqual({"title": "Válido"}, next(items))
+        with self.assertRaises(InvalidBodyException):
+            next(items)
+        self.assertLess(stream.tell(), 256)
+
+    def test_read_values_cut_between_blocks(self):
+        """ When the blocks cut strings, escapes and literals \
+        Then reads the same values of json.loads \
+        """
+
+        body = json.dumps(['\u00e7\u00e3o', 'fim', False, True, None])
+
+        for read_size in range(1, 12):
+            self.assertEqual(
+                json.loads(body), list(self.read(body, read_size))
+            )
+
+
+class TaskBulkInserterTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='bulk_user')
+
+    def test_insert_in_chunks(self):
+        """ When insert more items than the chunk size \
+        Then inserts all of them, one bulk insert per chunk \
+        """
+
+        inserter = TaskBulkInserter(self.user, chunk_size=2)
+        inserter.run(iter(bulk_items))
+
+        self.assertEqual(len(bulk_items), inserter.inserted)
+        self.assertEqual(len(bulk_items), self.user.tasks.count())
+        self.assertEqual(
+            3, len(set(self.user.tasks.values_list('change_seq', flat=True)))
+        )
+
+    def test_all_commit_with_invalid_item(self):
+        """ When an item of a later chunk is invalid in the all commit mode \
+        Then nothing is inserted and every invalid item is reported \
+        """
+
+        items = [*bulk_items, {"status": "pending"}, *bulk_items, "task"]
+        inserter = TaskBulkInserter(self.user, chunk_size=2)
+
+        with self.assertRaises(BatchValidationException) as context:
+            inserter.run(iter(items))
+
+        self.assertEqual(0, self.user.tasks.count())
+        self.assertEqual(
+            [5, 11], [error.index for error in context.exception.errors]
+        )
+
+    @mock.patch('board.bulk.BOARD_BULK_MAX_ERRORS', 2)
+    def test_all_commit_counts_errors_over_the_cap(self):
+        """ When more items are invalid than the reported errors cap \
+        Then the message counts every invalid item \
+        """
+
+        inserter = TaskBulkInserter(self.user, chunk_size=2)
+
+        with self.assertRaises(BatchValidationException) as context:
+            inserter.run(iter(["task"] * 5))
+
+        self.assertEqual(2, len(context.exception.errors))
+        self.assertEqual(
+            '5 item(s) of the request are invalid',
+            context.exception.message['description'],
+        )
+
+    def test_chunk_commit_with_invalid_item(self):
+        """ When items are invalid in the chunk commit mode \
+        Then the valid items are inserted and the invalid ones reported \
+        """
+
+        items = [*bulk_items[:3], {"title": 1}, *bulk_items[3:]]
+        inserter = TaskBulkInserter(
+            self.user, chunk_size=2, commit=BULK_COMMIT_CHUNK
+        )
+        inserter.run(iter(items))
+
+        self.assertEqual(len(bulk_items), inserter.inserted)
+        self.assertEqual(1, inserter.failed)
+        self.assertEqual(3, inserter.errors[0].index)
+        self.assertEqual('WrongTypeError', inserter.errors[0].type)
+        self.assertEqual(len(bulk_items), self.user.tasks.count())
+
+
+class BulkInsertViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='bulk_view_user')
+        cls.token = Token.objects.create(user=cls.user)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token.key}')
+
+    def post(self, body: str, path: str = '/api/board'):
+        return self.client.post(path, body, content_type='application/json')
+
+    def test_post_streamed_list(self):
+        """ When post a list of tasks \
+        Then every task is inserted with the same response as before \
+        """
+
+        response = self.post(json.dumps(bulk_items))
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('BulkTaskInsert', response.json().get('type'))
+        self.assertEqual(
+            1, self.user.tasks.filter(status=TaskStatus.CANCELED).count()
+        )
+        self.assertEqual(len(bulk_items), self.user.tasks.count())
+
+    def test_post_chunk_commit(self):
+        """ When post a list with invalid items in the chunk commit mode \
+        Then inserts the valid items and reports the invalid ones \
+        """
+
+        body = json.dumps([*bulk_items, {"title": "x" * 51}])
+        response = self.post(body, '/api/board?commit=chunk')
+
+        self.assertEqual(200, response.status_code)
+        res_data = response.json()
+        self.assertEqual(len(bulk_items), res_data.get('inserted'))
+        self.assertEqual(1, res_data.get('failed'))
+        self.assertEqual('TitleTooLongError', res_data['errors'][0]['type'])
+        self.assertEqual(len(bulk_items), self.user.tasks.count())
+
+    def test_post_malformed_list(self):
+        """ When post a list truncated after some valid tasks \
+        Then returns InvalidBodyError and inserts nothing \
+        """
+
+        response = self.post(json.dumps(bulk_items)[:-10])
+
+        self.assertEqual(400, response.status_code)
+        self.assertEqual('InvalidBodyError', response.json().get('type'))
+        self.assertEqual(0, self.user.tasks.count())
+
+    def test_post_invalid_commit_mode(self):
+        """ When post a list with an unknown commit mode \
+        Then returns InvalidCommitModeError \
+        """
+
+        response = self.post(json.dumps(bulk_items), '/api/board?commit=some')
+
+        self.assertEqual(400, response.status_code)
+        self.assertEqual('InvalidCommitModeError', response.json().get('type'))
@@ -0,0 +1,236 @@
+import time
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+
+from to_do_list_api.lru import LRUCache
+from board import cache as board_cache
+from board.cache import (
+    BoardCacheEntry,
+    board_cache_key,
+    board_cache_stats,
+    board_lock_key,
+    get_board_version,
+    get_or_build_board,
+    invalidate_board,
+    local_board_cache,
+    should_refresh,
+)
+
+
+class TwoTierBoardCacheTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        local_board_cache.clear()
+        self.params = {'status': 'PENDING'}
+        self.build = mock.Mock(return_value=[{'title': 'Regar as plantas'}])
+
+    def test_local_hit_skips_shared_cache(self):
+        """ When the board was already read by this process \
+        Then it is served from the local tier without the shared cache \
+        """
+
+        version = get_board_version(1)
+        get_or_build_board(1, self.params, self.build, version)
+
+        with mock.patch.object(board_cache, 'cache') as shared_cache:
+            board = get_or_build_board(1, self.params, self.build, version)
+
+        shared_cache.get.assert_not_called()
+        self.build.assert_called_once()
+        self.assertEqual([{'title': 'Regar as plantas'}], board)
+
+    def test_shared_hit_fills_local_tier(self):
+        """ When the board was built by another process \
+        Then it is read from the shared cache and kept in the local tier \
+        """
+
+        version = get_board_version(1)
+        get_or_build_board(1, self.params, self.build, version)
+        local_board_cache.clear()
+
+        get_or_build_board(1, self.params, self.build, version)
+
+        self.build.assert_called_once()
+        self.assertEqual(1, len(local_board_cache))
+
+    def test_write_skips_local_board(self):
+        """ When the user writes after the board was cached locally \
+        Then the next read builds the board again \
+        """
+
+        get_or_build_board(1, self.params, self.build, get_board_version(1))
+        invalidate_board(1)
+
+        get_or_build_board(1, self.params, self.build, get_board_version(1))
+
+        self.assertEqual(2, self.build.call_count)
+
+    def test_local_tier_is_bounded(self):
+        """ When more boards are read than the local tier holds \
+        Then the least recently used boards are evicted \
+        """
+
+        with mock.patch.object(
+            board_cache, 'local_board_cache', LRUCache(2, 60)
+        ) as local_cache:
+            for user_id in range(3):
+                get_or_build_board(
+                    user_id, self.params, self.build, get_board_version(user_id)
+                )
+
+            self.assertEqual(2, len(local_cache))
+
+    def test_large_board_skips_local_tier(self):
+        """ When the board has more tasks than BOARD_CACHE_LOCAL_MAX_TASKS \
+        Then it is only kept in the shared cache \
+        """
+
+        self.build.return_value = {
+            'results': [{'title': 'Regar as plantas'}] * 3, 'next': None
+        }
+
+        with mock.patch.object(board_cache, 'BOARD_CACHE_LOCAL_MAX_TASKS', 2):
+            version = get_board_version(1)
+            get_or_build_board(1, self.params, self.build, version)
+            get_or_build_board(1, self.params, self.build, version)
+
+        self.build.assert_called_once()
+        self.assertEqual(0, len(local_board_cache))
+
+    def test_local_version(self):
+        """ When the board version is also kept locally \
+        Then a hot board is validated without the shared cache, until a \
+        write of this process drops the local version \
+        """
+
+        with mock.patch.multiple(
+            board_cache,
+            BOARD_VERSION_LOCAL_TTL=60,
+            local_version_cache=LRUCache(10, 60),
+        ):
+            version = get_board_version(1)
+            with mock.patch.object(board_cache, 'cache') as shared_cache:
+                self.assertEqual(version, get_board_version(1))
+            shared_cache.get.assert_not_called()
+
+            invalidate_board(1)
+
+            self.assertNotEqual(version, get_board_version(1))
+
+
+class BoardCacheStampedeTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        local_board_cache.clear()
+        board_cache_stats.reset()
+        self.params = {'status': 'PENDING'}
+        self.version = get_board_version(1)
+        self.key = board_cache_key(1, self.params, self.version)
+        self.build = mock.Mock(return_value=['rebuilt'])
+
+    def get_board(self):
+        return get_or_build_board(1, self.params, self.build, self.version)
+
+    def expired_entry(self):
+        return BoardCacheEntry(['stale'], time.time() - 1, 0.01)
+
+    def test_expired_board_rebuilt_once(self):
+        """ When the cached board expired and nobody is rebuilding it \
+        Then the request takes the lock, rebuilds it and releases the lock \
+        """
+
+        cache.set(self.key, self.expired_entry())
+
+        self.assertEqual(['rebuilt'], self.get_board())
+        self.build.assert_called_once()
+        self.assertIsNone(cache.get(board_lock_key(self.key)))
+        self.assertEqual(1, board_cache_stats.snapshot()['miss'])
+
+    def test_serves_stale_while_rebuilding(self):
+        """ When the cached board expired and another request rebuilds it \
+        Then the stale board is served without building it \
+        """
+
+        cache.set(self.key, self.expired_entry())
+        cache.add(board_lock_key(self.key), True)
+
+        self.assertEqual(['stale'], self.get_board())
+        self.build.assert_not_called()
+        self.assertEqual(1, board_cache_stats.snapshot()['stale'])
+
+    def test_waits_for_rebuilt_board(self):
+        """ When the board is missing and another request rebuilds it \
+        Then the request waits for the rebuilt board instead of building it \
+        """
+
+        cache.add(board_lock_key(self.key), True)
+        rebuilt = BoardCacheEntry(['rebuilt elsewhere'], time.time() + 60, 0.01)
+
+        with mock.patch(
+            'board.cache.time.sleep',
+            side_effect=lambda seconds: cache.set(self.key, rebuilt),
+        ):
+            board = self.get_board()
+
+        self.assertEqual(['rebuilt elsewhere'], board)
+        self.build.assert_not_called()
+        self.assertEqual(1, board_cache_stats.snapshot()['wait'])
+
+    def test_early_refresh(self):
+        """ When the board is close to expire \
+        Then only some reads refresh it, the unlucky ones rolling a large gap \
+        """
+
+        entry = BoardCacheEntry(['board'], time.time() + 5, 1.0)
+
+        with mock.patch('board.cache.random.random', return_value=0.0):
+            self.assertFalse(should_refresh(entry))
+        with mock.patch('board.cache.random.random', return_value=0.9999):
+            self.assertTrue(should_refresh(entry))
+
+
+class BoardCacheStatsViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create(username='staff', is_staff=True)
+        cls.user = User.objects.create(username='stats_user')
+
+    def setUp(self):
+        cache.clear()
+        local_board_cache.clear()
+        board_cache_stats.reset()
+        self.client = APIClient()
+
+    def test_get_stats(self):
+        """ When a staff user requests the board cache counters \
+        Then returns the counters of the board reads and the hit ratio \
+        """
+
+        build = mock.Mock(return_value=[])
+        version = get_board_version(1)
+        for _ in range(4):
+            get_or_build_board(1, {}, build, version)
+
+        self.client.force_authenticate(self.staff)
+        response = self.client.get('/api/board/cache/stats')
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            {'hit': 3, 'miss': 1, 'stale': 0, 'wait': 0, 'hitRatio': 0.75},
+            response.json(),
+        )
+
+    def test_get_stats_not_staff(self):
+        """ When a user without staff status requests the counters \
+        Then the request is forbidden \
+        """
+
+        self.client.force_authenticate(self.user)
+
+        response = self.client.get('/api/board/cache/stats')
+
+        self.assertEqual(403, response.status_code)
@@ -0,0 +1,138 @@
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.http import HttpRequest
+
+from board.models import Task, TaskStatus, TaskChangeSequence
+from board.views import BoardChangesManager, BoardManager
+
+
+class BoardChangesViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.view = BoardChangesManager()
+        cls.board_view = BoardManager()
+        cls.user = User.objects.create(username='changes_user')
+        cls.another_user = User.objects.create(username='changes_another')
+        cls.tasks = Task.objects.bulk_create([
+            Task(user=cls.user, title='Regar as plantas'),
+            Task(user=cls.user, title='Lavar a louça'),
+            Task(
+                user=cls.user,
+                title='Pagar a conta de luz',
+                status=TaskStatus.CONCLUDED,
+            ),
+        ])
+        Task.objects.create(user=cls.another_user, title='Outro quadro')
+
+    def setUp(self):
+        self.request = HttpRequest()
+        self.request.user = self.user
+
+    def sync(self, **params):
+        self.request.query_params = params
+        response = self.view.get(self.request)
+        self.assertEqual(200, response.status_code)
+        return response.data
+
+    def test_get_initial_sync(self):
+        """ When request the changes without a since token \\
+        Then returns every task of the user in any status \\
+        """
+
+        res_data = self.sync()
+
+        self.assertEqual(
+            {str(task.id) for task in self.tasks},
+            {task['id'] for task in res_data['changes']},
+        )
+        self.assertTrue(res_data['nextToken'])
+        self.assertFalse(res_data['hasMore'])
+
+    def test_get_without_changes(self):
+        """ When request the changes since the last token and nothing changed \\
+        Then returns no task and the same token \\
+        """
+
+        token = self.sync()['nextToken']
+
+        with self.assertNumQueries(1):
+            res_data = self.sync(since=token)
+
+        self.assertEqual([], res_data['changes'])
+        self.assertEqual(token, res_data['nextToken'])
+
+    def test_get_changes_since_token(self):
+        """ When tasks are created and canceled after the last sync \\
+        Then returns only them, with the canceled task as tombstone \\
+        """
+
+        token = self.sync()['nextToken']
+
+        new_task = Task.objects.create(user=self.user, title='Varrer a casa')
+        self.request.method = 'DELETE'
+        self.board_view.delete(self.request, task_id=str(self.tasks[0].id))
+        Task.objects.create(user=self.another_user, title='Fora do quadro')
+
+        res_data = self.sync(since=token)
+
+        changes = {task['id']: task['status'] for task in res_data['changes']}
+        self.assertEqual(
+            {
+                str(new_task.id): TaskStatus.PENDING.name,
+                str(self.tasks[0].id): TaskStatus.CANCELED.name,
+            },
+            changes,
+        )
+        self.assertEqual(
+            [], self.sync(since=res_data['nextToken'])['changes']
+        )
+
+    def test_get_changes_paginated(self):
+        """ When the changes are more than the limit \\
+        Then returns them in pages linked by the next token, even inside a \\
+        single bulk write \\
+        """
+
+        synced = []
+        token = None
+        has_more = True
+        while has_more:
+            params = {'limit': '2', **({'since': token} if token else {})}
+            res_data = self.sync(**params)
+            synced += [task['id'] for task in res_data['changes']]
+            token, has_more = res_data['nextToken'], res_data['hasMore']
+
+        self.assertEqual(len(self.tasks), len(synced))
+        self.assertEqual(
+            {str(task.id) for task in self.tasks}, set(synced)
+        )
+
+    def test_get_with_invalid_token(self):
+        """ When request the changes with a token not issued by the API \\
+        Then returns InvalidChangeTokenError \\
+        """
+
+        expected_status_code = 400
+        expected_response_type = 'InvalidChangeTokenError'
+
+        self.request.query_params = {'since': 'not-a-token'}
+        response = self.view.get(self.request)
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(expected_response_type, response.data.get('type'))
+
+    def test_change_sequence_by_write(self):
+        """ When the tasks of a user are written \\
+        Then every write takes the next value of the user sequence \\
+        """
+
+        task = Task.objects.create(user=self.user, title='Trocar a lâmpada')
+        first_change_seq = task.change_seq
+        task.update_status(TaskStatus.CONCLUDED)
+
+        task.refresh_from_db()
+        self.assertEqual(first_change_seq + 1, task.change_seq)
+        self.assertEqual(
+            task.change_seq,
+            TaskChangeSequence.objects.get(user=self.user).value,
+        )
@@ -0,0 +1,94 @@
+import gzip
+import json
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from board.models import Task, TaskStatus
+from board.views import BoardImportManager
+
+
+def build_ndjson(lines: list) -> bytes:
+    return '\n'.join(
+        line if isinstance(line, str) else json.dumps(line) for line in lines
+    ).encode()
+
+
+class BoardImportManagerViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.view = BoardImportManager.as_view()
+        cls.factory = APIRequestFactory()
+        cls.user = User.objects.create(username='import_user')
+
+    def import_tasks(self, body: bytes, **extra):
+        request = self.factory.post(
+            '/api/board/import',
+            data=body,
+            content_type='application/x-ndjson',
+            **extra
+        )
+        force_authenticate(request, user=self.user)
+        return self.view(request)
+
+    def test_import(self):
+        """ When import NDJSON lines with some invalid ones \
+        Then imports the valid lines and reports the invalid ones \
+        """
+
+        expected_status_code = 200
+        expected_res_type = 'TaskImport'
+        expected_imported = 3
+        expected_error_lines = [2, 4, 5, 6]
+
+        body = build_ndjson([
+            {"title": "Importar tarefas", "description": "Via NDJSON"},
+            {"title": "Status inexistente", "status": "done"},
+            {"title": "Tarefa concluída", "status": "concluded"},
+            {"description": "Sem título"},
+            '{"title": "JSON quebrado"',
+            {"title": "t" * 51},
+            '',
+            {"title": "Tarefa com status nulo", "status": None},
+        ])
+
+        response = self.import_tasks(body)
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(expected_res_type, response.data.get('type'))
+        self.assertEqual(expected_imported, response.data.get('imported'))
+        self.assertEqual(
+            len(expected_error_lines), response.data.get('failed')
+        )
+        self.assertListEqual(
+            expected_error_lines,
+            [error['line'] for error in response.data.get('errors')]
+        )
+
+        tasks = Task.objects.filter(user=self.user)
+        self.assertEqual(expected_imported, tasks.count())
+        self.assertEqual(
+            TaskStatus.CONCLUDED, tasks.get(title='Tarefa concluída').status
+        )
+
+    def test_import_gzip(self):
+        """ When import gzip compressed NDJSON lines \
+        Then decompresses the body and imports all the lines \
+        """
+
+        expected_status_code = 200
+        expected_imported = 2
+
+        body = gzip.compress(build_ndjson([
+            {"title": "Tarefa comprimida 1"},
+            {"title": "Tarefa comprimida 2"},
+        ]))
+
+        response = self.import_tasks(body, HTTP_CONTENT_ENCODING='gzip')
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(expected_imported, response.data.get('imported'))
+        self.assertEqual(
+            expected_imported, Task.objects.filter(user=self.user).count()
+        )
@@ -0,0 +1,116 @@
+from unittest import skipUnless
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.db import connection
+
+from board.models import Task, TaskStatus
+from board.pagination import KEYSET_ORDERING
+
+SEEDED_TASKS_PER_STATUS = 500
+BOARD_PAGE_LIMIT = 50
+
+
+class TaskIndexesTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='indexes_user')
+        cls.another_user = User.objects.create(username='indexes_another_user')
+        Task.objects.bulk_create([
+            Task(
+                user=user,
+                title=f'Tarefa {number} de {task_status.name}',
+                description=f'Descrição da tarefa {number}',
+                status=task_status,
+            )
+            for user in (cls.user, cls.another_user)
+            for task_status in TaskStatus
+            for number in range(SEEDED_TASKS_PER_STATUS)
+        ])
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def test_board_listing_uses_user_status_index(self):
+        """ When read a keyset page of the pending tasks of a user \
+        Then the planner uses the (user, status, created_at) index \
+        """
+
+        if connection.vendor == 'postgresql':
+            # The scans of the user_id index need a full sort of the page,
+            # turning them off keeps the assertion from depending on the
+            # planner costs of a small seeded table
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+                cursor.execute('SET LOCAL enable_bitmapscan = off')
+                cursor.execute('SET LOCAL enable_sort = off')
+
+        plan = Task.objects.filter(
+            user=self.user, status=TaskStatus.PENDING
+        ).order_by(*KEYSET_ORDERING)[:BOARD_PAGE_LIMIT].explain()
+
+        # On PostgreSQL the scan goes to the index of the pending partition,
+        # board_task_pending_user_status_idx
+        self.assertIn('user_status_idx', plan)
+
+    @skipUnless(
+        connection.vendor == 'postgresql', 'trigram indexes are PostgreSQL only'
+    )
+    def test_icontains_uses_trigram_indexes(self):
+        """ When filter the tasks by title or description containing a text \
+        Then the planner uses the trigram indexes \
+        """
+
+        # Sequential scans are disabled so the assertion does not depend on
+        # the planner costs of a small seeded table
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+
+        title_plan = Task.objects.filter(
+            title__icontains='tarefa 42'
+        ).explain()
+        description_plan = Task.objects.filter(
+            description__icontains='tarefa 42'
+        ).explain()
+
+        self.assertIn('title_trgm_idx', title_plan)
+        self.assertIn('description_trgm_idx', description_plan)
+
+    @skipUnless(
+        connection.vendor == 'postgresql', 'partitions are PostgreSQL only'
+    )
+    def test_status_filter_reads_one_partition(self):
+        """ When list the tasks of a user filtering by status \
+        Then only the partition of that status is read \
+        """
+
+        pending_plan = Task.objects.filter(
+            user=self.user, status=TaskStatus.PENDING
+        ).explain()
+        canceled_plan = Task.objects.filter(
+            user=self.user, status=TaskStatus.CANCELED
+        ).explain()
+
+        self.assertIn('board_task_pending', pending_plan)
+        self.assertNotIn('board_task_canceled', pending_plan)
+        self.assertIn('board_task_canceled', canceled_plan)
+        self.assertNotIn('board_task_pending', canceled_plan)
+
+    @skipUnless(
+        connection.vendor == 'postgresql', 'partitions are PostgreSQL only'
+    )
+    def test_status_update_moves_task_to_partition(self):
+        """ When cancel a pending task \
+        Then it moves from the pending to the canceled partition \
+        """
+
+        task = Task.objects.filter(
+            user=self.user, status=TaskStatus.PENDING
+        ).first()
+        task.update_status(TaskStatus.CANCELED)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT tableoid::regclass::text FROM board_task WHERE id = %s',
+                [task.id],
+            )
+            self.assertEqual('board_task_canceled', cursor.fetchone()[0])
@@ -0,0 +1,157 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.http import HttpRequest
+
+from board.models import Task, TaskStatus
+from board.views import BoardManager
+from board.cache import invalidate_board
+from board.search import search_terms, search_tasks
+from board.serializers import TASK_ROW_COLUMNS
+
+search_mock_tasks = [
+    {"title": "Lavar o carro", "description": "O carro está sujo"},
+    {"title": "Comprar pão", "description": "Passar na padaria do carro"},
+    {"title": "Pagar o aluguel", "description": None},
+    {
+        "title": "Vender o carro antigo",
+        "status": TaskStatus.CONCLUDED,
+    },
+]
+
+
+class BoardSearchTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.view = BoardManager()
+        cls.user = User.objects.create(username='search_user')
+        cls.another_user = User.objects.create(username='search_another_user')
+        for user in (cls.user, cls.another_user):
+            Task.objects.bulk_create([
+                Task(user=user, **task) for task in search_mock_tasks
+            ])
+
+    def setUp(self):
+        self.request = HttpRequest()
+        self.request.user = self.user
+        invalidate_board(self.user.id)
+
+    def search(self, **params):
+        self.request.query_params = params
+        response = self.view.get(self.request)
+        self.assertEqual(200, response.status_code)
+        return response.data
+
+    def test_search_terms(self):
+        """ When split a query with punctuation and accents \
+        Then returns only its words \
+        """
+
+        self.assertEqual(
+            ['pão', 'de', 'queijo'], search_terms('"pão" de-queijo!')
+        )
+
+    def test_search_rows_keep_columns(self):
+        """ When search the rows of a values_list queryset \
+        Then the rows keep only the selected columns, without the rank \
+        """
+
+        rows = list(search_tasks(
+            self.user.tasks.values_list(*TASK_ROW_COLUMNS), 'carro'
+        ))
+
+        self.assertTrue(rows)
+        for row in rows:
+            self.assertEqual(len(TASK_ROW_COLUMNS), len(row))
+
+    @skipUnless(
+        connection.vendor == 'postgresql', 'tsvector search is PostgreSQL only'
+    )
+    def test_get_search_postgresql(self):
+        """ When search the board on PostgreSQL \
+        Then returns the serialized tasks ranked by ts_rank \
+        """
+
+        res_data = self.search(q='carro')
+
+        self.assertEqual(
+            ['Lavar o carro', 'Comprar pão'],
+            [task['title'] for task in res_data['results']],
+        )
+        self.assertEqual(
+            ['id', 'title', 'description', 'status', 'statusLabel',
+             'createdAt', 'updatedAt'],
+            list(res_data['results'][0].keys()),
+        )
+
+    def test_get_search_ranked(self):
+        """ When search a term present in title and description \
+        Then returns the matching pending tasks, most relevant first \
+        """
+
+        res_data = self.search(q='carro')
+
+        titles = [task['title'] for task in res_data['results']]
+        self.assertEqual(['Lavar o carro', 'Comprar pão'], titles)
+        self.assertIsNone(res_data['nextCursor'])
+
+    def test_get_search_every_term(self):
+        """ When search more than one term \
+        Then returns only the tasks matching all of them \
+        """
+
+        res_data = self.search(q='carro padaria')
+
+        titles = [task['title'] for task in res_data['results']]
+        self.assertEqual(['Comprar pão'], titles)
+
+    def test_get_search_with_status(self):
+        """ When search specifying a status \
+        Then returns only the matching tasks of that status \
+        """
+
+        res_data = self.search(q='carro', status='CONCLUDED')
+
+        titles = [task['title'] for task in res_data['results']]
+        self.assertEqual(['Vender o carro antigo'], titles)
+
+    def test_get_search_paginated(self):
+        """ When search specifying a limit \
+        Then returns pages of results linked by the next cursor \
+        """
+
+        first_page = self.search(q='carro', limit='1')
+        second_page = self.search(
+            q='carro', limit='1', cursor=first_page['nextCursor']
+        )
+
+        self.assertEqual('Lavar o carro', first_page['results'][0]['title'])
+        self.assertEqual('Comprar pão', second_page['results'][0]['title'])
+        self.assertIsNone(second_page['nextCursor'])
+
+    def test_get_search_without_terms(self):
+        """ When search only punctuation \
+        Then returns no task \
+        """
+
+        res_data = self.search(q='"*"')
+
+        self.assertEqual([], res_data['results'])
+
+    def test_search_follows_task_changes(self):
+        """ When a task is created, renamed or deleted \
+        Then the search index follows the change \
+        """
+
+        task = Task.objects.create(user=self.user, title='Trocar o pneu')
+        self.assertTrue(search_tasks(self.user.tasks.all(), 'pneu').exists())
+
+        task.title = 'Trocar o óleo'
+        task.save()
+        self.assertFalse(search_tasks(self.user.tasks.all(), 'pneu').exists())
+        self.assertTrue(search_tasks(self.user.tasks.all(), 'óleo').exists())
+
+        task.delete()
+        self.assertFalse(search_tasks(self.user.tasks.all(), 'óleo').exists())
@@ -0,0 +1,70 @@
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+from board.models import Task, TaskStatus
+from board.serializers import (
+    TASK_ROW_COLUMNS,
+    UserTasksSerializer,
+    serialize_task_rows,
+    task_row_columns,
+)
+
+
+class TaskRowsSerializerTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='serializer_user')
+        Task.objects.bulk_create([
+            Task(
+                user=cls.user,
+                title='Escrever o caminho rápido de leitura',
+                description='Sem instanciar modelos',
+            ),
+            Task(
+                user=cls.user,
+                title='Comparar com o serializer',
+                status=TaskStatus.CONCLUDED,
+                updated_at=timezone.now(),
+            ),
+            Task(
+                user=cls.user,
+                title='Tarefa cancelada',
+                description='',
+                status=TaskStatus.CANCELED,
+                updated_at=timezone.now(),
+            ),
+        ])
+
+    def test_serialize_task_rows_equivalence(self):
+        """ When serialize the tasks from column tuples \
+        Then returns the same output of UserTasksSerializer \
+        """
+
+        tasks = Task.objects.filter(user=self.user).order_by('created_at')
+        expected_data = UserTasksSerializer(tasks, many=True).data
+
+        data = serialize_task_rows(tasks.values_list(*TASK_ROW_COLUMNS))
+
+        self.assertEqual(len(TaskStatus), len(data))
+        for expected_task, task in zip(expected_data, data):
+            self.assertEqual(list(expected_task.keys()), list(task.keys()))
+            self.assertDictEqual(dict(expected_task), task)
+
+    def test_serialize_task_rows_fields(self):
+        """ When serialize the tasks restricted to some fields \
+        Then reads only their columns and returns only them \
+        """
+
+        fields = ('id', 'status', 'statusLabel')
+        tasks = Task.objects.filter(user=self.user).order_by('created_at')
+        expected_data = UserTasksSerializer(tasks, many=True).data
+
+        columns = task_row_columns(fields)
+        data = serialize_task_rows(tasks.values_list(*columns), fields)
+
+        self.assertEqual(('id', 'status', 'created_at'), columns)
+        for expected_task, task in zip(expected_data, data):
+            self.assertDictEqual(
+                {field: expected_task[field] for field in fields}, task
+            )
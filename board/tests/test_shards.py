@@ -0,0 +1,210 @@
+from io import StringIO
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connections
+from django.http import HttpRequest
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from board.models import Task, TaskChangeSequence, TaskStatus, UserShard
+from board.shards import (
+    TaskShardRouter,
+    hash_shard,
+    local_shard_cache,
+    task_database,
+)
+from board.views import BoardManager
+
+SHARDS = ['tasks_1', 'tasks_2']
+# The task databases are only configured by to_do_list_api.settings.shards
+SHARDS_CONFIGURED = all(shard in settings.DATABASES for shard in SHARDS)
+
+
+def has_user_foreign_key(database: str, table: str) -> bool:
+    connection = connections[database]
+    with connection.cursor() as cursor:
+        relations = connection.introspection.get_relations(cursor, table)
+    return 'user_id' in relations
+
+
+class HashShardTest(SimpleTestCase):
+    def test_hash_shard_is_stable(self):
+        """ When places the same user twice \
+        Then returns the same shard, spreading the users over all of them \
+        """
+
+        placements = [hash_shard(user_id, SHARDS) for user_id in range(100)]
+
+        self.assertEqual(
+            placements, [hash_shard(user_id, SHARDS) for user_id in range(100)]
+        )
+        self.assertEqual(set(SHARDS), set(placements))
+
+    @override_settings(TASK_SHARDS=[])
+    def test_without_shards(self):
+        """ When the tasks are not sharded \
+        Then the tasks stay in the default database \
+        """
+
+        user = User(id=1)
+
+        self.assertEqual('default', task_database(user.id))
+        self.assertIsNone(
+            TaskShardRouter().db_for_write(Task, instance=user)
+        )
+
+
+class TaskForeignKeyTest(TestCase):
+    def test_default_database_keeps_foreign_keys(self):
+        """ When the tasks are stored in the default database \
+        Then their user foreign keys keep the database constraint \
+        """
+
+        self.assertTrue(has_user_foreign_key('default', 'board_task'))
+        self.assertTrue(
+            has_user_foreign_key('default', 'board_taskchangesequence')
+        )
+
+
+@skipUnless(
+    SHARDS_CONFIGURED,
+    'needs the SQLite task databases of to_do_list_api.settings.shards',
+)
+@override_settings(TASK_SHARDS=SHARDS)
+class TaskShardsTest(TestCase):
+    databases = {'default', *SHARDS} if SHARDS_CONFIGURED else {'default'}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.view = BoardManager()
+        cls.user = User.objects.create(username='sharded_user')
+
+    def setUp(self):
+        cache.clear()
+        local_shard_cache.clear()
+        self.request = HttpRequest()
+        self.request.user = self.user
+
+    def test_tasks_written_to_user_shard(self):
+        """ When the user creates a task \
+        Then it is written to the task database assigned to the user \
+        """
+
+        self.request.data = {"title": "Regar as plantas"}
+        self.view.post(self.request)
+
+        database = hash_shard(self.user.id, SHARDS)
+        other_database = next(shard for shard in SHARDS if shard != database)
+        self.assertEqual(
+            database, UserShard.objects.get(user=self.user).database
+        )
+        self.assertEqual(
+            1, Task.objects.using(database).filter(user=self.user).count()
+        )
+        self.assertFalse(Task.objects.using(other_database).exists())
+        self.assertFalse(Task.objects.using('default').exists())
+
+        response = self.view.get(self.request)
+
+        self.assertEqual(
+            ['Regar as plantas'], [task['title'] for task in response.data]
+        )
+
+    @mock.patch('board.management.commands.rebalance_task_shards.time.sleep')
+    def test_rebalance_moves_user_tasks(self, sleep):
+        """ When rebalances a user to another task database \
+        Then their tasks are moved keeping the creation dates and the \
+        change sequence keeps growing \
+        """
+
+        source = task_database(self.user.id)
+        target = next(shard for shard in SHARDS if shard != source)
+        self.user.tasks.create(title='Regar as plantas')
+        self.user.tasks.create(title='Lavar a louça')
+        created = dict(self.user.tasks.values_list('id', 'created_at'))
+        source_seq = TaskChangeSequence.objects.using(source).get(
+            user=self.user
+        ).value
+
+        call_command(
+            'rebalance_task_shards', '--to', target, stdout=StringIO()
+        )
+
+        self.assertEqual(target, task_database(self.user.id))
+        self.assertEqual(created, dict(
+            Task.objects.using(target).values_list('id', 'created_at')
+        ))
+        self.assertFalse(Task.objects.using(source).exists())
+        self.assertGreater(
+            TaskChangeSequence.objects.using(target).get(
+                user=self.user
+            ).value,
+            source_seq,
+        )
+        sleep.assert_called_once()
+
+    @mock.patch('board.management.commands.rebalance_task_shards.time.sleep')
+    def test_rebalance_keeps_writes_made_during_move(self, sleep):
+        """ When the user writes on the destination and a late process \
+        writes on the source while the user is moved \
+        Then the destination write is kept and the source write is copied \
+        """
+
+        source = task_database(self.user.id)
+        target = next(shard for shard in SHARDS if shard != source)
+        edited = self.user.tasks.create(title='Regar as plantas')
+        late = self.user.tasks.create(title='Lavar a louça')
+
+        def write_during_move(seconds):
+            local_shard_cache.clear()
+            self.user.tasks.bulk_update_status(
+                [(edited.id, TaskStatus.CONCLUDED)]
+            )
+            Task.objects.db_manager(source).bulk_update_status(
+                [(edited.id, TaskStatus.CANCELED), (late.id, TaskStatus.CANCELED)]
+            )
+
+        sleep.side_effect = write_during_move
+        call_command(
+            'rebalance_task_shards', '--to', target, stdout=StringIO()
+        )
+
+        statuses = dict(
+            Task.objects.using(target).values_list('title', 'status')
+        )
+        self.assertEqual(
+            {
+                'Regar as plantas': TaskStatus.CONCLUDED,
+                'Lavar a louça': TaskStatus.CANCELED,
+            },
+            statuses,
+        )
+        self.assertFalse(Task.objects.using(source).exists())
+
+    def test_delete_user_deletes_sharded_tasks(self):
+        """ When a user is deleted \
+        Then their tasks are deleted from their task database \
+        """
+
+        user = User.objects.create(username='deleted_user')
+        database = task_database(user.id)
+        user.tasks.create(title='Regar as plantas')
+
+        user.delete()
+
+        self.assertFalse(Task.objects.using(database).exists())
+
+    def test_task_databases_without_foreign_keys(self):
+        """ When the tasks are stored in the task databases \
+        Then their user foreign keys have no database constraint, the \
+        users staying in the default database \
+        """
+
+        for database in SHARDS:
+            self.assertFalse(has_user_foreign_key(database, 'board_task'))
+            self.assertFalse(
+                has_user_foreign_key(database, 'board_taskchangesequence')
+            )
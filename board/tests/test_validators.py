@@ -0,0 +1,77 @@
+from django.test import SimpleTestCase
+
+from board.models import TaskStatus
+from board.validators import (
+    validate_inserts,
+    validate_status_updates,
+    validate_task_ids,
+)
+
+
+class TaskBatchValidatorsTest(SimpleTestCase):
+    def test_validate_inserts(self):
+        """ When validate a batch of insertion items with invalid ones \
+        Then returns the cleaned valid items and the errors of all the \
+        invalid ones with their index \
+        """
+
+        expected_errors = [
+            (1, 'MissingValueError'),
+            (2, 'StatusDoesNotExistError'),
+            (3, 'TitleTooLongError'),
+            (4, 'WrongTypeError'),
+            (5, 'WrongTypeError'),
+        ]
+
+        tasks, errors = validate_inserts([
+            {"title": "Validar em lote", "status": "concluded"},
+            {"description": "Sem título"},
+            {"title": "Status inválido", "status": "done"},
+            {"title": "t" * 51},
+            "não é um objeto",
+            {"title": "Descrição inválida", "description": 10},
+            {"title": "Status padrão", "description": None},
+        ])
+
+        self.assertListEqual(
+            expected_errors, [(error.index, error.type) for error in errors]
+        )
+        self.assertListEqual(
+            [TaskStatus.CONCLUDED, TaskStatus.PENDING],
+            [task['status'] for task in tasks]
+        )
+
+    def test_validate_status_updates(self):
+        """ When validate a batch of status update items \
+        Then the items without status use the default one \
+        """
+
+        task_id = '45214d30-a875-4127-beea-68f7256db287'
+
+        updates, errors = validate_status_updates([
+            {"task": task_id},
+            {"task": task_id, "status": "Canceled"},
+            {"task": "not-an-id"},
+            {"status": "pending"},
+        ])
+
+        self.assertListEqual(
+            [(task_id, TaskStatus.CONCLUDED), (task_id, TaskStatus.CANCELED)],
+            updates
+        )
+        self.assertListEqual(
+            [(2, 'TaskDoesNotExistError'), (3, 'MissingValueError')],
+            [(error.index, error.type) for error in errors]
+        )
+
+    def test_validate_task_ids(self):
+        """ When validate a batch of task ids \
+        Then returns the errors of the malformed ids \
+        """
+
+        task_id = '45214d30-a875-4127-beea-68f7256db287'
+
+        task_ids, errors = validate_task_ids([task_id, 10, None])
+
+        self.assertListEqual([task_id], task_ids)
+        self.assertListEqual([1, 2], [error.index for error in errors])
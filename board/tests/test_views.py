@@ -1,10 +1,18 @@
+import json
+
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth.models import User
+from django.db import connection
 from django.http import HttpRequest
 
 from board.models import Task, TaskStatus
 from board.views import BoardManager
 from board.exceptions import TaskDoesNotExistException
+from board.cache import invalidate_board
+from board.serializers import TASK_ROW_COLUMNS
+from board.streaming import stream_task_rows
+from to_do_list_api.renderers import ORJSONRenderer
 
 mock_tasks = [
     {
@@ -42,6 +50,8 @@ class BatchManagerViewTest(TestCase):
     def setUp(self):
         self.request = HttpRequest()
         self.request.user = self.user
+        invalidate_board(self.user.id)
+        invalidate_board(self.another_user.id)
         
     def test_get(self):
         """
@@ -428,3 +438,316 @@ class BatchManagerViewTest(TestCase):
         
         self.assertListEqual(expected_new_tasks_status, status)
         self.assertTrue(updated_ats[0] and updated_ats[1] and updated_ats[2])
+
+    def test_get_paginated(self):
+        """ When request pending tasks specifying a limit \
+        Then returns pages of tasks linked by the next cursor \
+        """
+
+        expected_status_code = 200
+        expected_first_page_title = 'Criar a rota de autenticação'
+        expected_second_page_title = 'Criar .env com as credenciais locais'
+
+        self.request.query_params = {'limit': '1'}
+        response = self.view.get(self.request)
+
+        self.assertEqual(expected_status_code, response.status_code)
+        res_data = response.data
+        self.assertEqual(1, len(res_data.get('results')))
+        self.assertEqual(
+            expected_first_page_title, res_data['results'][0].get('title')
+        )
+        self.assertTrue(res_data.get('nextCursor'))
+
+        self.request.query_params = {
+            'limit': '1', 'cursor': res_data.get('nextCursor')
+        }
+        response = self.view.get(self.request)
+
+        self.assertEqual(expected_status_code, response.status_code)
+        res_data = response.data
+        self.assertEqual(1, len(res_data.get('results')))
+        self.assertEqual(
+            expected_second_page_title, res_data['results'][0].get('title')
+        )
+        self.assertIsNone(res_data.get('nextCursor'))
+
+    def test_get_paginated_with_invalid_cursor(self):
+        """ When request tasks with a cursor that was not issued by the API \
+        Then returns InvalidCursorError \
+        """
+
+        expected_status_code = 400
+        expected_response_type = 'InvalidCursorError'
+
+        self.request.query_params = {'limit': '1', 'cursor': 'not-a-cursor'}
+        response = self.view.get(self.request)
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(expected_response_type, response.data.get("type"))
+
+    def test_get_paginated_with_invalid_limit(self):
+        """ When request tasks with a limit out of the allowed range \
+        Then returns InvalidLimitError \
+        """
+
+        expected_status_code = 400
+        expected_response_type = 'InvalidLimitError'
+
+        self.request.query_params = {'limit': '0'}
+        response = self.view.get(self.request)
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(expected_response_type, response.data.get("type"))
+
+    def test_put_bulk_tasks_report(self):
+        """ When request to update multiple tasks including missing tasks, \
+        tasks of another user and tasks already in the target status \
+        Then update the remaining tasks and report the skipped ones \
+        """
+
+        expected_status_code = 200
+        expected_res_type = 'BulkTaskUpdate'
+
+        pending_task, concluded_task = create_mocked_tasks([
+            {"title": "bulk report 1"},
+            {"title": "bulk report 2", "status": TaskStatus.CONCLUDED},
+        ], self.user)
+        another_user_task = self.mock_another_user_tasks[0]
+        missing_task_id = 'c2370bd8-e526-4672-978c-040b762ecb8d'
+
+        self.request.data = [
+            {'task': str(pending_task.id)},
+            {'task': str(concluded_task.id)},
+            {'task': str(another_user_task.id)},
+            {'task': missing_task_id},
+        ]
+        # savepoint, fetch of owned ids, change sequence increment and
+        # read, one update, release
+        with self.assertNumQueries(6):
+            response = self.view.put(self.request)
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(expected_res_type, response.data.get('type'))
+        self.assertListEqual(
+            [str(another_user_task.id), missing_task_id],
+            response.data.get('notFound')
+        )
+        self.assertListEqual(
+            [str(concluded_task.id)], response.data.get('unchanged')
+        )
+
+        pending_task.refresh_from_db()
+        another_user_task.refresh_from_db()
+        self.assertEqual(TaskStatus.CONCLUDED, pending_task.status)
+        self.assertTrue(pending_task.updated_at)
+        self.assertEqual(TaskStatus.PENDING, another_user_task.status)
+
+    def test_get_cached_board(self):
+        """ When request the same board twice without writes between them \
+        Then the second response is served from the user board cache \
+        """
+
+        first_response = self.view.get(self.request)
+        with self.assertNumQueries(0):
+            second_response = self.view.get(self.request)
+
+        self.assertEqual(first_response.data, second_response.data)
+
+        another_request = HttpRequest()
+        another_request.user = self.another_user
+        with self.assertNumQueries(1):
+            self.view.get(another_request)
+
+    def test_get_after_write(self):
+        """ When request the board after creating a task \
+        Then the cached board is invalidated and the new task is returned \
+        """
+
+        expected_task_quantity = 3
+
+        self.view.get(self.request)
+        self.request.data = {"title": "Invalidar o cache do quadro"}
+        self.view.post(self.request)
+
+        response = self.view.get(self.request)
+
+        self.assertEqual(expected_task_quantity, len(response.data))
+
+    def test_get_not_modified(self):
+        """ When request the board with the ETag of the previous response \
+        Then returns not modified without querying the tasks \
+        """
+
+        expected_status_code = 304
+
+        response = self.view.get(self.request)
+        etag = response.headers.get('ETag')
+
+        self.request.method = 'GET'
+        self.request.META['HTTP_IF_NONE_MATCH'] = etag
+        with self.assertNumQueries(0):
+            response = self.view.get(self.request)
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(etag, response.headers.get('ETag'))
+
+    def test_get_etag_after_write(self):
+        """ When request the board with an ETag issued before a write \
+        Then returns the updated board with a new ETag \
+        """
+
+        expected_status_code = 200
+        expected_task_quantity = 3
+
+        etag = self.view.get(self.request).headers.get('ETag')
+        self.request.data = {"title": "Trocar o ETag do quadro"}
+        self.view.post(self.request)
+
+        self.request.method = 'GET'
+        self.request.META['HTTP_IF_NONE_MATCH'] = etag
+        response = self.view.get(self.request)
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(expected_task_quantity, len(response.data))
+        self.assertNotEqual(etag, response.headers.get('ETag'))
+
+    def test_get_etag_by_board(self):
+        """ When request boards with different filters or users \
+        Then each one has its own ETag \
+        """
+
+        pending_etag = self.view.get(self.request).headers.get('ETag')
+        self.request.query_params = {'status': 'CONCLUDED'}
+        concluded_etag = self.view.get(self.request).headers.get('ETag')
+
+        another_request = HttpRequest()
+        another_request.user = self.another_user
+        another_etag = self.view.get(another_request).headers.get('ETag')
+
+        self.assertEqual(3, len({pending_etag, concluded_etag, another_etag}))
+
+    def test_get_fields(self):
+        """ When request the board specifying the fields \
+        Then returns only them, without reading the other columns \
+        """
+
+        expected_status_code = 200
+        expected_task_keys = ['id', 'title', 'status']
+
+        self.request.query_params = {'fields': 'status,id, title'}
+        with CaptureQueriesContext(connection) as queries:
+            response = self.view.get(self.request)
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(2, len(response.data))
+        for task in response.data:
+            self.assertEqual(expected_task_keys, list(task.keys()))
+        self.assertNotIn('"description"', queries[0]['sql'].split('FROM')[0])
+
+    def test_get_fields_paginated(self):
+        """ When request pages of the board specifying the fields \
+        Then the pages are linked even without the createdAt field \
+        """
+
+        self.request.query_params = {'fields': 'title', 'limit': '1'}
+        first_page = self.view.get(self.request).data
+        self.request.query_params = {
+            'fields': 'title', 'limit': '1', 'cursor': first_page['nextCursor']
+        }
+        second_page = self.view.get(self.request).data
+
+        self.assertEqual(
+            [{'title': 'Criar a rota de autenticação'}], first_page['results']
+        )
+        self.assertEqual(
+            [{'title': 'Criar .env com as credenciais locais'}],
+            second_page['results'],
+        )
+
+    def test_get_with_invalid_fields(self):
+        """ When request the board with a field unknown by the serializer \
+        Then returns InvalidFieldsError \
+        """
+
+        expected_status_code = 400
+        expected_response_type = 'InvalidFieldsError'
+
+        self.request.query_params = {'fields': 'id,user,password'}
+        response = self.view.get(self.request)
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(expected_response_type, response.data.get("type"))
+
+    def test_get_streamed(self):
+        """ When request the board in stream mode \
+        Then returns the same tasks of the regular response in chunks \
+        """
+
+        expected_status_code = 200
+        expected_data = json.loads(
+            ORJSONRenderer().render(self.view.get(self.request).data)
+        )
+
+        self.request.query_params = {'stream': '1'}
+        response = self.view.get(self.request)
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertTrue(response.streaming)
+        content = b''.join(response.streaming_content).decode()
+        self.assertEqual(expected_data, json.loads(content))
+
+    def test_get_streamed_with_pagination(self):
+        """ When request the board in stream mode with limit or cursor \
+        Then returns InvalidStreamError instead of ignoring the pagination \
+        """
+
+        expected_status_code = 400
+        expected_response_type = 'InvalidStreamError'
+
+        for params in ({'limit': '1'}, {'cursor': 'abc'}):
+            self.request.query_params = {'stream': '1', **params}
+            response = self.view.get(self.request)
+
+            self.assertEqual(expected_status_code, response.status_code)
+            self.assertEqual(expected_response_type, response.data.get("type"))
+
+    def test_stream_task_rows_in_chunks(self):
+        """ When stream the task rows with a chunk smaller than the board \
+        Then each chunk is yielded separately and forms a valid JSON array \
+        """
+
+        expected_task_quantity = len(mock_tasks)
+        rows = Task.objects.filter(user=self.user).values_list(
+            *TASK_ROW_COLUMNS
+        )
+
+        parts = list(stream_task_rows(rows, chunk_size=1))
+
+        self.assertEqual(expected_task_quantity + 2, len(parts))
+        self.assertEqual(expected_task_quantity, len(json.loads(b''.join(parts))))
+
+    def test_post_bulk_tasks_with_invalid_items(self):
+        """ When request to create multiple tasks with invalid items \
+        Then no task is created and all the invalid items are reported \
+        """
+
+        expected_status_code = 400
+        expected_res_type = 'BatchValidationError'
+        expected_error_indexes = [1, 2]
+
+        self.request.data = [
+            {"title": "bulk invalid 1"},
+            {"title": "bulk invalid 2", "status": "done"},
+            {"description": "bulk invalid 3"},
+        ]
+
+        response = self.view.post(self.request)
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(expected_res_type, response.data.get('type'))
+        self.assertListEqual(
+            expected_error_indexes,
+            [error['index'] for error in response.data.get('errors')]
+        )
+        self.assertFalse(Task.objects.filter(title__icontains='bulk invalid'))
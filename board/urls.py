@@ -1,13 +1,35 @@
+from django.conf import settings
 from django.urls import path, re_path
 
-from .views import BoardManager
+from .views import (
+    BoardManager,
+    BoardImportManager,
+    BoardChangesManager,
+    BoardBatchManager,
+    BoardCacheStatsManager,
+)
+from .async_views import AsyncBoardManager
 from to_do_list_api.constants import UUID_REGEX
 
+board_manager = (
+    AsyncBoardManager.as_view()
+    if getattr(settings, 'BOARD_ASYNC_VIEWS', False)
+    else BoardManager.as_view()
+)
+
 urlpatterns = [
-    path("", BoardManager.as_view(), name="Board Manager"),
+    path("", board_manager, name="Board Manager"),
+    path("/import", BoardImportManager.as_view(), name="Board Import"),
+    path("/changes", BoardChangesManager.as_view(), name="Board Changes"),
+    path("/batch", BoardBatchManager.as_view(), name="Board Batch"),
+    path(
+        "/cache/stats",
+        BoardCacheStatsManager.as_view(),
+        name="Board Cache Stats",
+    ),
     re_path(
         rf"^/(?P<task_id>{UUID_REGEX})",
-        BoardManager.as_view(),
+        board_manager,
         name="Board Manager",
     ),
 ]
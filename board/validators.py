@@ -0,0 +1,170 @@
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from dataclasses_json import dataclass_json, LetterCase
+
+from .models import Task, TaskStatus
+
+TITLE_MAX_LENGTH = Task._meta.get_field('title').max_length
+STATUS_BY_NAME = {
+    name.upper(): task_status
+    for name, task_status in TaskStatus._member_map_.items()
+}
+
+
+@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass
+class TaskItemErrorMessage:
+    index: int
+    type: str
+    description: str
+
+
+class InvalidTaskItem(Exception):
+    """ Rejection of a single item of a bulk payload. Unlike the exceptions \
+    of the API it is not logged, since a payload may hold thousands of them \
+    """
+
+    def __init__(self, type: str, description: str) -> None:
+        self.type = type
+        self.description = description
+        super().__init__(description)
+
+
+def clean_status(value: Any, default: TaskStatus) -> TaskStatus:
+    if value is None:
+        return default
+    if isinstance(value, TaskStatus):
+        return value
+    task_status = (
+        STATUS_BY_NAME.get(value.upper()) if isinstance(value, str) else None
+    )
+    if task_status is None:
+        raise InvalidTaskItem(
+            "StatusDoesNotExistError", f"The status '{value}' is invalid"
+        )
+    return task_status
+
+
+def clean_object(item: Any) -> dict:
+    if not isinstance(item, dict):
+        raise InvalidTaskItem("WrongTypeError", "The item must be an object")
+    return item
+
+
+def clean_string(item: dict, field: str, required: bool) -> Optional[str]:
+    value = item.get(field)
+    if value is None:
+        if required:
+            raise InvalidTaskItem(
+                "MissingValueError", f'missing value for field "{field}"'
+            )
+        return None
+    if not isinstance(value, str):
+        raise InvalidTaskItem(
+            "WrongTypeError", f'The field "{field}" must be a string'
+        )
+    return value
+
+
+def clean_task_id(value: Any) -> str:
+    try:
+        return str(UUID(value))
+    except (AttributeError, TypeError, ValueError):
+        raise InvalidTaskItem(
+            "TaskDoesNotExistError", f"The task id '{value}' not exists"
+        )
+
+
+def clean_insert(item: Any) -> dict:
+    """ Returns the Task fields of an insertion item """
+
+    item = clean_object(item)
+    title = clean_string(item, 'title', required=True)
+    if len(title) > TITLE_MAX_LENGTH:
+        raise InvalidTaskItem(
+            "TitleTooLongError",
+            f"The title must have at most {TITLE_MAX_LENGTH} characters",
+        )
+    return {
+        'title': title,
+        'description': clean_string(item, 'description', required=False),
+        'status': clean_status(item.get('status'), TaskStatus.PENDING),
+    }
+
+
+def clean_status_update(item: Any, default_status: TaskStatus) -> tuple:
+    """ Returns the (task id, status) pair of a status update item """
+
+    item = clean_object(item)
+    task_id = clean_task_id(clean_string(item, 'task', required=True))
+    return task_id, clean_status(item.get('status'), default_status)
+
+
+BATCH_CREATE = 'create'
+BATCH_UPDATE = 'update'
+BATCH_CANCEL = 'cancel'
+BATCH_OPERATIONS = (BATCH_CREATE, BATCH_UPDATE, BATCH_CANCEL)
+
+
+def clean_operation(item: Any) -> tuple:
+    """ Returns the (operation, values) pair of a batch operation item, \
+    with the Task fields of a creation or the (task id, status) pair of an \
+    update or a cancelation \
+    """
+
+    item = clean_object(item)
+    operation = clean_string(item, 'op', required=True)
+    if operation == BATCH_CREATE:
+        return operation, clean_insert(item)
+    if operation == BATCH_UPDATE:
+        return operation, clean_status_update(item, TaskStatus.CONCLUDED)
+    if operation == BATCH_CANCEL:
+        task_id = clean_task_id(clean_string(item, 'task', required=True))
+        return operation, (task_id, TaskStatus.CANCELED)
+    raise InvalidTaskItem(
+        "InvalidOperationError",
+        f"The operation '{operation}' is invalid, use one of "
+        f"{', '.join(BATCH_OPERATIONS)}",
+    )
+
+
+def validate_batch(
+    items: List[Any], clean, *args, start: int = 0
+) -> Tuple[list, list]:
+    """ Cleans every item of the batch, collecting the cleaned values and \
+    the errors of all the invalid items with their index in the payload, \
+    counted from ``start`` when the batch is a chunk of it \
+    """
+
+    cleaned = []
+    errors = []
+    for index, item in enumerate(items, start=start):
+        try:
+            cleaned.append(clean(item, *args))
+        except InvalidTaskItem as e:
+            errors.append(TaskItemErrorMessage(
+                index=index, type=e.type, description=e.description
+            ))
+    return cleaned, errors
+
+
+def validate_inserts(
+    items: List[Any], start: int = 0
+) -> Tuple[List[dict], list]:
+    return validate_batch(items, clean_insert, start=start)
+
+
+def validate_status_updates(
+    items: List[Any], default_status: TaskStatus = TaskStatus.CONCLUDED
+) -> Tuple[List[tuple], list]:
+    return validate_batch(items, clean_status_update, default_status)
+
+
+def validate_task_ids(items: List[Any]) -> Tuple[List[str], list]:
+    return validate_batch(items, clean_task_id)
+
+
+def validate_operations(items: List[Any]) -> Tuple[List[tuple], list]:
+    return validate_batch(items, clean_operation)
@@ -1,59 +1,162 @@
-import json
+from typing import Callable
 
-from django.conf import settings
 from django.db import transaction
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
-from django.core.cache.backends.base import DEFAULT_TIMEOUT
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework import status
 from dacite.exceptions import MissingValueError
 from dacite import from_dict
 from dataclasses import asdict
 from drf_spectacular.utils import extend_schema
 
+from to_do_list_api.routers import read_from_replica, replica_reads
+
 from .messages import (
     TaskInsertDataMessage,
-    TaskInsertDataReturnMessage,
-    BulkTaskInsertDataReturnMessage,
+    TASK_INSERT_RETURN,
+    BULK_TASK_INSERT_RETURN,
     TaskFilterParamsDataMessage,
+    TaskPaginationParamsDataMessage,
+    TaskFieldsParamsDataMessage,
     TaskUpdateParamsDataMessage,
-    TaskUpdateDataReturnMessage,
-    BulkTaskUpdateDataReturnMessage,
+    TASK_UPDATE_RETURN,
+    BULK_TASK_UPDATE_RETURN,
     TaskCancelParamsDataMessage,
-    TaskCancelDataReturnMessage,
-    BulkTaskCancelDataReturnMessage,
+    TASK_CANCEL_RETURN,
+    BULK_TASK_CANCEL_RETURN,
+    build_report_message,
+    build_insert_report_message,
+    TaskBulkInsertParamsDataMessage,
+    TaskImportDataReturnMessage,
+    TaskBatchDataReturnMessage,
 )
 from .exceptions import (
     BaseException,
     MissingValueException,
     StatusDoesNotExistException,
     TaskDoesNotExistException,
+    InvalidCursorException,
+    InvalidChangeTokenException,
+    InvalidLimitException,
+    InvalidFieldsException,
+    InvalidStreamException,
+    StreamNotAcceptableException,
+    InvalidBodyException,
+    InvalidCommitModeException,
+    TitleTooLongException,
+    BatchValidationException,
+    BatchTooLargeException,
 )
-from .serializers import UserTasksSerializer
+from .serializers import serialize_task_rows, task_row_columns
 from .models import Task, TaskStatus
+from .pagination import (
+    BOARD_MAX_PAGE_SIZE,
+    KEYSET_ORDERING,
+    paginate_keyset,
+    paginate_offset,
+)
+from .search import BOARD_SEARCH_PAGE_SIZE, search_tasks
+from .cache import (
+    board_cache_report,
+    board_etag,
+    get_board_version,
+    get_or_build_board,
+    invalidate_board,
+)
+from .conditional import not_modified_response, set_board_validators
+from .streaming import (
+    is_stream_acceptable,
+    is_stream_requested,
+    stream_board_response,
+)
+from .importers import TaskImporter, open_import_stream
+from .bulk import (
+    BOARD_BATCH_MAX_OPERATIONS,
+    TaskBatchRunner,
+    TaskBulkInserter,
+    is_bulk_data,
+    read_request_data,
+)
+from .changes import list_task_changes
+from .shards import task_database
+from .validators import (
+    validate_operations,
+    validate_status_updates,
+    validate_task_ids,
+)
 from .schemas import (
     BoardManagerPostSchema,
     BoardManagerGetSchema,
     BoardManagerPutSchema,
-    BoardManagerDeleteSchema
+    BoardManagerDeleteSchema,
+    BoardImportSchema,
+    BoardChangesSchema,
+    BoardCacheStatsSchema,
+    BoardBatchSchema,
 )
 
-CACHE_TTL = getattr(settings, 'CACHE_TTL', DEFAULT_TIMEOUT)
-
 def cleanup_user_task_filter(params: dict) -> dict:
     filter = {}
     for param in params:
         params[param] and filter.update({param:params[param]})
     return filter
-          
+
+
+def task_row_keyset(columns: tuple) -> Callable[[tuple], tuple]:
+    created_at_index = columns.index('created_at')
+    return lambda row: (row[created_at_index], row[0])
+
+
+def build_task_board(user, task_id: str, fields: tuple = None) -> list:
+    rows = list(
+        user.tasks.filter(id=task_id).values_list(*task_row_columns(fields))
+    )
+    if not rows:
+        raise Task.DoesNotExist
+    return serialize_task_rows(rows, fields, native=True)
+
+
+def build_user_board(
+    user,
+    filters: dict,
+    pagination: TaskPaginationParamsDataMessage,
+    query: str = None,
+    fields: tuple = None,
+):
+    columns = task_row_columns(fields)
+    user_tasks = user.tasks.filter(**filters).values_list(*columns)
+
+    if query:
+        page, next_cursor = paginate_offset(
+            search_tasks(user_tasks, query),
+            pagination.limit or BOARD_SEARCH_PAGE_SIZE,
+            pagination.cursor,
+        )
+        return {
+            "results": serialize_task_rows(page, fields, native=True),
+            "nextCursor": next_cursor,
+        }
+
+    if pagination.is_paginated:
+        page, next_cursor = paginate_keyset(
+            user_tasks, pagination.limit, pagination.cursor,
+            task_row_keyset(columns),
+        )
+        return {
+            "results": serialize_task_rows(page, fields, native=True),
+            "nextCursor": next_cursor,
+        }
+
+    user_tasks = user_tasks.order_by(*KEYSET_ORDERING)
+    return serialize_task_rows(user_tasks, fields, native=True)
+
 
 class BoardManager(APIView):
     permission_classes = [IsAuthenticated]
 
     @extend_schema(
+        parameters=BoardManagerPostSchema.parameters,
         description=BoardManagerPostSchema.description,
         request={"application/json": BoardManagerPostSchema.request},
         responses=BoardManagerPostSchema.responses
@@ -61,44 +164,57 @@ class BoardManager(APIView):
     def post(self, request, **kwargs):
         try:
             try:
-                if isinstance(request.data, dict):
-                    new_task = from_dict(TaskInsertDataMessage, request.data)
+                request_data = read_request_data(request)
+                if isinstance(request_data, dict):
+                    new_task = from_dict(TaskInsertDataMessage, request_data)
                     
-                    with transaction.atomic():
-                        Task.objects.create(
-                            user=request.user,
-                            **new_task.to_dict()  
-                        )
+                    with transaction.atomic(
+                        using=task_database(request.user.id)
+                    ):
+                        request.user.tasks.create(**new_task.to_dict())
+
+                    invalidate_board(request.user.id)
 
                     return Response(
-                        json.loads(TaskInsertDataReturnMessage().to_json()),
+                        TASK_INSERT_RETURN,
                         status=status.HTTP_200_OK
                     )
 
-                elif isinstance(request.data, list):
-                    new_tasks = []
-                    for task in request.data:
-                        data_task = from_dict(TaskInsertDataMessage, task)
-                        new_tasks.append(data_task)
-
-                    bulk_tasks = []
-                    with transaction.atomic():
-                        for task in new_tasks:
-                            bulk_tasks.append(Task(
-                                user=request.user,
-                                **task.to_dict()
-                            ))
-                        Task.objects.bulk_create(bulk_tasks)
+                elif is_bulk_data(request_data):
+                    params = from_dict(
+                        TaskBulkInsertParamsDataMessage,
+                        getattr(request, 'query_params', {}),
+                    )
+                    inserter = TaskBulkInserter(
+                        request.user, commit=params.commit
+                    )
+                    try:
+                        inserter.run(request_data)
+                    finally:
+                        inserter.inserted and invalidate_board(request.user.id)
 
+                    if inserter.atomic:
+                        return Response(
+                            BULK_TASK_INSERT_RETURN,
+                            status=status.HTTP_200_OK
+                        )
                     return Response(
-                        json.loads(BulkTaskInsertDataReturnMessage().to_json()),
+                        build_insert_report_message(
+                            BULK_TASK_INSERT_RETURN, inserter
+                        ),
                         status=status.HTTP_200_OK
                     )
 
             except MissingValueError as e:
                 message = MissingValueException(str(e)).message
                 return Response(message, status=status.HTTP_400_BAD_REQUEST)
-            except StatusDoesNotExistException as e:
+            except (
+                StatusDoesNotExistException,
+                TitleTooLongException,
+                BatchValidationException,
+                InvalidBodyException,
+                InvalidCommitModeException,
+            ) as e:
                 return Response(e.message, status=status.HTTP_400_BAD_REQUEST)
 
         except Exception as e:
@@ -113,20 +229,48 @@ class BoardManager(APIView):
         responses=[],
         examples=BoardManagerGetSchema.examples,
     )
-    @method_decorator(cache_page(CACHE_TTL))
+    @replica_reads
     def get(self, request, **kwargs):
         try:
             task_id = kwargs.get('task_id')
+            version = get_board_version(request.user.id)
+            read_from_replica(request.user.id)
             if task_id:
                 try:
-                    user_tasks = [Task.objects.get(
-                        id=task_id, user=request.user
-                    )]
+                    data = (request.query_params
+                        if hasattr(request, 'query_params') else dict()
+                )
+                    fields = from_dict(
+                        TaskFieldsParamsDataMessage, data
+                    ).fields
+                    board_params = {'task_id': task_id, 'fields': fields}
+                    etag = board_etag(
+                        request.user.id,
+                        board_params,
+                        version,
+                        getattr(request, 'accepted_media_type', None),
+                    )
+                    not_modified = not_modified_response(request, etag)
+                    if not_modified:
+                        return not_modified
+
+                    board = get_or_build_board(
+                        request.user.id,
+                        board_params,
+                        lambda: build_task_board(
+                            request.user, task_id, fields
+                        ),
+                        version,
+                    )
                 except Task.DoesNotExist as e:
                     message = TaskDoesNotExistException(task_id).message
                     return Response(
                         message, status=status.HTTP_400_BAD_REQUEST
                     )
+                except InvalidFieldsException as e:
+                    return Response(
+                        e.message, status=status.HTTP_400_BAD_REQUEST
+                    )
             else:
                 try:
                     data = (request.query_params 
@@ -135,16 +279,74 @@ class BoardManager(APIView):
                     params = from_dict(
                         TaskFilterParamsDataMessage, data
                     )
+                    pagination = from_dict(
+                        TaskPaginationParamsDataMessage, data
+                    )
                     filters = cleanup_user_task_filter(asdict(params))
-                    user_tasks = request.user.tasks.filter(**filters)
-                except StatusDoesNotExistException as e:
+                    fields = from_dict(
+                        TaskFieldsParamsDataMessage, data
+                    ).fields
+                    query = data.get('q')
+                    stream = is_stream_requested(data) and not query
+                    if stream and pagination.is_paginated:
+                        raise InvalidStreamException()
+                    media_type = getattr(request, 'accepted_media_type', None)
+                    if stream and not is_stream_acceptable(media_type):
+                        message = StreamNotAcceptableException(
+                            media_type
+                        ).message
+                        return Response(
+                            message, status=status.HTTP_406_NOT_ACCEPTABLE
+                        )
+                    board_params = {
+                        **filters,
+                        **asdict(pagination),
+                        'q': query,
+                        'stream': stream,
+                        'fields': fields,
+                    }
+                    etag = board_etag(
+                        request.user.id,
+                        board_params,
+                        version,
+                        getattr(request, 'accepted_media_type', None),
+                    )
+                    not_modified = not_modified_response(request, etag)
+                    if not_modified:
+                        return not_modified
+
+                    if stream:
+                        return set_board_validators(
+                            stream_board_response(
+                                request.user.tasks.filter(**filters)
+                                .values_list(*task_row_columns(fields))
+                                .order_by(*KEYSET_ORDERING),
+                                fields,
+                            ),
+                            etag,
+                        )
+
+                    board = get_or_build_board(
+                        request.user.id,
+                        board_params,
+                        lambda: build_user_board(
+                            request.user, filters, pagination, query, fields
+                        ),
+                        version,
+                    )
+                except (
+                    StatusDoesNotExistException,
+                    InvalidCursorException,
+                    InvalidLimitException,
+                    InvalidFieldsException,
+                    InvalidStreamException,
+                ) as e:
                     return Response(
                         e.message, status=status.HTTP_400_BAD_REQUEST
                     )
 
-            user_tasks_serialized = UserTasksSerializer(user_tasks, many=True)
-            return Response(
-                user_tasks_serialized.data, status=status.HTTP_200_OK
+            return set_board_validators(
+                Response(board, status=status.HTTP_200_OK), etag
             )
                 
         except Exception as e:
@@ -177,37 +379,45 @@ class BoardManager(APIView):
                             message, status=status.HTTP_400_BAD_REQUEST
                         )
                     
-                    with transaction.atomic():
+                    with transaction.atomic(
+                        using=task_database(request.user.id)
+                    ):
                         update_task.task.update_status(update_task.status)
 
+                    invalidate_board(request.user.id)
+
                     return Response(
-                        json.loads(TaskUpdateDataReturnMessage().to_json()),
+                        TASK_UPDATE_RETURN,
                         status=status.HTTP_200_OK
                     )
 
                 elif isinstance(request.data, list):
-                    update_tasks = []
-                    for task in request.data:
-                        task['user'] = request.user
-                        new_params = from_dict(
-                            TaskUpdateParamsDataMessage, task
+                    update_tasks, errors = validate_status_updates(
+                        request.data
+                    )
+                    if errors:
+                        raise BatchValidationException(errors)
+
+                    with transaction.atomic(
+                        using=task_database(request.user.id)
+                    ):
+                        report = request.user.tasks.bulk_update_status(
+                            update_tasks
                         )
-                        update_tasks.append(new_params)
 
-                    update_task: TaskUpdateParamsDataMessage
-                    with transaction.atomic():
-                        for update_task in update_tasks:
-                            update_task.task.update_status(update_task.status)
+                    invalidate_board(request.user.id)
 
                     return Response(
-                        json.loads(BulkTaskUpdateDataReturnMessage().to_json()),
+                        build_report_message(BULK_TASK_UPDATE_RETURN, report),
                         status=status.HTTP_200_OK
                     )
 
             except MissingValueError as e:
                 message = MissingValueException(str(e)).message
                 return Response(message, status=status.HTTP_400_BAD_REQUEST)
-            except StatusDoesNotExistException as e:
+            except (
+                StatusDoesNotExistException, BatchValidationException
+            ) as e:
                 return Response(e.message, status=status.HTTP_400_BAD_REQUEST)
                 
         except Exception as e:
@@ -238,39 +448,185 @@ class BoardManager(APIView):
                             message, status=status.HTTP_400_BAD_REQUEST
                         )
 
-                    with transaction.atomic():
+                    with transaction.atomic(
+                        using=task_database(request.user.id)
+                    ):
                         cancel_task.task.update_status(TaskStatus.CANCELED)
 
+                    invalidate_board(request.user.id)
+
                     return Response(
-                        json.loads(TaskCancelDataReturnMessage().to_json()),
+                        TASK_CANCEL_RETURN,
                         status=status.HTTP_200_OK
                     )
 
                 elif isinstance(request.data, list):
-                    update_tasks = []
-                    for task_id in request.data:
-                        new_params = from_dict(
-                            TaskUpdateParamsDataMessage,
-                            {'task': task_id, 'user': request.user}
+                    task_ids, errors = validate_task_ids(request.data)
+                    if errors:
+                        raise BatchValidationException(errors)
+
+                    with transaction.atomic(
+                        using=task_database(request.user.id)
+                    ):
+                        report = request.user.tasks.bulk_update_status(
+                            (task_id, TaskStatus.CANCELED)
+                            for task_id in task_ids
                         )
-                        update_tasks.append(new_params)
 
-                    update_task: TaskUpdateParamsDataMessage
-                    with transaction.atomic():
-                        for update_task in update_tasks:
-                            update_task.task.update_status(TaskStatus.CANCELED)
+                    invalidate_board(request.user.id)
 
                     return Response(
-                        json.loads(BulkTaskCancelDataReturnMessage().to_json()),
+                        build_report_message(BULK_TASK_CANCEL_RETURN, report),
                         status=status.HTTP_200_OK
                     )
 
             except MissingValueError as e:
                 message = MissingValueException(str(e)).message
                 return Response(message, status=status.HTTP_400_BAD_REQUEST)
+            except BatchValidationException as e:
+                return Response(e.message, status=status.HTTP_400_BAD_REQUEST)
                 
         except Exception as e:
                 return Response(
                     BaseException(str(e)).message,
                     status=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 )
+
+
+class BoardImportManager(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        description=BoardImportSchema.description,
+        request=BoardImportSchema.request,
+        responses=BoardImportSchema.responses,
+    )
+    def post(self, request, **kwargs):
+        try:
+            lines = open_import_stream(
+                request.stream or [],
+                request.META.get('HTTP_CONTENT_ENCODING'),
+            )
+            importer = TaskImporter(request.user)
+            try:
+                importer.run(lines)
+            finally:
+                importer.imported and invalidate_board(request.user.id)
+
+            return Response(
+                TaskImportDataReturnMessage(
+                    importer.imported, importer.failed, importer.errors
+                ).to_dict(encode_json=True),
+                status=status.HTTP_200_OK
+            )
+
+        except Exception as e:
+            return Response(
+                BaseException(str(e)).message,
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+
+class BoardBatchManager(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        description=BoardBatchSchema.description,
+        request=BoardBatchSchema.request,
+        responses=BoardBatchSchema.responses,
+    )
+    def post(self, request, **kwargs):
+        try:
+            try:
+                request_data = request.data if hasattr(request, 'data') else {}
+                if not isinstance(request_data, list):
+                    raise InvalidBodyException(
+                        'The batch must be a list of operations'
+                    )
+                if (not request_data
+                        or len(request_data) > BOARD_BATCH_MAX_OPERATIONS):
+                    raise BatchTooLargeException(BOARD_BATCH_MAX_OPERATIONS)
+
+                operations, errors = validate_operations(request_data)
+                if errors:
+                    raise BatchValidationException(errors)
+
+                runner = TaskBatchRunner(request.user)
+                results = runner.run(operations)
+                if runner.changed:
+                    invalidate_board(request.user.id)
+
+                return Response(
+                    TaskBatchDataReturnMessage(results).to_dict(
+                        encode_json=True
+                    ),
+                    status=status.HTTP_200_OK
+                )
+
+            except (
+                InvalidBodyException,
+                BatchTooLargeException,
+                BatchValidationException,
+            ) as e:
+                return Response(e.message, status=status.HTTP_400_BAD_REQUEST)
+
+        except Exception as e:
+            return Response(
+                BaseException(str(e)).message,
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+class BoardChangesManager(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        parameters=BoardChangesSchema.parameters,
+        description=BoardChangesSchema.description,
+        responses=[],
+        examples=BoardChangesSchema.examples,
+    )
+    def get(self, request, **kwargs):
+        try:
+            try:
+                data = (request.query_params
+                        if hasattr(request, 'query_params') else dict()
+                )
+                pagination = from_dict(TaskPaginationParamsDataMessage, data)
+                changes = list_task_changes(
+                    request.user.tasks.all(),
+                    data.get('since'),
+                    pagination.limit or BOARD_MAX_PAGE_SIZE,
+                )
+                return Response(changes, status=status.HTTP_200_OK)
+
+            except (
+                InvalidChangeTokenException,
+                InvalidLimitException,
+            ) as e:
+                return Response(e.message, status=status.HTTP_400_BAD_REQUEST)
+
+        except Exception as e:
+            return Response(
+                BaseException(str(e)).message,
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+class BoardCacheStatsManager(APIView):
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        description=BoardCacheStatsSchema.description,
+        responses=[],
+        examples=BoardCacheStatsSchema.examples,
+    )
+    def get(self, request, **kwargs):
+        try:
+            return Response(board_cache_report(), status=status.HTTP_200_OK)
+
+        except Exception as e:
+            return Response(
+                BaseException(str(e)).message,
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
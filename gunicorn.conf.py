@@ -0,0 +1,17 @@
+import os
+import time
+
+# Set by start-server.sh, falls back to the moment gunicorn read this file
+BOOT_STARTED_AT = float(os.environ.get("BOOT_STARTED_AT") or time.time())
+
+
+def boot_elapsed():
+    return time.time() - BOOT_STARTED_AT
+
+
+def when_ready(server):
+    server.log.info("Master ready in %.3fs (application preloaded)", boot_elapsed())
+
+
+def post_worker_init(worker):
+    worker.log.info("Worker %s serving in %.3fs", worker.pid, boot_elapsed())
@@ -0,0 +1,15 @@
+#!/usr/bin/env sh
+
+# One-shot release step, runs once per deploy before the api replicas start
+# (see the release service in docker-compose.yml), so start-server.sh only
+# has to bind gunicorn
+
+if ! python manage.py test --k; then
+    echo '[ ALERT: Application not pass in the tests. ]'
+    exit 1
+else
+    echo '[ INFO: Success in all tests of the Application. ]'
+fi
+
+python manage.py migrate --noinput
+python manage.py migrate_task_shards
@@ -3,24 +3,38 @@
 
 NAME="to_do_list_api"
 DJANGO_WSGI_MODULE=to_do_list_api.wsgi
+DJANGO_ASGI_MODULE=to_do_list_api.asgi
 NUM_WORKERS=3
+SERVER_MODE=${SERVER_MODE:-wsgi}
 
-if ! python manage.py test --k; then
-    echo '[ ALERT: Application not pass in the tests. ]'
-    exit 1
+# Tests and migrations run in release.sh, the boot time reported by
+# gunicorn.conf.py is measured from here
+export BOOT_STARTED_AT=$(date +%s.%N)
+
+if [ "${SERVER_MODE}" = "asgi" ]; then
+    # Async board views served by uvicorn workers, each worker holds many
+    # in-flight requests on its event loop instead of one per thread
+    gunicorn ${DJANGO_ASGI_MODULE}:application \
+        --name ${NAME} \
+        --config gunicorn.conf.py \
+        --preload \
+        --timeout 120 \
+        --workers ${NUM_WORKERS} \
+        --worker-class uvicorn.workers.UvicornWorker \
+        --bind 0.0.0.0:8000 \
+        --log-config gunicorn.conf \
+        --log-syslog-prefix gunicorn \
+        --log-level=info
 else
-    echo '[ INFO: Success in all tests of the Application. ]'
+    gunicorn ${DJANGO_WSGI_MODULE}:application \
+        --name ${NAME} \
+        --config gunicorn.conf.py \
+        --preload \
+        --timeout 120 \
+        --workers ${NUM_WORKERS} \
+        --threads 2 \
+        --bind 0.0.0.0:8000 \
+        --log-config gunicorn.conf \
+        --log-syslog-prefix gunicorn \
+        --log-level=info
 fi
-
-python manage.py makemigrations
-python manage.py migrate
-
-gunicorn ${DJANGO_WSGI_MODULE}:application \
-    --name ${NAME} \
-    --timeout 120 \
-    --workers ${NUM_WORKERS} \
-    --threads 2 \
-    --bind 0.0.0.0:8000 \
-    --log-config gunicorn.conf \
-    --log-syslog-prefix gunicorn \
-    --log-level=info
\ No newline at end of file
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class ToDoListApiConfig(AppConfig):
+    name = 'to_do_list_api'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'to_do_list_api.settings.base')
 
 application = get_asgi_application()
+
+# Loaded once in the gunicorn master with --preload, the workers inherit it
+from to_do_list_api.boot import warm_up  # noqa: E402
+
+warm_up()
@@ -1,5 +1,114 @@
+import hashlib
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core import signing
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
 from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from .lru import LRUCache
+from .tokens import (
+    build_deferred_user,
+    is_signed_token,
+    is_signed_token_revoked,
+    verify_signed_token,
+)
+
+AUTH_CACHE_TTL = getattr(settings, 'AUTH_CACHE_TTL', 60 * 5)
+AUTH_CACHE_LOCAL_TTL = getattr(settings, 'AUTH_CACHE_LOCAL_TTL', 10)
+AUTH_CACHE_LOCAL_SIZE = getattr(settings, 'AUTH_CACHE_LOCAL_SIZE', 10000)
+
+# Credentials resolved by this worker, checked before the shared cache. A
+# revoked token is only dropped here by the worker handling the revocation,
+# the others keep accepting it for up to AUTH_CACHE_LOCAL_TTL seconds
+local_credentials_cache = LRUCache(AUTH_CACHE_LOCAL_SIZE, AUTH_CACHE_LOCAL_TTL)
+
+
+def credentials_cache_key(key: str) -> str:
+    return f'auth:token:{hashlib.sha256(key.encode()).hexdigest()}'
+
+
+def invalidate_credentials(key: str) -> None:
+    cache_key = credentials_cache_key(key)
+    local_credentials_cache.delete(cache_key)
+    cache.delete(cache_key)
+
+
+@dataclass
+class CachedCredentials:
+    """ Cached projection of a database token, without the password hash \
+    or any other field of the user \
+    """
+
+    user_id: int
+    username: str
+    is_staff: bool
+    is_superuser: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> 'CachedCredentials':
+        return cls(user.pk, user.username, user.is_staff, user.is_superuser)
+
+    def build(self, key: str) -> tuple:
+        user = build_deferred_user({
+            'id': self.user_id,
+            'username': self.username,
+            'is_active': True,
+            'is_staff': self.is_staff,
+            'is_superuser': self.is_superuser,
+        })
+        token = Token.from_db(None, ['key', 'user_id'], [key, self.user_id])
+        token.user = user
+        return user, token
 
 
 class BearerAuthentication(TokenAuthentication):
-    keyword = "Bearer"
\ No newline at end of file
+    keyword = "Bearer"
+
+
+class CachedBearerAuthentication(BearerAuthentication):
+    """ Bearer authentication that resolves the token to its user through an \
+    in-process LRU and then the shared cache before querying the database. \
+    The cache keys are hashes of the tokens, never the tokens themselves, \
+    and the values only the CachedCredentials of the user \
+    """
+
+    def authenticate_credentials(self, key):
+        cache_key = credentials_cache_key(key)
+        credentials = local_credentials_cache.get(cache_key)
+        if credentials is None:
+            credentials = cache.get(cache_key)
+            if credentials is None:
+                user, token = super().authenticate_credentials(key)
+                credentials = CachedCredentials.from_user(user)
+                cache.set(cache_key, credentials, AUTH_CACHE_TTL)
+                local_credentials_cache.set(cache_key, credentials)
+                return user, token
+            local_credentials_cache.set(cache_key, credentials)
+        return credentials.build(key)
+
+
+class SignedBearerAuthentication(CachedBearerAuthentication):
+    """ Bearer authentication accepting the HMAC signed tokens, verified \
+    without the database, as well as the database stored ones \
+    """
+
+    def authenticate_credentials(self, key):
+        if not is_signed_token(key):
+            return super().authenticate_credentials(key)
+
+        try:
+            claims = verify_signed_token(key)
+        except signing.SignatureExpired:
+            raise exceptions.AuthenticationFailed(_('Token expired.'))
+        except signing.BadSignature:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if is_signed_token_revoked(claims):
+            raise exceptions.AuthenticationFailed(_('Token revoked.'))
+
+        return (claims.build_user(), claims)
@@ -1,7 +1,6 @@
 import logging
-import json
 
-from to_do_list_api.messages import ErrorMessage
+from to_do_list_api.messages import build_error_message
 
 logg = logging.getLogger(__name__)
 
@@ -20,7 +19,7 @@ class BaseException(Exception):
         super().__init__(self.message)
 
     def build_message(self, message) -> dict:
-        return json.loads(ErrorMessage(description=message, type=self.name).to_json())
+        return build_error_message(message, type=self.name)
 
     def log(self, message=None, **kwargs) -> None:
         logg.log(self.level, message or self.message, exc_info=self.exc_info, **kwargs)
\ No newline at end of file
@@ -1,6 +1,12 @@
+import json
 from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
 from dataclasses_json import dataclass_json, LetterCase
 
+ERROR_MESSAGE = "An Error ocurred"
+
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
 @dataclass
@@ -21,6 +27,22 @@ class ErrorMessage(ReturnBaseMessage):
     def __init__(self, *, description: str, type: str = "Error"):
         super().__init__(
             type=type,
-            message="An Error ocurred",
+            message=ERROR_MESSAGE,
             description=description,
-        )
\ No newline at end of file
+        )
+
+
+def build_constant_message(message: BaseMessage) -> Mapping:
+    """ Serializes a message once, for responses whose body never changes, \
+    as a read only mapping safe to share between requests \
+    """
+
+    return MappingProxyType(json.loads(message.to_json()))
+
+
+def build_error_message(description: str, type: str = "Error") -> dict:
+    """ Builds the same body of ErrorMessage(...).to_json() without the \
+    serialization round trip \
+    """
+
+    return {"type": type, "message": ERROR_MESSAGE, "description": description}
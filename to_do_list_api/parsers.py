@@ -0,0 +1,25 @@
+import msgpack
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class ORJSONParser(BaseParser):
+    media_type = 'application/json'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as e:
+            raise ParseError(f'JSON parse error - {e}')
+
+
+class MessagePackParser(BaseParser):
+    media_type = 'application/msgpack'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            # Timestamps are unpacked as aware datetimes
+            return msgpack.unpackb(stream.read(), timestamp=3)
+        except (TypeError, ValueError, msgpack.UnpackException) as e:
+            raise ParseError(f'MessagePack parse error - {e}')
@@ -0,0 +1,36 @@
+import msgpack
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# orjson encodes UUIDs and datetimes natively, UTC datetimes ending with Z
+# as the REST framework encoder does
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+# Types unknown by orjson and msgpack, as read only mappings of the constant
+# messages and lazy translations, fall back to the REST framework encoder
+encode_default = JSONEncoder().default
+
+
+class ORJSONRenderer(BaseRenderer):
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=encode_default, option=ORJSON_OPTIONS)
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        # Aware datetimes are packed as the Timestamp extension type
+        return msgpack.packb(data, default=encode_default, datetime=True)
@@ -0,0 +1,122 @@
+import asyncio
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+# Database the reads of the current request are sent to, None (the primary)
+# outside of the views decorated with replica_reads
+read_database: ContextVar[Optional[str]] = ContextVar(
+    'read_database', default=None
+)
+
+
+def replica_aliases() -> List[str]:
+    return list(getattr(settings, 'DATABASE_REPLICAS', []))
+
+
+def read_your_writes_window() -> int:
+    return getattr(settings, 'READ_YOUR_WRITES_WINDOW', 10)
+
+
+def pinned_key(user_id: int) -> str:
+    return f'db:{user_id}:pinned'
+
+
+def pin_to_primary(user_id: int) -> None:
+    """ Sends the reads of the user to the primary for the \
+    read-your-writes window, while the replicas catch up with their write \
+    """
+
+    if replica_aliases():
+        cache.set(pinned_key(user_id), True, read_your_writes_window())
+
+
+async def apin_to_primary(user_id: int) -> None:
+    if replica_aliases():
+        await cache.aset(pinned_key(user_id), True, read_your_writes_window())
+
+
+def choose_read_database(user_id: int, pinned: bool) -> str:
+    replicas = replica_aliases()
+    if pinned or not replicas:
+        return DEFAULT_DB_ALIAS
+    return random.choice(replicas)
+
+
+@contextmanager
+def use_read_database(alias: str):
+    token = read_database.set(alias)
+    try:
+        yield alias
+    finally:
+        read_database.reset(token)
+
+
+def read_from_replica(user_id: int) -> str:
+    """ Sends the next reads of the view decorated with replica_reads to a \
+    replica, unless the user wrote within the read-your-writes window. \
+    Called once the board version is read: the writers pin themselves \
+    before bumping the version, so a request reading the new version also \
+    sees the pin and never builds it from a lagging replica \
+    """
+
+    pinned = bool(replica_aliases()) and bool(cache.get(pinned_key(user_id)))
+    alias = choose_read_database(user_id, pinned)
+    read_database.set(alias)
+    return alias
+
+
+async def aread_from_replica(user_id: int) -> str:
+    pinned = bool(replica_aliases()) and bool(
+        await cache.aget(pinned_key(user_id))
+    )
+    alias = choose_read_database(user_id, pinned)
+    read_database.set(alias)
+    return alias
+
+
+def replica_reads(view):
+    """ Scopes the database chosen by read_from_replica to the decorated \
+    view method, whose reads stay on the primary until it is called. \
+    Streamed bodies are read after the view returns, so they fall back to \
+    the primary \
+    """
+
+    if asyncio.iscoroutinefunction(view):
+        @wraps(view)
+        async def async_wrapper(self, request, *args, **kwargs):
+            with use_read_database(DEFAULT_DB_ALIAS):
+                return await view(self, request, *args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(view)
+    def wrapper(self, request, *args, **kwargs):
+        with use_read_database(DEFAULT_DB_ALIAS):
+            return view(self, request, *args, **kwargs)
+
+    return wrapper
+
+
+class ReplicaRouter:
+    """ Sends every write to the primary and the reads to the database \
+    chosen by read_from_replica, the primary by default \
+    """
+
+    def db_for_read(self, model, **hints):
+        return read_database.get() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
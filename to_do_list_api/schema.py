@@ -0,0 +1,45 @@
+from functools import lru_cache
+from typing import Optional
+
+import orjson
+from django.conf import settings
+from drf_spectacular.views import SpectacularAPIView
+from rest_framework.response import Response
+
+
+@lru_cache(maxsize=None)
+def read_schema_file(path: str) -> Optional[dict]:
+    try:
+        with open(path, 'rb') as schema_file:
+            return orjson.loads(schema_file.read())
+    except FileNotFoundError:
+        return None
+
+
+def load_prebuilt_schema() -> Optional[dict]:
+    """ Returns the OpenAPI document generated at build time, parsed once \
+    per process, or None when there is none \
+    """
+
+    path = getattr(settings, 'OPENAPI_SCHEMA_FILE', None)
+    if not path:
+        return None
+    return read_schema_file(str(path))
+
+
+class PrebuiltSpectacularAPIView(SpectacularAPIView):
+    """ Serves the OpenAPI document generated by `manage.py spectacular` at
+    build time, the schema is only generated per request when the file is
+    missing (local development)
+    """
+
+    def _get_schema_response(self, request):
+        schema = load_prebuilt_schema()
+        if schema is None:
+            return super()._get_schema_response(request)
+
+        version = self.api_version or request.version or self._get_version_parameter(request)
+        return Response(
+            data=schema,
+            headers={"Content-Disposition": f'inline; filename="{self._get_filename(request, version)}"'}
+        )
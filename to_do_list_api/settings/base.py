@@ -27,6 +27,7 @@ INSTALLED_APPS = [
     'rest_framework',
     "rest_framework.authtoken",
     'drf_spectacular',
+    'to_do_list_api.apps.ToDoListApiConfig',
     'board',
 ]
 
@@ -60,6 +61,12 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'to_do_list_api.wsgi.application'
 
+ASGI_APPLICATION = 'to_do_list_api.asgi.application'
+
+# Serves the board endpoints with the async views when the server runs in
+# ASGI mode, see start-server.sh
+BOARD_ASYNC_VIEWS = os.getenv("SERVER_MODE", "wsgi") == "asgi"
+
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
@@ -75,6 +82,33 @@ DATABASES = {
     }
 }
 
+# Read replicas of the primary, comma separated hosts. The board reads go to
+# a replica unless the user wrote in the last READ_YOUR_WRITES_WINDOW seconds
+DATABASE_REPLICAS = []
+for index, host in enumerate(
+    host for host in os.getenv("DATABASE_REPLICA_HOSTS", "").split(",") if host
+):
+    alias = f"replica_{index + 1}"
+    DATABASES[alias] = {**DATABASES["default"], "HOST": host}
+    DATABASE_REPLICAS.append(alias)
+
+# Task databases, comma separated hosts. The tasks of each user live in one
+# of them (see board/shards.py), the other tables stay in the default one
+TASK_SHARDS = []
+for index, host in enumerate(
+    host for host in os.getenv("TASK_SHARD_HOSTS", "").split(",") if host
+):
+    alias = f"tasks_{index + 1}"
+    DATABASES[alias] = {**DATABASES["default"], "HOST": host}
+    TASK_SHARDS.append(alias)
+
+DATABASE_ROUTERS = [
+    "board.shards.TaskShardRouter",
+    "to_do_list_api.routers.ReplicaRouter",
+]
+
+READ_YOUR_WRITES_WINDOW = int(os.getenv("READ_YOUR_WRITES_WINDOW", 10))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -119,10 +153,21 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "to_do_list_api.authentications.BearerAuthentication",
+        "to_do_list_api.authentications.SignedBearerAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAdminUser"),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    "DEFAULT_RENDERER_CLASSES": (
+        "to_do_list_api.renderers.ORJSONRenderer",
+        "to_do_list_api.renderers.MessagePackRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "to_do_list_api.parsers.ORJSONParser",
+        "to_do_list_api.parsers.MessagePackParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
 
 CACHES = {
@@ -136,6 +181,37 @@ CACHES = {
     }
 }
 
+AUTH_CACHE_TTL = 60 * 5
+AUTH_CACHE_LOCAL_TTL = 10
+AUTH_CACHE_LOCAL_SIZE = 10000
+
+# Per worker tier of the board cache in front of Redis, see board/cache.py
+BOARD_CACHE_LOCAL_TTL = 60
+BOARD_CACHE_LOCAL_SIZE = 1000
+BOARD_CACHE_LOCAL_MAX_TASKS = 1000
+BOARD_VERSION_LOCAL_TTL = int(os.getenv("BOARD_VERSION_LOCAL_TTL", 0))
+
+# Stampede protection of the board cache: expired boards are served for up
+# to BOARD_CACHE_STALE_TTL seconds while a single request rebuilds them, and
+# the requests without a board wait up to BOARD_CACHE_LOCK_WAIT seconds
+BOARD_CACHE_STALE_TTL = 30
+BOARD_CACHE_LOCK_TIMEOUT = 10
+BOARD_CACHE_LOCK_WAIT = 2
+
+# Signed bearer tokens, the fallback keys keep the tokens signed with the
+# previous keys valid while they are rotated
+SIGNED_TOKEN_MAX_AGE = 60 * 60
+SIGNED_TOKEN_KEY = os.getenv("SIGNED_TOKEN_KEY")
+SIGNED_TOKEN_KEY_FALLBACKS = [
+    key for key in os.getenv("SIGNED_TOKEN_KEY_FALLBACKS", "").split(",") if key
+]
+
+# OpenAPI document generated at build time (see Dockerfile), served by
+# /api/schema/ instead of generating it on each request
+OPENAPI_SCHEMA_FILE = os.getenv(
+    "OPENAPI_SCHEMA_FILE", os.path.join(ENV_DIR, "openapi.json")
+)
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'To-Do List API',
     'DESCRIPTION': "This API manages the user's task board",
@@ -6,4 +6,4 @@ from to_do_list_api.settings.base import *
 DEBUG = False
 ALLOWED_HOSTS = ["localhost"]
 BASE_DIR = os.path.dirname(os.path.realpath(os.path.dirname(__file__) + "/.."))
-CACHE_TTL = 30 #60 * 15 I set the TTL to 30 seconds to validate the data
\ No newline at end of file
+CACHE_TTL = 60 * 15
\ No newline at end of file
@@ -0,0 +1,18 @@
+import os
+
+from to_do_list_api.settings.local import *
+
+# Local primary and replica on two SQLite databases. Nothing replicates the
+# primary into the replica, so it behaves as a replica lagging behind:
+#   DJANGO_SETTINGS_MODULE=to_do_list_api.settings.replicas python manage.py test
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.path.join(ENV_DIR, "db.sqlite3"),
+    },
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.path.join(ENV_DIR, "db-replica.sqlite3"),
+    },
+}
+DATABASE_REPLICAS = ["replica"]
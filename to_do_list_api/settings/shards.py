@@ -0,0 +1,21 @@
+import os
+
+from to_do_list_api.settings.local import *
+
+# Local default database and two task databases on SQLite:
+#   DJANGO_SETTINGS_MODULE=to_do_list_api.settings.shards python manage.py test board.tests.test_shards
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.path.join(ENV_DIR, "db.sqlite3"),
+    },
+    "tasks_1": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.path.join(ENV_DIR, "db-tasks-1.sqlite3"),
+    },
+    "tasks_2": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.path.join(ENV_DIR, "db-tasks-2.sqlite3"),
+    },
+}
+TASK_SHARDS = ["tasks_1", "tasks_2"]
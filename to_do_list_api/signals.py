@@ -0,0 +1,52 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .authentications import invalidate_credentials
+from .tokens import revoke_user_signed_tokens
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance: Token, **kwargs):
+    invalidate_credentials(instance.key)
+
+
+# Fields whose change must log the user out of every session
+SECURITY_FIELDS = ('password', 'is_active', 'is_staff', 'is_superuser')
+
+
+def security_fields_changed(instance: User, update_fields=None) -> bool:
+    fields = [
+        field for field in SECURITY_FIELDS
+        if update_fields is None or field in update_fields
+    ]
+    if instance._state.adding or not fields:
+        return False
+    previous = User.objects.filter(pk=instance.pk).values(*fields).first()
+    return previous is None or any(
+        previous[field] != getattr(instance, field) for field in fields
+    )
+
+
+@receiver(pre_save, sender=User)
+def snapshot_user_security(
+    sender, instance: User, update_fields=None, **kwargs
+):
+    instance._security_changed = security_fields_changed(
+        instance, update_fields
+    )
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_tokens(sender, instance: User, **kwargs):
+    if not instance.__dict__.pop('_security_changed', False):
+        return
+    revoke_user_signed_tokens(instance.pk)
+    for key in Token.objects.filter(user=instance).values_list('key', flat=True):
+        invalidate_credentials(key)
+
+
+@receiver(post_delete, sender=User)
+def revoke_deleted_user_tokens(sender, instance: User, **kwargs):
+    revoke_user_signed_tokens(instance.pk)
@@ -1 +1,18 @@
 from board.tests.test_views import *
+from board.tests.test_serializers import *
+from board.tests.test_importers import *
+from to_do_list_api.tests.test_authentications import *
+from to_do_list_api.tests.test_tokens import *
+from board.tests.test_async_views import *
+from to_do_list_api.tests.test_messages import *
+from board.tests.test_validators import *
+from board.tests.test_indexes import *
+from board.tests.test_search import *
+from board.tests.test_changes import *
+from to_do_list_api.tests.test_renderers import *
+from board.tests.test_bulk import *
+from to_do_list_api.tests.test_schema import *
+from to_do_list_api.tests.test_routers import *
+from board.tests.test_shards import *
+from board.tests.test_cache import *
+from board.tests.test_batch import *
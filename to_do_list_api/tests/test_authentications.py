@@ -0,0 +1,88 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth.models import User
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
+
+from to_do_list_api.authentications import (
+    CachedBearerAuthentication,
+    credentials_cache_key,
+    local_credentials_cache,
+)
+
+
+class CachedBearerAuthenticationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = APIRequestFactory()
+        cls.authentication = CachedBearerAuthentication()
+
+    def setUp(self):
+        local_credentials_cache.clear()
+        self.user = User.objects.create(username='cached_auth_user')
+        self.token = Token.objects.create(user=self.user)
+
+    def authenticate(self):
+        request = self.factory.get(
+            '/api/board', HTTP_AUTHORIZATION=f'Bearer {self.token.key}'
+        )
+        return self.authentication.authenticate(request)
+
+    def test_authenticate_cached(self):
+        """ When authenticate the same token twice \
+        Then the second authentication does not query the database \
+        """
+
+        user, token = self.authenticate()
+        with self.assertNumQueries(0):
+            cached_user, cached_token = self.authenticate()
+
+        self.assertEqual(user, cached_user)
+        self.assertEqual(token, cached_token)
+
+    def test_authenticate_caches_no_password(self):
+        """ When authenticate a token of a user with a password \
+        Then the shared cache does not hold the password hash \
+        """
+
+        self.user.set_password('cached_auth_password')
+        self.user.save()
+        self.authenticate()
+
+        credentials = cache.get(credentials_cache_key(self.token.key))
+        self.assertEqual(self.user.pk, credentials.user_id)
+        self.assertNotIn(self.user.password, repr(vars(credentials)))
+
+    def test_authenticate_shared_cache(self):
+        """ When the token is not in the local cache but is in the shared one \
+        Then the authentication does not query the database \
+        """
+
+        self.authenticate()
+        local_credentials_cache.clear()
+
+        with self.assertNumQueries(0):
+            user, _ = self.authenticate()
+        self.assertEqual(self.user, user)
+
+    def test_authenticate_deactivated_user(self):
+        """ When the user of a cached token is deactivated \
+        Then the token is no longer accepted \
+        """
+
+        self.authenticate()
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertRaises(AuthenticationFailed, self.authenticate)
+
+    def test_authenticate_deleted_token(self):
+        """ When a cached token is deleted \
+        Then the token is no longer accepted \
+        """
+
+        self.authenticate()
+        self.token.delete()
+
+        self.assertRaises(AuthenticationFailed, self.authenticate)
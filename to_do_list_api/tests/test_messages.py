@@ -0,0 +1,56 @@
+import json
+
+from django.test import SimpleTestCase
+
+from to_do_list_api.exceptions import BaseException
+from to_do_list_api.messages import ErrorMessage
+from board.messages import (
+    TASK_INSERT_RETURN,
+    BULK_TASK_INSERT_RETURN,
+    TASK_UPDATE_RETURN,
+    BULK_TASK_UPDATE_RETURN,
+    TASK_CANCEL_RETURN,
+    BULK_TASK_CANCEL_RETURN,
+    TaskInsertDataReturnMessage,
+    BulkTaskInsertDataReturnMessage,
+    TaskUpdateDataReturnMessage,
+    BulkTaskUpdateDataReturnMessage,
+    TaskCancelDataReturnMessage,
+    BulkTaskCancelDataReturnMessage,
+)
+
+
+class ConstantMessagesTest(SimpleTestCase):
+    def test_constant_messages(self):
+        """ When use the precomputed return messages \
+        Then they have the same body of the serialized messages \
+        """
+
+        constant_messages = [
+            (TASK_INSERT_RETURN, TaskInsertDataReturnMessage()),
+            (BULK_TASK_INSERT_RETURN, BulkTaskInsertDataReturnMessage()),
+            (TASK_UPDATE_RETURN, TaskUpdateDataReturnMessage()),
+            (BULK_TASK_UPDATE_RETURN, BulkTaskUpdateDataReturnMessage()),
+            (TASK_CANCEL_RETURN, TaskCancelDataReturnMessage()),
+            (BULK_TASK_CANCEL_RETURN, BulkTaskCancelDataReturnMessage()),
+        ]
+
+        for constant_message, message in constant_messages:
+            self.assertEqual(json.loads(message.to_json()), constant_message)
+            with self.assertRaises(TypeError):
+                constant_message['type'] = 'Changed'
+
+    def test_error_message(self):
+        """ When build the message of an exception \
+        Then it has the same body and key order of ErrorMessage \
+        """
+
+        expected_message = json.loads(
+            ErrorMessage(description='Something failed', type='BaseError')
+            .to_json()
+        )
+
+        message = BaseException('Something failed', exc_info=False).message
+
+        self.assertEqual(expected_message, message)
+        self.assertEqual(list(expected_message.keys()), list(message.keys()))
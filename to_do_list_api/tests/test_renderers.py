@@ -0,0 +1,178 @@
+import io
+import json
+import uuid
+from datetime import datetime, timezone
+
+import msgpack
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.contrib.auth.models import User
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import ParseError
+from rest_framework.test import APIClient
+from rest_framework.utils.encoders import JSONEncoder
+
+from board.cache import local_board_cache
+from board.messages import TASK_INSERT_RETURN
+from board.models import Task
+from board.serializers import UserTasksSerializer
+from to_do_list_api.parsers import MessagePackParser, ORJSONParser
+from to_do_list_api.renderers import MessagePackRenderer, ORJSONRenderer
+
+payload = {
+    "id": uuid.UUID('0d015c25-47bd-4200-a8dc-9cb150b321ba'),
+    "createdAt": datetime(2023, 12, 14, 8, 35, 14, 579343, timezone.utc),
+    "message": TASK_INSERT_RETURN,
+    "titles": ("Organizar os livros", "Regar as plantas"),
+}
+
+
+class RenderersTest(SimpleTestCase):
+    def test_orjson_renderer(self):
+        """ When render UUIDs, datetimes and read only mappings to JSON \
+        Then returns the same body of the REST framework encoder \
+        """
+
+        expected_data = json.loads(json.dumps(payload, cls=JSONEncoder))
+
+        data = json.loads(ORJSONRenderer().render(payload))
+
+        self.assertEqual(expected_data, data)
+
+    def test_msgpack_round_trip(self):
+        """ When render a payload to MessagePack and parse it back \
+        Then datetimes are kept as timestamps and UUIDs as strings \
+        """
+
+        content = MessagePackRenderer().render(payload)
+        data = MessagePackParser().parse(io.BytesIO(content))
+
+        self.assertEqual(str(payload["id"]), data["id"])
+        self.assertEqual(payload["createdAt"], data["createdAt"])
+        self.assertEqual(dict(TASK_INSERT_RETURN), data["message"])
+        self.assertEqual(list(payload["titles"]), data["titles"])
+
+    def test_parse_errors(self):
+        """ When parse a malformed body \
+        Then raises the REST framework ParseError \
+        """
+
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"title": '))
+        with self.assertRaises(ParseError):
+            MessagePackParser().parse(io.BytesIO(b'\x93\x01'))
+
+
+class ContentNegotiationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='negotiation_user')
+        cls.token = Token.objects.create(user=cls.user)
+
+    def setUp(self):
+        cache.clear()
+        local_board_cache.clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token.key}')
+
+    def test_post_and_get_msgpack(self):
+        """ When post a task and get the board in MessagePack \
+        Then the task is created and returned in MessagePack \
+        """
+
+        response = self.client.post(
+            '/api/board',
+            msgpack.packb({"title": "Enviar em MessagePack"}),
+            content_type='application/msgpack',
+            HTTP_ACCEPT='application/msgpack',
+        )
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            dict(TASK_INSERT_RETURN), msgpack.unpackb(response.content)
+        )
+
+        response = self.client.get(
+            '/api/board', HTTP_ACCEPT='application/msgpack'
+        )
+
+        self.assertEqual('application/msgpack', response['Content-Type'])
+        board = msgpack.unpackb(response.content)
+        self.assertEqual(
+            str(Task.objects.get(user=self.user).id), board[0]['id']
+        )
+
+    def test_get_json_by_default(self):
+        """ When get the board without an Accept header \
+        Then returns it in JSON \
+        """
+
+        response = self.client.get('/api/board')
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('application/json', response['Content-Type'])
+        self.assertEqual([], response.json())
+
+    def test_etag_per_media_type(self):
+        """ When get the board in JSON and then revalidate it in MessagePack \
+        Then the MessagePack body is returned with its own ETag \
+        """
+
+        response = self.client.get('/api/board')
+        etag = response['ETag']
+
+        response = self.client.get(
+            '/api/board',
+            HTTP_ACCEPT='application/msgpack',
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('application/msgpack', response['Content-Type'])
+        self.assertNotEqual(etag, response['ETag'])
+        self.assertEqual([], msgpack.unpackb(response.content))
+
+        response = self.client.get(
+            '/api/board',
+            HTTP_ACCEPT='application/msgpack',
+            HTTP_IF_NONE_MATCH=response['ETag'],
+        )
+
+        self.assertEqual(304, response.status_code)
+
+    def test_board_native_values(self):
+        """ When get the board in JSON and in MessagePack \
+        Then the JSON body matches UserTasksSerializer and MessagePack packs \
+        the creation date as a Timestamp \
+        """
+
+        task = Task.objects.create(user=self.user, title='Regar as plantas')
+
+        response = self.client.get('/api/board')
+
+        self.assertEqual(
+            [dict(UserTasksSerializer(task).data)], response.json()
+        )
+
+        response = self.client.get(
+            '/api/board', HTTP_ACCEPT='application/msgpack'
+        )
+
+        board = msgpack.unpackb(response.content, timestamp=3)
+        self.assertEqual(str(task.id), board[0]['id'])
+        self.assertEqual(task.created_at, board[0]['createdAt'])
+
+    def test_stream_msgpack_not_acceptable(self):
+        """ When get the board in stream mode in MessagePack \
+        Then returns not acceptable, the stream is only written in JSON \
+        """
+
+        response = self.client.get(
+            '/api/board?stream=1', HTTP_ACCEPT='application/msgpack'
+        )
+
+        self.assertEqual(406, response.status_code)
+        self.assertEqual(
+            'StreamNotAcceptableError',
+            msgpack.unpackb(response.content)['type'],
+        )
@@ -0,0 +1,154 @@
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.http import HttpRequest
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from board.cache import get_board_version, invalidate_board
+from board.models import Task
+from board.views import BoardManager
+from to_do_list_api.routers import (
+    ReplicaRouter,
+    choose_read_database,
+    pinned_key,
+    read_database,
+    read_from_replica,
+    replica_reads,
+    use_read_database,
+)
+
+# The replica database is only configured by to_do_list_api.settings.replicas
+REPLICA_CONFIGURED = 'replica' in settings.DATABASES
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRouterTest(SimpleTestCase):
+    def setUp(self):
+        self.router = ReplicaRouter()
+        cache.delete(pinned_key(1))
+
+    def test_reads_from_primary_by_default(self):
+        """ When reads outside of a view decorated with replica_reads \
+        Then reads from the primary \
+        """
+
+        self.assertEqual('default', self.router.db_for_read(Task))
+
+    def test_reads_from_chosen_database(self):
+        """ When reads inside of a view decorated with replica_reads \
+        Then reads from the replica and still writes to the primary \
+        """
+
+        with use_read_database(choose_read_database(1, pinned=False)):
+            self.assertEqual('replica', self.router.db_for_read(Task))
+            self.assertEqual('default', self.router.db_for_write(Task))
+
+        self.assertEqual('default', self.router.db_for_read(Task))
+
+    def test_pinned_user_reads_from_primary(self):
+        """ When the user wrote within the read-your-writes window \
+        Then their reads are pinned to the primary \
+        """
+
+        invalidate_board(1)
+
+        self.assertTrue(cache.get(pinned_key(1)))
+        self.assertEqual('default', choose_read_database(1, pinned=True))
+
+    def test_write_before_version_read(self):
+        """ When the user writes after the view starts but before the board \
+        version is read \
+        Then the rest of the view reads from the primary \
+        """
+
+        @replica_reads
+        def view(test, request):
+            self.assertEqual('default', self.router.db_for_read(Task))
+            invalidate_board(1)
+            get_board_version(1)
+            read_from_replica(1)
+            return self.router.db_for_read(Task)
+
+        self.assertEqual('default', view(self, None))
+        self.assertIsNone(read_database.get())
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_without_replicas(self):
+        """ When there are no replicas configured \
+        Then reads from the primary and does not pin the writers \
+        """
+
+        invalidate_board(1)
+
+        self.assertIsNone(cache.get(pinned_key(1)))
+        self.assertEqual('default', choose_read_database(1, pinned=False))
+
+
+@skipUnless(
+    REPLICA_CONFIGURED,
+    'needs the two SQLite databases of to_do_list_api.settings.replicas',
+)
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReadYourWritesTest(TestCase):
+    databases = {'default', 'replica'} if REPLICA_CONFIGURED else {'default'}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.view = BoardManager()
+        cls.user = User.objects.create(username='user', id=1)
+        User.objects.using('replica').create(username='user', id=1)
+        Task.objects.create(user=cls.user, title='Regar as plantas')
+
+    def setUp(self):
+        self.request = HttpRequest()
+        self.request.user = self.user
+        cache.clear()
+
+    def test_get_reads_from_replica(self):
+        """ When the user did not write within the read-your-writes window \
+        Then the board is read from the replica, which lags behind \
+        """
+
+        response = self.view.get(self.request)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual([], response.data)
+
+    def test_get_after_write_reads_from_primary(self):
+        """ When the user gets the board right after a write \
+        Then the board is read from the primary and has the new task \
+        """
+
+        self.request.data = {"title": "Organizar os livros"}
+        self.view.post(self.request)
+
+        response = self.view.get(self.request)
+
+        self.assertEqual(
+            ['Regar as plantas', 'Organizar os livros'],
+            [task['title'] for task in response.data],
+        )
+
+    def test_get_with_write_before_version_read(self):
+        """ When the user writes between the start of the get and the read \
+        of the board version \
+        Then the board of the new version is read from the primary \
+        """
+
+        def write_then_get_board_version(user_id):
+            Task.objects.create(user=self.user, title='Organizar os livros')
+            invalidate_board(user_id)
+            return get_board_version(user_id)
+
+        with mock.patch(
+            'board.views.get_board_version',
+            side_effect=write_then_get_board_version,
+        ):
+            response = self.view.get(self.request)
+
+        self.assertEqual(
+            ['Regar as plantas', 'Organizar os livros'],
+            [task['title'] for task in response.data],
+        )
@@ -0,0 +1,71 @@
+import os
+import tempfile
+
+import orjson
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APIClient
+
+from to_do_list_api.schema import load_prebuilt_schema, read_schema_file
+
+prebuilt_schema = {
+    "openapi": "3.0.3",
+    "info": {"title": "Prebuilt", "version": "1.0.0"},
+    "paths": {},
+}
+
+
+class PrebuiltSchemaTest(SimpleTestCase):
+    def setUp(self):
+        read_schema_file.cache_clear()
+        self.addCleanup(read_schema_file.cache_clear)
+        self.client = APIClient()
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.schema_file = os.path.join(directory.name, "openapi.json")
+
+    def write_schema(self):
+        with open(self.schema_file, "wb") as schema_file:
+            schema_file.write(orjson.dumps(prebuilt_schema))
+
+    def test_serves_prebuilt_schema(self):
+        """ When the OpenAPI document was generated at build time \
+        Then serves it as is instead of generating the schema \
+        """
+
+        self.write_schema()
+
+        with override_settings(OPENAPI_SCHEMA_FILE=self.schema_file):
+            response = self.client.get(
+                "/api/schema/", HTTP_ACCEPT="application/vnd.oai.openapi+json"
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(orjson.loads(response.content), prebuilt_schema)
+
+    def test_prebuilt_schema_is_read_once(self):
+        """ When the prebuilt schema is loaded again after the file changed \
+        Then returns the document read the first time \
+        """
+
+        self.write_schema()
+
+        with override_settings(OPENAPI_SCHEMA_FILE=self.schema_file):
+            first = load_prebuilt_schema()
+            os.remove(self.schema_file)
+            second = load_prebuilt_schema()
+
+        self.assertIs(first, second)
+
+    def test_generates_schema_without_prebuilt_file(self):
+        """ When the prebuilt schema file is missing \
+        Then generates the schema from the views \
+        """
+
+        with override_settings(OPENAPI_SCHEMA_FILE=self.schema_file):
+            response = self.client.get(
+                "/api/schema/", HTTP_ACCEPT="application/vnd.oai.openapi+json"
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("/api/board", orjson.loads(response.content)["paths"])
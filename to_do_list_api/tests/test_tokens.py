@@ -0,0 +1,166 @@
+import time
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIClient, APIRequestFactory
+
+from to_do_list_api.authentications import SignedBearerAuthentication
+from to_do_list_api.tokens import (
+    SIGNED_TOKEN_MAX_AGE,
+    SignedTokenClaims,
+    issue_signed_token,
+    revoke_signed_token,
+)
+
+
+class SignedBearerAuthenticationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = APIRequestFactory()
+        cls.authentication = SignedBearerAuthentication()
+
+    def setUp(self):
+        self.user = User.objects.create(username='signed_token_user')
+
+    def authenticate(self, token: str):
+        request = self.factory.get(
+            '/api/board', HTTP_AUTHORIZATION=f'Bearer {token}'
+        )
+        return self.authentication.authenticate(request)
+
+    def test_authenticate_signed_token(self):
+        """ When authenticate with a signed token \
+        Then the user is resolved from the token without database queries \
+        """
+
+        token = issue_signed_token(self.user)
+
+        with self.assertNumQueries(0):
+            user, claims = self.authenticate(token)
+
+        self.assertIsInstance(claims, SignedTokenClaims)
+        self.assertEqual(self.user.pk, user.pk)
+        self.assertEqual(self.user.username, user.username)
+        self.assertTrue(user.is_authenticated)
+
+    def test_authenticate_database_token(self):
+        """ When authenticate with a database stored token \
+        Then the token is still accepted \
+        """
+
+        token = Token.objects.create(user=self.user)
+
+        user, auth = self.authenticate(token.key)
+
+        self.assertEqual(self.user, user)
+        self.assertEqual(token, auth)
+
+    def test_authenticate_tampered_token(self):
+        """ When authenticate with a signed token that was modified \
+        Then the token is not accepted \
+        """
+
+        token = issue_signed_token(self.user)
+
+        self.assertRaises(AuthenticationFailed, self.authenticate, token + 'a')
+
+    def test_authenticate_expired_token(self):
+        """ When authenticate with a signed token older than its max age \
+        Then the token is not accepted \
+        """
+
+        token = issue_signed_token(self.user)
+        expired_at = time.time() + SIGNED_TOKEN_MAX_AGE + 1
+
+        with mock.patch('time.time', return_value=expired_at):
+            self.assertRaises(AuthenticationFailed, self.authenticate, token)
+
+    def test_authenticate_rotated_key(self):
+        """ When the signing key is rotated \
+        Then the tokens signed with the previous key are still accepted \
+        """
+
+        with override_settings(SIGNED_TOKEN_KEY='previous-key'):
+            token = issue_signed_token(self.user)
+
+        with override_settings(
+            SIGNED_TOKEN_KEY='current-key',
+            SIGNED_TOKEN_KEY_FALLBACKS=['previous-key'],
+        ):
+            user, _ = self.authenticate(token)
+        self.assertEqual(self.user.pk, user.pk)
+
+        with override_settings(
+            SIGNED_TOKEN_KEY='current-key', SIGNED_TOKEN_KEY_FALLBACKS=[]
+        ):
+            self.assertRaises(AuthenticationFailed, self.authenticate, token)
+
+    def test_authenticate_revoked_token(self):
+        """ When a signed token is revoked \
+        Then only that token is no longer accepted \
+        """
+
+        token = issue_signed_token(self.user)
+        another_token = issue_signed_token(self.user)
+        _, claims = self.authenticate(token)
+
+        revoke_signed_token(claims)
+
+        self.assertRaises(AuthenticationFailed, self.authenticate, token)
+        user, _ = self.authenticate(another_token)
+        self.assertEqual(self.user.pk, user.pk)
+
+    def test_authenticate_deactivated_user(self):
+        """ When the user of a signed token is deactivated \
+        Then the tokens issued before are no longer accepted \
+        """
+
+        token = issue_signed_token(self.user)
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertRaises(AuthenticationFailed, self.authenticate, token)
+
+    def test_profile_edit_keeps_tokens(self):
+        """ When the user only edits their profile \
+        Then the tokens issued before are still accepted \
+        """
+
+        token = issue_signed_token(self.user)
+        self.user.first_name = 'Maria'
+        self.user.email = 'maria@example.com'
+        self.user.save()
+
+        user, _ = self.authenticate(token)
+        self.assertEqual(self.user.pk, user.pk)
+
+    def test_password_change_revokes_tokens(self):
+        """ When the user changes their password \
+        Then the tokens issued before are no longer accepted \
+        """
+
+        token = issue_signed_token(self.user)
+        self.user.set_password('nova-senha')
+        self.user.save(update_fields=['password'])
+
+        self.assertRaises(AuthenticationFailed, self.authenticate, token)
+
+    def test_deleted_user_token(self):
+        """ When the user of a signed token is deleted \
+        Then the requests with the tokens issued before are unauthorized \
+        """
+
+        token = issue_signed_token(self.user)
+        self.user.delete()
+
+        response = APIClient().post(
+            '/api/board',
+            {"title": "Tarefa sem dono"},
+            format='json',
+            HTTP_AUTHORIZATION=f'Bearer {token}',
+        )
+
+        self.assertEqual(401, response.status_code)
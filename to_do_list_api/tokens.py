@@ -0,0 +1,134 @@
+import time
+import uuid
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core import signing
+from django.core.cache import cache
+
+SIGNED_TOKEN_PREFIX = 'st.'
+SIGNED_TOKEN_SALT = 'to_do_list_api.tokens.signed'
+SIGNED_TOKEN_MAX_AGE = getattr(settings, 'SIGNED_TOKEN_MAX_AGE', 60 * 60)
+
+
+@dataclass
+class SignedTokenClaims:
+    token_id: str
+    user_id: int
+    username: str
+    is_staff: bool
+    is_superuser: bool
+    issued_at: int
+
+    @property
+    def expires_in(self) -> int:
+        elapsed = int(time.time()) - self.issued_at // 1000
+        return max(SIGNED_TOKEN_MAX_AGE - elapsed, 1)
+
+    def build_user(self) -> User:
+        return build_deferred_user({
+            'id': self.user_id,
+            'username': self.username,
+            'is_active': True,
+            'is_staff': self.is_staff,
+            'is_superuser': self.is_superuser,
+        })
+
+
+def build_deferred_user(values: dict) -> User:
+    """ Builds the user from the values without querying the database, any \
+    other field is loaded on access as a deferred field \
+    """
+
+    field_names = [
+        field.attname for field in User._meta.concrete_fields
+        if field.attname in values
+    ]
+    return User.from_db(
+        None, field_names, [values[name] for name in field_names]
+    )
+
+
+def get_signing_key() -> str:
+    return getattr(settings, 'SIGNED_TOKEN_KEY', None) or settings.SECRET_KEY
+
+
+def get_signing_fallback_keys() -> list:
+    return (getattr(settings, 'SIGNED_TOKEN_KEY_FALLBACKS', None)
+            or settings.SECRET_KEY_FALLBACKS)
+
+
+def is_signed_token(token: str) -> bool:
+    return token.startswith(SIGNED_TOKEN_PREFIX)
+
+
+def issue_signed_token(user: User) -> str:
+    payload = {
+        'j': uuid.uuid4().hex,
+        'u': user.pk,
+        'n': user.get_username(),
+        's': user.is_staff,
+        'a': user.is_superuser,
+        't': int(time.time() * 1000),
+    }
+    return SIGNED_TOKEN_PREFIX + signing.dumps(
+        payload, key=get_signing_key(), salt=SIGNED_TOKEN_SALT, compress=True
+    )
+
+
+def verify_signed_token(token: str) -> SignedTokenClaims:
+    """ Checks the signature and the age of the token with the current key \
+    and the fallback ones. Raises signing.BadSignature (or its subclass \
+    SignatureExpired) when the token is not valid \
+    """
+
+    payload = signing.loads(
+        token[len(SIGNED_TOKEN_PREFIX):],
+        key=get_signing_key(),
+        fallback_keys=get_signing_fallback_keys(),
+        salt=SIGNED_TOKEN_SALT,
+        max_age=SIGNED_TOKEN_MAX_AGE,
+    )
+    return SignedTokenClaims(
+        token_id=payload['j'],
+        user_id=payload['u'],
+        username=payload['n'],
+        is_staff=payload['s'],
+        is_superuser=payload['a'],
+        issued_at=payload['t'],
+    )
+
+
+def revoked_token_key(token_id: str) -> str:
+    return f'auth:signed:revoked:token:{token_id}'
+
+
+def revoked_user_key(user_id: int) -> str:
+    return f'auth:signed:revoked:user:{user_id}'
+
+
+def revoke_signed_token(claims: SignedTokenClaims) -> None:
+    cache.set(revoked_token_key(claims.token_id), True, claims.expires_in)
+
+
+def revoke_user_signed_tokens(user_id: int) -> None:
+    """ Revokes every token of the user issued until now, the entry lives \
+    only while those tokens could still be valid \
+    """
+
+    cache.set(
+        revoked_user_key(user_id),
+        int(time.time() * 1000),
+        SIGNED_TOKEN_MAX_AGE,
+    )
+
+
+def is_signed_token_revoked(claims: SignedTokenClaims) -> bool:
+    token_key = revoked_token_key(claims.token_id)
+    user_key = revoked_user_key(claims.user_id)
+    revoked = cache.get_many([token_key, user_key])
+    if revoked.get(token_key):
+        return True
+    revoked_at = revoked.get(user_key)
+    return revoked_at is not None and claims.issued_at <= revoked_at
@@ -1,15 +1,22 @@
 from django.contrib import admin
 from django.urls import path, include
 from rest_framework.authtoken.views import obtain_auth_token
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+from drf_spectacular.views import SpectacularSwaggerView
 
-from .views import UserCreate
+from .schema import PrebuiltSpectacularAPIView
+from .views import UserCreate, ObtainSignedAuthToken, RevokeAuthToken
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("account/register", UserCreate.as_view(), name="Register"),
     path("account/auth", obtain_auth_token, name="Authenticate"),
+    path(
+        "account/auth/signed",
+        ObtainSignedAuthToken.as_view(),
+        name="Authenticate Signed",
+    ),
+    path("account/auth/revoke", RevokeAuthToken.as_view(), name="Revoke"),
     path("api/board", include("board.urls")),
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
+    path('api/schema/', PrebuiltSpectacularAPIView.as_view(), name='schema'),
     path('api/schema/swagger-ui/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
 ]
\ No newline at end of file
@@ -1,9 +1,42 @@
 from .serializers import User, UserSerializer
-from rest_framework import generics
-from rest_framework.permissions import AllowAny
+from rest_framework import generics, status
+from rest_framework.authtoken.models import Token
+from rest_framework.authtoken.views import ObtainAuthToken
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .tokens import (
+    SIGNED_TOKEN_MAX_AGE,
+    SignedTokenClaims,
+    issue_signed_token,
+    revoke_signed_token,
+)
 
 
 class UserCreate(generics.CreateAPIView):
     queryset = User.objects.all()
     serializer_class = UserSerializer
-    permission_classes = (AllowAny,)
\ No newline at end of file
+    permission_classes = (AllowAny,)
+
+
+class ObtainSignedAuthToken(ObtainAuthToken):
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        user = serializer.validated_data['user']
+        return Response({
+            'token': issue_signed_token(user),
+            'expiresIn': SIGNED_TOKEN_MAX_AGE,
+        })
+
+
+class RevokeAuthToken(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    def post(self, request, *args, **kwargs):
+        if isinstance(request.auth, SignedTokenClaims):
+            revoke_signed_token(request.auth)
+        elif isinstance(request.auth, Token):
+            request.auth.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)